@@ -8,16 +8,11 @@ import os
 import sys
 import logging
 import threading
-import time
-import signal
-import subprocess
-import psutil
 
 # Add the modules directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'modules'))
 
-# Import modular components
-from modules.tui_interface import KubernetesCRDTUI
+# Import modular components (the urwid TUI is imported in main(), only when it runs)
 from modules.service_managers import ServiceManager
 from modules.utils.logging_config import setup_logging
 from modules.utils.k8s_client import load_kube_config
@@ -29,9 +24,6 @@ def run_kopf_operator():
     """Run the Kopf operator in a separate thread"""
     try:
         # Config already loaded in main(), no need to reload
-        # --- External variable parsing and override logic ---
-        from modules.utils.var_helpers import get_var, EXTRA_VARS
-
         logger = logging.getLogger(__name__)
         logger.info("[OPERATOR] Starting Kopf operator thread...")
         print("[OPERATOR] Kopf operator thread starting...")
@@ -67,8 +59,10 @@ def main():
     """Main entry point"""
     global tui_app
     
+    operator_only = '--operator-only' in sys.argv
+    
     # Set up logging system
-    setup_logging()
+    setup_logging(operator_only)
     logger = logging.getLogger(__name__)
     
     logger.info("=== Intent Based Services Management System Starting ===")
@@ -81,7 +75,7 @@ def main():
         service_manager = ServiceManager()
 
         # If running as operator only, just run operator and log to console
-        if '--operator-only' in sys.argv:
+        if operator_only:
             run_kopf_operator()
             return
 
@@ -91,6 +85,7 @@ def main():
 
 
         # Create TUI application
+        from modules.tui_interface import KubernetesCRDTUI
         tui_app = KubernetesCRDTUI(service_manager)
 
         # Start TUI only (Kopf operator must be run as a separate process)
@@ -3,7 +3,6 @@ Service Manager - Manages different types of Windows services
 """
 
 import os
-import yaml
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -11,12 +10,20 @@ from kubernetes import client
 from kubernetes.client.rest import ApiException
 
 from .utils.k8s_client import get_k8s_client, get_vm_status
+from .utils.manifests import load_manifest, scan_yaml_mtimes
 
 logger = logging.getLogger(__name__)
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
 
+def _local_cr_files(folder):
+    """Return (name, path, mtime_ns) of the YAML files in folder that are not CRDs"""
+    # mtime_ns keys the shared parse cache, so unchanged files are not re-read
+    return [(name, os.path.join(folder, name), mtime_ns)
+            for name, mtime_ns in scan_yaml_mtimes(folder).items() if 'crd' not in name.lower()]
+
+
 class ServiceManager:
     """Manages WindowsVM, MSSQLServer, and OTelCollector resources"""
     
@@ -106,41 +113,39 @@ class ServiceManager:
             # 1. Scan local CR files
             namespaces = set()
             if os.path.exists(self.manifest_dir):
-                for file in os.listdir(self.manifest_dir):
-                    # Consider any YAML that is not clearly a CRD; verify by kind below
-                    if file.endswith('.yaml') and 'crd' not in file.lower():
-                        file_path = os.path.join(self.manifest_dir, file)
-                        try:
-                            with open(file_path, 'r') as f:
-                                cr_data = yaml.safe_load(f)
-                                if cr_data and cr_data.get('kind') == resource_def['kind']:
-                                    name = cr_data['metadata']['name']
-                                    ns = cr_data['metadata'].get('namespace', 'default')
-                                    namespaces.add(ns)
-                                    local_cr_data = {
-                                        'file': file,
-                                        'namespace': ns
-                                    }
-                                    if service_type == 'windowsvm':
-                                        local_cr_data.update({
-                                            'vm_name': cr_data['spec'].get('vmName', name),
-                                            'action': cr_data['spec'].get('action', 'unknown')
-                                        })
-                                    elif service_type == 'mssqlserver':
-                                        local_cr_data.update({
-                                            'target_vm': cr_data['spec']['targetVM']['vmName'],
-                                            'version': cr_data['spec'].get('version', 'unknown'),
-                                            'enabled': cr_data['spec'].get('enabled', True)
-                                        })
-                                    elif service_type == 'otelcollector':
-                                        local_cr_data.update({
-                                            'target_vm': cr_data['spec']['targetVM']['vmName'],
-                                            'metrics_type': cr_data['spec'].get('metricsType', 'unknown'),
-                                            'enabled': cr_data['spec'].get('enabled', True)
-                                        })
-                                    status_report[resource_def['plural']]['local_crs'][name] = local_cr_data
-                        except Exception as e:
-                            logger.warning(f"Failed to parse CR file {file}: {e}")
+                # Consider any YAML that is not clearly a CRD; verify by kind below
+                for file, file_path, mtime_ns in _local_cr_files(self.manifest_dir):
+                    try:
+                        cr_data = load_manifest(file_path, mtime_ns)
+                        if cr_data and cr_data.get('kind') == resource_def['kind']:
+                            name = cr_data['metadata']['name']
+                            ns = cr_data['metadata'].get('namespace', 'default')
+                            namespaces.add(ns)
+                            local_cr_data = {
+                                'file': file,
+                                'file_path': file_path,
+                                'namespace': ns
+                            }
+                            if service_type == 'windowsvm':
+                                local_cr_data.update({
+                                    'vm_name': cr_data['spec'].get('vmName', name),
+                                    'action': cr_data['spec'].get('action', 'unknown')
+                                })
+                            elif service_type == 'mssqlserver':
+                                local_cr_data.update({
+                                    'target_vm': cr_data['spec']['targetVM']['vmName'],
+                                    'version': cr_data['spec'].get('version', 'unknown'),
+                                    'enabled': cr_data['spec'].get('enabled', True)
+                                })
+                            elif service_type == 'otelcollector':
+                                local_cr_data.update({
+                                    'target_vm': cr_data['spec']['targetVM']['vmName'],
+                                    'metrics_type': cr_data['spec'].get('metricsType', 'unknown'),
+                                    'enabled': cr_data['spec'].get('enabled', True)
+                                })
+                            status_report[resource_def['plural']]['local_crs'][name] = local_cr_data
+                    except Exception as e:
+                        logger.warning(f"Failed to parse CR file {file}: {e}")
 
             # Always include 'default' namespace in the set to ensure VMs/CRs in default are shown
             namespaces.add('default')
@@ -321,19 +326,16 @@ class ServiceManager:
         
         local_crs = []
         if os.path.exists(self.manifest_dir):
-            for file in os.listdir(self.manifest_dir):
-                if file.endswith('.yaml') and 'crd' not in file.lower():
-                    file_path = os.path.join(self.manifest_dir, file)
-                    try:
-                        with open(file_path, 'r') as f:
-                            cr_data = yaml.safe_load(f)
-                            if cr_data and cr_data.get('kind') == resource_def['kind']:
-                                local_crs.append({
-                                    'name': cr_data['metadata']['name'],
-                                    'file': file,
-                                    'data': cr_data
-                                })
-                    except Exception as e:
-                        logger.warning(f"Failed to parse CR file {file}: {e}")
+            for file, file_path, mtime_ns in _local_cr_files(self.manifest_dir):
+                try:
+                    cr_data = load_manifest(file_path, mtime_ns)
+                    if cr_data and cr_data.get('kind') == resource_def['kind']:
+                        local_crs.append({
+                            'name': cr_data['metadata']['name'],
+                            'file': file,
+                            'data': cr_data
+                        })
+                except Exception as e:
+                    logger.warning(f"Failed to parse CR file {file}: {e}")
         
         return local_crs
@@ -10,15 +10,24 @@ import queue
 import time
 from datetime import datetime
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 import os
 import subprocess
+import select
+import tempfile
 import json
-import yaml
+import re
 from pathlib import Path
 
 
 # Import canonical log_queue (no fallback, must be shared)
 from modules.utils.logging_config import log_queue
+from modules.utils.k8s_client import get_default_namespace, get_dynamic_client, get_dynamic_resource
+from modules.utils.manifests import (
+    cached_file_entries, cached_file_index, load_manifest, scan_file_names, scan_yaml_mtimes
+)
+from kubernetes.dynamic.exceptions import NotFoundError, ResourceNotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -26,16 +35,438 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 MANIFEST_DIR = REPO_ROOT / 'manifest-controller'
 KUBERNETES_DIR = REPO_ROOT / 'kubernetes'
 
+# Status icons shared by the CR listings (set env TUI_ASCII=1 for plain-ASCII markers)
+if os.getenv('TUI_ASCII', '0') == '1':
+    _ICONS = {'ok': '[x]', 'paused': '[-]', 'ready': '[+]', 'pending': '[~]', 'err': '[!]',
+              'failed': '[!]', 'warn': '[w]', 'unknown': '[?]', 'synced': '[=]', 'new': '[ ]'}
+else:
+    _ICONS = {'ok': '✅', 'paused': '⏸️', 'ready': '🟢', 'pending': '🟡', 'err': '🔴',
+              'failed': '❌', 'warn': '⚠️', 'unknown': '❓', 'synced': '🔄', 'new': '📝'}
+
+# Deployed CR phase -> status icon (anything else renders as failed)
+_PHASE_ICON = {'Ready': _ICONS['ready'], 'Pending': _ICONS['pending']}
+
+# Deployed CR phases the uninstall popup offers
+_UNINSTALLABLE_PHASES = frozenset({'Ready', 'Failed', 'Unknown'})
+
+# Deployed service phase -> (palette attribute, icon) for the status panel rows
+_PHASE_STYLE = {'Ready': ('status_running', _ICONS['ready']), 'Failed': ('status_stopped', _ICONS['err'])}
+_PHASE_STYLE_DEFAULT = ('status_unknown', _ICONS['pending'])
+
+# VM scenario -> (palette attribute, icon); the first entry whose markers all
+# appear in the scenario text wins
+_SCENARIO_STYLES = (
+    (('Running', 'Managed'), 'status_running', _ICONS['ok']),
+    (('Running', 'Orphaned'), 'status_unknown', _ICONS['warn']),
+    (('No Instance',), 'status_stopped', _ICONS['failed']),
+)
+_SCENARIO_STYLE_DEFAULT = ('status_unknown', _ICONS['unknown'])
+
+# Selection popup row status -> icon; the first marker found in the status wins
+_OPTION_STATUS_ICONS = (
+    ('Ready', _ICONS['ok']),
+    ('Already', _ICONS['synced']),
+    ('Deployed', _ICONS['synced']),
+    ('Unknown', _ICONS['err']),
+    ('Disabled', _ICONS['paused']),
+)
+_OPTION_STATUS_ICON_DEFAULT = _ICONS['new']
+
+# Service tab -> key of its section in get_comprehensive_status()
+_SERVICE_KEY_MAP = {'vms': 'windowsvms', 'mssql': 'mssqlservers', 'otel': 'otelcollectors'}
+
+# Numbered service menu choice -> (service tab, title), per action
+_SERVICE_CHOICES = {
+    '1': ('vms', 'Windows VMs'),
+    '2': ('mssql', 'MSSQL Servers'),
+    '3': ('otel', 'OpenTelemetry Collectors'),
+}
+_UNINSTALL_SERVICE_CHOICES = {
+    '1': ('vms', 'Virtual Machines'),
+    '2': ('mssql', 'MSSQL Services'),
+    '3': ('otel', 'OpenTelemetry Services'),
+}
+_DELETE_SERVICE_CHOICES = {
+    '1': ('vms', 'Windows VM CRs'),
+    '2': ('mssql', 'MSSQL CRs'),
+    '3': ('otel', 'OpenTelemetry CRs'),
+}
+
+
+def _service_popup_heights(count):
+    """Return (overlay height, listbox height) of a service popup with count rows"""
+    return count * 3 + 10, count * 3 + 2
+
+
+# Service popup sizes for the row counts of the numbered choice tables
+_SERVICE_POPUP_HEIGHTS = {
+    len(choices): _service_popup_heights(len(choices))
+    for choices in (_SERVICE_CHOICES, _UNINSTALL_SERVICE_CHOICES, _DELETE_SERVICE_CHOICES)
+}
+
+# Log panel prompts of the numbered method/service menus ({service}/{method} are filled in)
+_INSTALL_METHOD_BANNER = (
+    "",
+    "🔧 Choose Install Method for {service}:",
+    "1️⃣ kubectl apply - Direct Kubernetes deployment",
+    "2️⃣ Ansible Playbook - Automated provisioning",
+    "3️⃣ Manual CR Generation - Create files only",
+    "",
+    "Press 1-3 to select method...",
+)
+_UNINSTALL_METHOD_BANNER = (
+    "",
+    "🔧 Choose Uninstall Method for {service}:",
+    "1️⃣ kubectl delete - Remove from Kubernetes",
+    "2️⃣ Ansible Cleanup - Full resource cleanup",
+    "3️⃣ CR Update to 'uninstall' - Modify existing CR",
+    "",
+    "Press 1-3 to select method...",
+)
+_DELETE_METHOD_BANNER = (
+    "",
+    "🔧 Choose Delete Method for {service}:",
+    "1️⃣ kubectl delete - Remove from cluster",
+    "2️⃣ Graceful shutdown - Stop services first",
+    "3️⃣ Force delete - Immediate removal",
+    "",
+    "Press 1-3 to select method...",
+)
+_INSTALL_SERVICE_BANNER = (
+    "",
+    "Step 2: Select Service Type (Method: {method})",
+    "",
+    "Available Services:",
+    "1️⃣ Windows VMs - Virtual Machine deployment",
+    "2️⃣ MSSQL Servers - SQL Server instances",
+    "3️⃣ OpenTelemetry - Monitoring collectors",
+    "",
+    "Press 1-3 to select service type...",
+)
+_UNINSTALL_SERVICE_BANNER = (
+    "",
+    "Step 2: Select Service Type (Method: {method})",
+    "",
+    "Available Services:",
+    "1️⃣ Windows VMs - Running virtual machines",
+    "2️⃣ MSSQL Servers - Active SQL instances",
+    "3️⃣ OpenTelemetry - Running collectors",
+    "",
+    "Press 1-3 to select service type...",
+)
+
+# Fixed explanations printed by the method menus
+_ANSIBLE_INSTALL_NOTES = (
+    "🔧 Ansible Playbook Installation:",
+    "  • Full automated provisioning",
+    "  • Dependency management",
+    "  • Network configuration",
+    "  • Storage resources",
+)
+_ANSIBLE_CLEANUP_NOTES = (
+    "🔧 Ansible Cleanup Process:",
+    "  • Full resource cleanup",
+    "  • Dependency removal",
+    "  • Network cleanup",
+    "💡 Comprehensive cleanup via Ansible",
+)
+_CR_UPDATE_NOTES = (
+    "  • Modify local CRs to set action='uninstall'",
+    "  • Apply updated CRs to trigger uninstall",
+    "💡 Safer method that preserves configuration",
+)
+_GRACEFUL_DELETE_NOTES = (
+    "",
+    "🔄 Graceful shutdown will:",
+    "  • Stop running services cleanly",
+    "  • Wait for processes to terminate",
+    "  • Remove CRs after cleanup",
+)
+_FORCE_DELETE_NOTES = (
+    "",
+    "⚠️ Force delete will immediately remove CRs",
+    "   This may leave orphaned resources!",
+)
+
+# Upper bound (seconds) for kubectl calls made from the UI thread
+KUBECTL_TIMEOUT = 15
+PLAYBOOK_TIMEOUT = 600
+WATCH_TIMEOUT = 300  # seconds before a status watch is re-established with a fresh listing
+WATCH_BACKOFF_MAX = 60  # longest wait (seconds) between retries of a failing status watch
+KUBECTL_TIMED_OUT = 124  # returncode _run_kubectl/_run_playbook report for a call that hit its timeout
+STATUS_CACHE_TTL = 3.0  # seconds a get_comprehensive_status() report is reused by the menus
+
+# Field manager recorded for server-side applies issued by the TUI (API
+# client and the Apply CRs menu's kubectl alike)
+FIELD_MANAGER = 'tui-installer'
+
+# Verbose key-handling diagnostics (ENTER introspection, popup key and
+# selection traces) in the log panel (set env TUI_DEBUG_ENTER=1)
+_TUI_DEBUG_ENTER = os.getenv('TUI_DEBUG_ENTER', '0') == '1'
+
+# Route kubectl calls through a session kubectl proxy (set env TUI_KUBECTL_PROXY=1).
+# Off by default: the proxy serves the user's cluster credentials, unauthenticated,
+# to every local process. TUI_KUBECTL_PROXY_PORT picks its fixed port; kubectl
+# keys its discovery cache on host:port, so a stable port keeps that cache warm
+_TUI_KUBECTL_PROXY = os.getenv('TUI_KUBECTL_PROXY', '0') == '1'
+
+# Log line colouring: group 1 marks errors, group 2 warnings (case-insensitive, no upper() copies)
+_LOG_LEVEL_RE = re.compile(r'(ERROR|❌)|(WARN|⚠️)', re.IGNORECASE)
+# Substring probe run before _LOG_LEVEL_RE: lines containing none of these
+# (the usual info line) skip the regex scan entirely
+_LOG_LEVEL_HINTS = ('ERR', 'err', 'Err', 'WARN', 'warn', 'Warn', '❌', '⚠️')
+
+
+def _env_positive_int(name, default):
+    """Read a positive integer setting from the environment, warning and using default if it is invalid"""
+    raw = os.getenv(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        logger.warning(f"Ignoring {name}={raw!r}: expected a positive integer, using {default}")
+        return default
+    return value
+
+
+def _crd_served_kind(crd):
+    """Return the (group, kind) a CustomResourceDefinition object serves"""
+    return crd.spec.group, crd.spec.names.kind
+
+
+def _scenario_style(scenario):
+    """Return (palette attribute, icon) for a VM scenario description"""
+    for markers, color, icon in _SCENARIO_STYLES:
+        if all(marker in scenario for marker in markers):
+            return color, icon
+    return _SCENARIO_STYLE_DEFAULT
+
+
+@lru_cache(maxsize=64)
+def _option_status_icon(status):
+    """Return the popup row icon for a status label (labels repeat, so each is scanned once)"""
+    return next((icon for marker, icon in _OPTION_STATUS_ICONS if marker in status),
+                _OPTION_STATUS_ICON_DEFAULT)
+
+
+def _file_args(paths):
+    """Expand manifest paths into kubectl '-f <path>' arguments"""
+    return [arg for path in paths for arg in ('-f', path)]
+
+
+# Popup entry buttons. Enter/space closes the popup and runs the callback,
+# ESC cancels the whole menu. Defined once here rather than inside the
+# methods that build each popup.
+
+_ACTIVATE_KEYS = frozenset(('enter', ' '))
+_CANCEL_KEYS = frozenset(('esc', 'escape'))
+
+class UniversalMenuButton(urwid.Button):
+    """Manifest-file entry of show_universal_menu; calls callback(file_name, file_path)"""
+    def __init__(self, label, file_name, file_path, callback, tui_instance):
+        super().__init__(label)
+        self.file_name = file_name
+        self.file_path = file_path
+        self.callback = callback
+        self.tui = tui_instance
+
+    def keypress(self, size, key):
+        if key in _ACTIVATE_KEYS:
+            if _TUI_DEBUG_ENTER:
+                self.tui.add_log_line(f"🔥 UniversalMenuButton ENTER pressed for: {self.file_name}")
+            self.tui.close_popup()
+            self.callback(self.file_name, self.file_path)
+            return None
+        if key in _CANCEL_KEYS:
+            self.tui.add_log_line(f"🚪 UniversalMenuButton ESC pressed")
+            self.tui.close_popup()
+            self.tui.menu_state = None
+            self.tui.popup_listbox = None
+            self.tui.reset_menu_state()
+            return None
+        return super().keypress(size, key)
+
+
+class UniversalButton(urwid.Button):
+    """Entry of show_unified_selection_popup; tuple option data is unpacked into the callback"""
+    def __init__(self, label, option_data, callback, tui_instance):
+        super().__init__(label)
+        self.option_data = option_data  # Can be any data structure
+        self.callback = callback
+        self.tui = tui_instance
+
+    def keypress(self, size, key):
+        if key in _ACTIVATE_KEYS:
+            # option_data can hold whole CR dicts; only format it when debugging
+            if _TUI_DEBUG_ENTER:
+                self.tui.add_log_line(f"🔥 UniversalButton ENTER: {type(self.option_data)} = {self.option_data}")
+            self.tui.close_popup()
+            # Call callback with the stored option data
+            if isinstance(self.option_data, tuple):
+                # Unpack tuple data (for CR/CRD cases)
+                if _TUI_DEBUG_ENTER:
+                    self.tui.add_log_line(f"🔥 Calling callback with tuple: {self.option_data}")
+                self.callback(*self.option_data)
+            else:
+                # Single value (for service cases)
+                if _TUI_DEBUG_ENTER:
+                    self.tui.add_log_line(f"🔥 Calling callback with single value: {self.option_data}")
+                self.callback(self.option_data)
+            return None
+
+        if key in _CANCEL_KEYS:
+            self.tui.close_popup()
+            self.tui.menu_state = None
+            self.tui.popup_listbox = None
+            self.tui.reset_menu_state()
+            return None
+
+        return super().keypress(size, key)
+
+
+class ServiceButton(urwid.Button):
+    """Service entry of show_service_selection_popup; calls callback(option_key)"""
+    def __init__(self, label, option_key, callback, tui_instance):
+        super().__init__(label)
+        self.option_key = option_key
+        self.callback = callback
+        self.tui = tui_instance
+    def keypress(self, size, key):
+        if key in _ACTIVATE_KEYS:
+            self.tui.close_popup()
+            self.callback(self.option_key)
+            return
+        if key in _CANCEL_KEYS:
+            self.tui.close_popup()
+            self.tui.menu_state = None
+            self.tui.popup_listbox = None
+            self.tui.reset_menu_state()
+            return
+        return super().keypress(size, key)
+
+
+class _LazyListWalker(urwid.ListWalker):
+    """Popup row walker that builds each row widget the first time the ListBox asks for it
+    
+    Built rows more than _WINDOW positions from the focus are dropped when
+    the focus moves, so scrolling a long list keeps a bounded set of widgets.
+    """
+    _WINDOW = 64
+
+    def __init__(self, options, factory):
+        self._options = options
+        self._factory = factory  # option -> row widget
+        self._widgets = {}
+        self.focus = 0
+
+    def __len__(self):
+        return len(self._options)
+
+    def __getitem__(self, position):
+        widget = self._widgets.get(position)
+        if widget is None:
+            if not 0 <= position < len(self._options):
+                raise IndexError(position)
+            widget = self._widgets[position] = self._factory(self._options[position])
+        return widget
+
+    def next_position(self, position):
+        if position + 1 >= len(self._options):
+            raise IndexError(position)
+        return position + 1
+
+    def prev_position(self, position):
+        if position <= 0:
+            raise IndexError(position)
+        return position - 1
+
+    def positions(self, reverse=False):
+        # ListBox uses this for Home/End
+        return reversed(range(len(self))) if reverse else range(len(self))
+
+    def set_focus(self, position):
+        self.focus = position
+        if len(self._widgets) > 2 * self._WINDOW:
+            low, high = position - self._WINDOW, position + self._WINDOW
+            self._widgets = {pos: widget for pos, widget in self._widgets.items() if low <= pos <= high}
+        self._modified()
+
+
 class KubernetesCRDTUI:
     """Enhanced TUI interface with full functionality"""
     
+    # Key sets checked on every unhandled keypress
+    _SCROLL_KEYS = frozenset({'up', 'down', 'page up', 'page down'})
+    
+    # Numbered method menus: menu_state -> {key: (selected_method, log label)}
+    _METHOD_CHOICES = {
+        'install_method_selection': {
+            '1': ('kubectl', 'kubectl apply method'),
+            '2': ('ansible', 'Ansible Playbook method'),
+            '3': ('manual', 'Manual CR Generation'),
+        },
+        'uninstall_method_selection': {
+            '1': ('kubectl', 'kubectl delete method'),
+            '2': ('ansible', 'Ansible Cleanup method'),
+            '3': ('cr_update', 'CR Update method'),
+        },
+        'delete_method_selection': {
+            '1': ('kubectl', 'kubectl delete method'),
+            '2': ('graceful', 'Graceful shutdown'),
+            '3': ('force', 'Force delete'),
+        },
+    }
+    
+    # Lines the log window may grow past max_log_lines before it is trimmed
+    _LOG_TRIM_SLACK = 64
+    # log_queue entries taken per drain; a longer backlog is picked up right after
+    _LOG_DRAIN_MAX = 256
+    
+    # Enhanced color palette matching original (shared, immutable)
+    palette = (
+        ('header', 'white', 'dark blue'),
+        ('menu', 'black', 'light gray'),
+        ('menu_focus', 'white', 'dark red'),
+        ('log_info', 'light green', 'black'),
+        ('log_error', 'light red', 'black'),
+        ('log_warning', 'yellow', 'black'),
+        ('footer', 'white', 'dark blue'),
+        ('button', 'black', 'light gray'),
+        ('button_focus', 'white', 'dark red'),
+        ('status_running', 'light green', 'black'),
+        ('status_stopped', 'light red', 'black'),
+        ('status_unknown', 'yellow', 'black'),
+        ('cr_deployed', 'light cyan', 'black'),
+        ('cr_local', 'light magenta', 'black'),
+        ('cr_missing', 'dark gray', 'black'),
+        ('service_vm', 'light cyan', 'black'),
+        ('service_mssql', 'light blue', 'black'),
+        ('service_otel', 'light green', 'black'),
+    )
+    
+    # Service popup frames kept for reuse (see show_service_selection_popup)
+    _POPUP_SHELL_LIMIT = 8
+    
+    # Service name -> uninstall playbook in the kubernetes folder
+    _PLAYBOOK_MAP = {
+        'WindowsVM': 'k8s-redhat-kubernetes-uninstall-tasks.yaml',
+        'MSSQL': 'mssql-uninstall-tasks.yaml',
+        'OTel': 'otel-uninstall-tasks.yaml'
+    }
+    
     def __init__(self, service_manager):
         self.service_manager = service_manager
-        self.log_lines = []
-        self.max_log_lines = 500
-        self.status_data = {}
-        self.last_status_update = 0
+        self._pending_log = []  # Log lines waiting for the next _flush_logs
+        # Log panel scrollback (set env TUI_LOG_MAX_LINES to change it)
+        self.max_log_lines = _env_positive_int('TUI_LOG_MAX_LINES', 500)
         self.update_interval = 5
+        self._status_dirty = False  # A status rebuild has been requested
+        self._status_redraw_pending = False  # A _flush_status alarm is already scheduled
+        self._status_cache = None  # (time.monotonic() fetched, report) for _cached_status
+        self._phase_index = (None, {})  # (report, {service tab: [(name, cr_data, phase)]})
         self.auto_scroll = True
         self.active_service_tab = 'vms'  # vms, mssql, otel
         
@@ -46,40 +477,96 @@ class KubernetesCRDTUI:
         self.popup_listbox = None  # For popup navigation
         self.popup = None  # For popup management
         self.popup_callback = None  # For popup callbacks
-        
-        # Enhanced color palette matching original
-        self.palette = [
-            ('header', 'white', 'dark blue'),
-            ('menu', 'black', 'light gray'),
-            ('menu_focus', 'white', 'dark red'),
-            ('log_info', 'light green', 'black'),
-            ('log_error', 'light red', 'black'),
-            ('log_warning', 'yellow', 'black'),
-            ('footer', 'white', 'dark blue'),
-            ('button', 'black', 'light gray'),
-            ('button_focus', 'white', 'dark red'),
-            ('status_running', 'light green', 'black'),
-            ('status_stopped', 'light red', 'black'),
-            ('status_unknown', 'yellow', 'black'),
-            ('cr_deployed', 'light cyan', 'black'),
-            ('cr_local', 'light magenta', 'black'),
-            ('cr_missing', 'dark gray', 'black'),
-            ('service_vm', 'light cyan', 'black'),
-            ('service_mssql', 'light blue', 'black'),
-            ('service_otel', 'light green', 'black'),
-        ]
+        self.original_widget = None  # Main widget to restore when a popup closes
+        self.popup_action = None  # Title of the open service popup
+        self.service_options = None  # Options of the open service popup
+        self.dynamic_service_categories = None  # Discovered service categories, if any
+        self.dynamic_service_options = None
+        self.loop = None  # urwid.MainLoop, created by run()
+        self._popup_shells = {}  # popup key -> (overlay, listbox), oldest first
+        self._last_focus_title = None  # Focus column the panel titles were last drawn for
+        
+        # Worker pool for CR applies, status fetches and kubectl calls; workers
+        # never touch urwid widgets and report back through log_queue instead.
+        # The jobs wait on I/O, so the pool is sized past the CPU count.
+        self._apply_pool = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4))
+        # Playbooks can run for up to PLAYBOOK_TIMEOUT, so they get their own
+        # workers and never hold up status fetches or applies
+        self._playbook_pool = ThreadPoolExecutor(max_workers=2)
+        self._playbook_procs = set()  # Running ansible-playbook Popens, killed on exit
+        self._playbook_procs_lock = threading.Lock()
+        self._ui_calls = queue.Queue()  # (callable, args) queued by workers via _call_in_ui
+        self._ui_call_pipe_fd = None  # watch_pipe that wakes the loop for _ui_calls and log_queue
+        
+        # Session-wide kubectl proxy (see start_kubectl_proxy); None means kubectl
+        # talks to the apiserver directly with the inherited environment
+        self._proxy_process = None
+        self._proxy_url = None
+        self._proxy_kubeconfig = None
+        self._kubectl_env = None
+        self._proxy_lock = threading.Lock()  # Guards the proxy fields across the start thread and workers
+        
+        # Deployed object names per kind, kept current by watch threads (see
+        # start_status_watchers) so status redraws never call the API themselves
+        self._deployed = {}
+        self._watched_kinds = set()
+        self._crd_kinds = frozenset()  # (group, kind) served by the installed CRDs
+        self._crd_kinds_seen = frozenset()  # _crd_kinds as of the last _ensure_watchers
+        self._status_pipe_fd = None
+        self._status_wake_pending = False  # A wake byte is in the pipe, not yet handled
+        self._stop_event = threading.Event()
+        
+        # One-shot directory snapshots used instead of per-action stat calls;
+        # refreshed on F2 (refresh_status)
+        self.refresh_file_index()
+
+        # Global shortcuts: key -> action (single lookup instead of an elif chain)
+        self._key_actions = {
+            'q': self._quit,
+            'Q': self._quit,
+            'ctrl c': self._interrupt,
+            'left': lambda: self._focus_panel(0),
+            'right': lambda: self._focus_panel(1),
+            'tab': lambda: self._focus_panel(1 - self.content_columns.focus_position),
+            'f2': self.refresh_status,
+            'f3': lambda: self.show_vms_tab(None),
+            'f4': lambda: self.show_mssql_tab(None),
+            'f5': lambda: self.show_otel_tab(None),
+            'f6': lambda: self.apply_crds_menu(None),
+            'f7': lambda: self.apply_cr_menu(None),
+            'f8': self.toggle_auto_scroll,
+            'f9': self.reset_focus_and_navigation,
+        }
+        # Service tab -> method that shows it, and numbered-menu action -> executor
+        self._tab_dispatch = {
+            'vms': self.show_vms_tab,
+            'mssql': self.show_mssql_tab,
+            'otel': self.show_otel_tab,
+        }
+        # menu_state of a numbered method menu -> executor run once a method is picked
+        self._method_executors = {
+            'install_method_selection': self.execute_install_with_method,
+            'uninstall_method_selection': self.execute_uninstall_with_method,
+            'delete_method_selection': self.execute_delete_with_method,
+        }
+        self._action_dispatch = {
+            'install': self.execute_install_action,
+            'uninstall': self.execute_uninstall_action,
+        }
         
         self.setup_ui()
     
 
-    def show_universal_menu(self, title, menu_type, file_filter, action_callback, button_prefix=""):
-        """Universal menu system for all menu types - Apply CRD, Apply CR, Delete CR, etc."""
-        import os
+    def show_universal_menu(self, title, menu_type, file_filter, action_callback, button_prefix="", allow_batch=False):
+        """Universal menu system for all menu types - Apply CRD, Apply CR, Delete CR, etc.
         
+        With allow_batch, an extra first entry passes every listed file to
+        action_callback at once (file_path is then a list of paths).
+        """
         self.add_log_line(f"🔍 show_universal_menu called: {title}")
         
         # Check if loop exists
-        if not hasattr(self, 'loop') or not self.loop:
+        if not self.loop:
             self.add_log_line(f"❌ Error: TUI loop not initialized - cannot show menu")
             return
         
@@ -88,8 +575,8 @@ class KubernetesCRDTUI:
             self.add_log_line(f"❌ manifest-controller folder not found: {folder}")
             return
             
-        files = os.listdir(folder)
-        filtered_files = [f for f in files if f.endswith('.yaml') and file_filter(f)]
+        files = cached_file_entries(folder)
+        filtered_files = [(name, path) for name, path in files if name.endswith('.yaml') and file_filter(name)]
         
         self.add_log_line(f"📂 Found {len(files)} total files, {len(filtered_files)} filtered files")
         
@@ -99,35 +586,17 @@ class KubernetesCRDTUI:
 
         self.add_log_line(f"📋 Creating menu with {len(filtered_files)} items...")
 
-        # Universal button class that works for all menu types
-        class UniversalMenuButton(urwid.Button):
-            def __init__(self, label, file_name, file_path, callback, tui_instance):
-                super().__init__(label)
-                self.file_name = file_name
-                self.file_path = file_path
-                self.callback = callback
-                self.tui = tui_instance
-                
-            def keypress(self, size, key):
-                if key in ('enter', ' '):
-                    self.tui.add_log_line(f"🔥 UniversalMenuButton ENTER pressed for: {self.file_name}")
-                    self.tui.close_popup()
-                    self.callback(self.file_name, self.file_path)
-                    return None
-                if key == 'esc' or key == 'escape':
-                    self.tui.add_log_line(f"🚪 UniversalMenuButton ESC pressed")
-                    self.tui.close_popup()
-                    self.tui.menu_state = None
-                    self.tui.popup_listbox = None
-                    self.tui.reset_menu_state()
-                    return None
-                return super().keypress(size, key)
-
-        menu_items = []
-        for file_name in filtered_files:
-            file_path = os.path.join(folder, file_name)
-            btn = UniversalMenuButton(f"{button_prefix}{file_name}", file_name, file_path, action_callback, self)
-            menu_items.append(urwid.AttrMap(btn, 'button', 'button_focus'))
+        menu_items = [
+            urwid.AttrMap(UniversalMenuButton(f"{button_prefix}{file_name}", file_name, file_path,
+                                              action_callback, self),
+                          'button', 'button_focus')
+            for file_name, file_path in filtered_files
+        ]
+        if allow_batch and len(filtered_files) > 1:
+            all_paths = [file_path for _, file_path in filtered_files]
+            all_label = f"All {len(all_paths)} {menu_type}s"
+            btn = UniversalMenuButton(f"{button_prefix}{all_label}", all_label, all_paths, action_callback, self)
+            menu_items.insert(0, urwid.AttrMap(btn, 'button', 'button_focus'))
 
         walker = urwid.SimpleFocusListWalker(menu_items)
         listbox = urwid.ListBox(walker)
@@ -171,15 +640,19 @@ class KubernetesCRDTUI:
     def apply_crds_menu(self, button):
         """Show a menu to apply CRD YAMLs from manifest-controller"""
         def handle_crd_apply_selection(file_name, file_path):
-            result = subprocess.run(['kubectl', 'apply', '-f', file_path], capture_output=True, text=True)
-            if result.returncode == 0:
-                self.add_log_line(f"✅ CRD applied: {file_name}")
-                # Refresh the status display after successful CRD application
-                self.update_status_display()
-            else:
-                self.add_log_line(f"❌ Failed to apply CRD {file_name}: {result.stderr}")
-                if 'no objects passed to apply' in result.stderr:
-                    self.add_log_line(f"⚠️ The file {file_name} does not contain a valid Kubernetes CRD/CR object. Please check the YAML content.")
+            def on_exit(returncode, output):
+                if returncode == 0:
+                    self.add_log_line(f"✅ CRD applied: {file_name}")
+                    # Refresh the status display after successful CRD application
+                    self.update_status_display()
+                else:
+                    self.add_log_line(f"❌ Failed to apply CRD {file_name}")
+                    if 'no objects passed to apply' in output:
+                        self.add_log_line(f"⚠️ The file {file_name} does not contain a valid Kubernetes CRD/CR object. Please check the YAML content.")
+            
+            # The batch entry passes a list: one kubectl process for all of them
+            paths = file_path if isinstance(file_path, list) else [file_path]
+            self.run_command_streaming(['kubectl', 'apply', *_file_args(paths)], on_exit, prefix="🔎 kubectl: ")
 
         def crd_filter(filename):
             return 'crd' in filename.lower()
@@ -189,7 +662,8 @@ class KubernetesCRDTUI:
             "CRD", 
             crd_filter, 
             handle_crd_apply_selection, 
-            "CRD: "
+            "CRD: ",
+            allow_batch=True
         )
 
     def setup_ui(self):
@@ -200,6 +674,9 @@ class KubernetesCRDTUI:
 
         # Status display panel - consolidated CRD/CR Deployment Overview
         self.status_walker = urwid.SimpleFocusListWalker([])
+        self._status_rows = []  # Markup rows being built by the current status rebuild
+        self._last_status_rows = []  # Markup rows status_walker currently shows
+        self._status_widget_pool = []  # Text widget per row slot, kept at the high-water mark
         self.status_listbox = urwid.ListBox(self.status_walker)
         self.status_frame = urwid.LineBox(self.status_listbox, title="Kubernetes/KubeVirt Deployment Overview")
 
@@ -258,6 +735,7 @@ class KubernetesCRDTUI:
         """Switch to VMs view in status display"""
         self.active_service_tab = 'vms'
         self.status_frame.set_title("Virtual Machines Status")
+        self._last_focus_title = None  # Tab title replaced the focus marker
         self.update_status_display()
         if button:  # Only log if called via button/menu
             self.add_log_line("�️ Switched to Virtual Machines view")
@@ -266,6 +744,7 @@ class KubernetesCRDTUI:
         """Switch to MSSQL services view in status display"""
         self.active_service_tab = 'mssql'
         self.status_frame.set_title("MSSQL Services Status")
+        self._last_focus_title = None  # Tab title replaced the focus marker
         self.update_status_display()
         if button:  # Only log if called via button/menu
             self.add_log_line("🗄️ Switched to MSSQL Services view")
@@ -274,77 +753,87 @@ class KubernetesCRDTUI:
         """Switch to OpenTelemetry view in status display"""
         self.active_service_tab = 'otel'
         self.status_frame.set_title("OpenTelemetry Collectors Status")
+        self._last_focus_title = None  # Tab title replaced the focus marker
         self.update_status_display()
         if button:  # Only log if called via button/menu
             self.add_log_line("📊 Switched to OpenTelemetry view")
     
     def update_status_display(self):
-        """Update the consolidated status display with clean CRD tree view"""
+        """Mark the status display dirty; the rebuild runs once per burst of requests"""
+        self._status_dirty = True
+        if not self.loop:
+            self._flush_status()
+        elif not self._status_redraw_pending:
+            self._status_redraw_pending = True
+            self.loop.set_alarm_in(0.05, self._flush_status)
+    
+    def _flush_status(self, loop=None, user_data=None):
+        """Rebuild the status display if anything asked for it since the last rebuild"""
+        self._status_redraw_pending = False
+        if self._status_dirty:
+            self._status_dirty = False
+            self._rebuild_status()
+    
+    def _rebuild_status(self):
+        """Rebuild the consolidated status display with clean CRD tree view"""
+        # Builders append text markup to _status_rows; _apply_status_rows then
+        # touches only the walker rows that differ from the previous rebuild
+        self._status_rows = []
         try:
-            current_time = time.time()
-            
-            # Throttle updates
-            if current_time - self.last_status_update < self.update_interval:
-                return
-            
-            self.last_status_update = current_time
-            
-            # Clear existing status display
-            self.status_walker.clear()
-            
             # Add clean header with timestamp
             timestamp = datetime.now().strftime("%H:%M:%S")
             header_text = f'� CRD DEPLOYMENT STATUS ({timestamp})'
             
             # Insert header at top
-            self.status_walker.append(urwid.Text(('header', f'=== {header_text} ===')))
-            self.status_walker.append(urwid.Text(""))
+            self._status_rows.append(('header', f'=== {header_text} ==='))
+            self._status_rows.append("")
             
             # Build simple CRD tree view
             self.build_crd_tree_view()
             
         except Exception as e:
-            self.status_walker.clear()
-            self.status_walker.append(urwid.Text(('log_error', f'Error updating status: {e}')))
+            self._status_rows = [('log_error', f'Error updating status: {e}')]
+        self._apply_status_rows(self._status_rows)
+    
+    def _apply_status_rows(self, rows):
+        """Update status_walker to show rows, reusing the Text widgets of unchanged rows"""
+        previous = self._last_status_rows
+        for i in range(min(len(rows), len(previous))):
+            if rows[i] != previous[i]:
+                self.status_walker[i].set_text(rows[i])
+        if len(rows) > len(previous):
+            # Slots the panel shrank away from keep their widgets in the pool,
+            # so growing back only allocates past the high-water mark
+            pool = self._status_widget_pool
+            for i in range(len(previous), min(len(rows), len(pool))):
+                pool[i].set_text(rows[i])
+            pool.extend(urwid.Text(row) for row in rows[len(pool):])
+            self.status_walker.extend(pool[len(previous):len(rows)])
+        elif len(rows) < len(previous):
+            del self.status_walker[len(rows):]
+        self._last_status_rows = rows
     
     def build_crd_tree_view(self):
         """Build a clean CRD tree view showing local files and deployment status"""
-        import os
-        import yaml
-        import subprocess
-        
         try:
             # Get CRD files from manifest-controller folder
             folder = str(MANIFEST_DIR)
             if not os.path.exists(folder):
-                self.status_walker.append(urwid.Text(('log_error', '❌ manifest-controller folder not found')))
+                self._status_rows.append(('log_error', '❌ manifest-controller folder not found'))
                 return
             
-            files = os.listdir(folder)
-            crd_files = [f for f in files if f.endswith('.yaml') and 'crd' in f.lower()]
-            cr_files = [f for f in files if f.endswith('.yaml') and 'crd' not in f.lower()]
+            # File mtimes key the parse cache, so only new or edited YAMLs are re-read
+            yaml_mtimes = scan_yaml_mtimes(folder)
+            crd_files, cr_files = [], []
+            for f in yaml_mtimes:
+                (crd_files if 'crd' in f.lower() else cr_files).append(f)
             
             if not crd_files and not cr_files:
-                self.status_walker.append(urwid.Text(('log_warning', '⚠️ No CRD or CR files found')))
+                self._status_rows.append(('log_warning', '⚠️ No CRD or CR files found'))
                 return
             
-            # Get deployed CRDs from cluster
-            deployed_crds = set()
-            try:
-                result = subprocess.run(['kubectl', 'get', 'crd', '-o', 'name'], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    for line in result.stdout.splitlines():
-                        if line.strip():
-                            # Format: customresourcedefinition.apiextensions.k8s.io/<crd_name>
-                            parts = line.split('/')
-                            if len(parts) == 2:
-                                deployed_crds.add(parts[1])
-            except Exception:
-                pass  # If kubectl fails, just show all as not deployed
-            
             # Build grouped tree view: CRD as parent, CRs as children
-            self.status_walker.append(urwid.Text(('header', 'Deployment Status')))
+            self._status_rows.append(('header', 'Deployment Status'))
             deployed_crd_count = 0
             deployed_cr_count = 0
             total_crds = len(crd_files)
@@ -357,15 +846,18 @@ class KubernetesCRDTUI:
                 crd_plural = None
                 crd_singular = None
                 try:
-                    with open(crd_path, 'r') as f:
-                        crd_content = yaml.safe_load(f)
+                    crd_content = load_manifest(crd_path, yaml_mtimes[crd_file])
                     if crd_content and crd_content.get('kind') == 'CustomResourceDefinition':
                         crd_name = crd_content.get('metadata', {}).get('name', 'unknown')
                         crd_plural = crd_content.get('spec', {}).get('names', {}).get('plural', None)
                         crd_singular = crd_content.get('spec', {}).get('names', {}).get('singular', None)
                 except Exception:
                     pass
-                crd_info[crd_file] = {'name': crd_name, 'plural': crd_plural, 'singular': crd_singular}
+                crd_info[crd_file] = {'name': crd_name, 'plural': crd_plural, 'singular': crd_singular,
+                                      # Lower-cased once here for the CR matching below
+                                      'match_keys': (crd_plural and crd_plural.lower(),
+                                                     crd_singular and crd_singular.lower(),
+                                                     crd_name.lower() if crd_name != 'unknown' else None)}
             # Parse CR files for kind mapping
             cr_files_info = []
             for cr_file in cr_files:
@@ -373,106 +865,75 @@ class KubernetesCRDTUI:
                 cr_kind = 'unknown'
                 cr_name = 'unknown'
                 try:
-                    with open(cr_path, 'r') as f:
-                        cr_content = yaml.safe_load(f)
+                    cr_content = load_manifest(cr_path, yaml_mtimes[cr_file])
                     if cr_content:
                         cr_kind = cr_content.get('kind', 'unknown')
                         cr_name = cr_content.get('metadata', {}).get('name', 'unknown')
                 except Exception:
                     pass
-                cr_files_info.append({'file': cr_file, 'kind': cr_kind, 'name': cr_name})
-            # Get deployed CRDs from cluster
-            deployed_crds = set()
-            try:
-                result = subprocess.run(['kubectl', 'get', 'crd', '-o', 'name'], 
-                                      capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    for line in result.stdout.splitlines():
-                        if line.strip():
-                            parts = line.split('/')
-                            if len(parts) == 2:
-                                deployed_crds.add(parts[1])
-            except Exception:
-                pass
+                cr_files_info.append({'file': cr_file, 'kind': cr_kind, 'name': cr_name,
+                                      'kind_key': cr_kind.lower()})
+            # Deployed CRDs from the watch (empty until its first listing)
+            deployed_crds = self._deployed_names('CustomResourceDefinition')
+            matched_cr_files = set()
             # Build parent-child tree
             for crd_file in sorted(crd_files):
                 crd_name = crd_info[crd_file]['name']
                 crd_plural = crd_info[crd_file]['plural']
                 if crd_name in deployed_crds:
-                    status_icon = '🟢'
+                    status_icon = _ICONS['ready']
                     status_color = 'status_running'
                     deployed_crd_count += 1
                 else:
-                    status_icon = '🔴'
+                    status_icon = _ICONS['err']
                     status_color = 'status_stopped'
                 line = f'{status_icon} [CRD] {crd_file}'
-                self.status_walker.append(urwid.Text((status_color, line)))
+                self._status_rows.append((status_color, line))
                 # Find matching CRs by kind/plural
+                plural_key, singular_key, name_key = crd_info[crd_file]['match_keys']
                 for cr_info in cr_files_info:
-                    # Match by plural (lowercase) or kind (case-insensitive)
-                    match = False
-                    if crd_plural and cr_info['kind'].lower() == crd_plural.lower():
-                        match = True
-                    elif crd_info[crd_file]['singular'] and cr_info['kind'].lower() == crd_info[crd_file]['singular'].lower():
-                        match = True
-                    elif crd_name != 'unknown' and cr_info['kind'].lower() in crd_name.lower():
-                        match = True
-                    if match:
+                    # Match by plural or singular (case-insensitive), or kind within the CRD name
+                    kind_key = cr_info['kind_key']
+                    if kind_key == plural_key or kind_key == singular_key or (name_key and kind_key in name_key):
+                        matched_cr_files.add(cr_info['file'])
                         # Check if CR is deployed
-                        is_deployed = False
-                        try:
-                            result = subprocess.run(['kubectl', 'get', cr_info['kind'].lower(), cr_info['name']],
-                                                  capture_output=True, text=True, timeout=3)
-                            is_deployed = (result.returncode == 0)
-                        except Exception:
-                            pass
+                        is_deployed = cr_info['name'] in self._deployed_names(cr_info['kind'])
                         if is_deployed:
-                            cr_status_icon = '🟢'
+                            cr_status_icon = _ICONS['ready']
                             cr_status_color = 'status_running'
                             deployed_cr_count += 1
                         else:
-                            cr_status_icon = '🔴'
+                            cr_status_icon = _ICONS['err']
                             cr_status_color = 'status_stopped'
                         cr_line = f'    {cr_status_icon} [CR] {cr_info["file"]}'
-                        self.status_walker.append(urwid.Text((cr_status_color, cr_line)))
-            # Show CRs that did not match any CRD
-            unmatched_crs = [cr for cr in cr_files_info if not any(
-                (crd_info[crd_file]['plural'] and cr['kind'].lower() == crd_info[crd_file]['plural'].lower()) or
-                (crd_info[crd_file]['singular'] and cr['kind'].lower() == crd_info[crd_file]['singular'].lower()) or
-                (crd_info[crd_file]['name'] != 'unknown' and cr['kind'].lower() in crd_info[crd_file]['name'].lower())
-                for crd_file in crd_files)]
+                        self._status_rows.append((cr_status_color, cr_line))
+            # Show CRs that did not match any CRD (recorded by the pass above)
+            unmatched_crs = [cr for cr in cr_files_info if cr['file'] not in matched_cr_files]
             if unmatched_crs:
-                self.status_walker.append(urwid.Text(('log_warning', '  ⚠️ Unmatched CRs:')))
+                self._status_rows.append(('log_warning', f"  {_ICONS['warn']} Unmatched CRs:"))
                 for cr_info in unmatched_crs:
                     # Check if CR is deployed
-                    is_deployed = False
-                    try:
-                        result = subprocess.run(['kubectl', 'get', cr_info['kind'].lower(), cr_info['name']],
-                                              capture_output=True, text=True, timeout=3)
-                        is_deployed = (result.returncode == 0)
-                    except Exception:
-                        pass
+                    is_deployed = cr_info['name'] in self._deployed_names(cr_info['kind'])
                     if is_deployed:
-                        cr_status_icon = '🟢'
+                        cr_status_icon = _ICONS['ready']
                         cr_status_color = 'status_running'
                         deployed_cr_count += 1
                     else:
-                        cr_status_icon = '🔴'
+                        cr_status_icon = _ICONS['err']
                         cr_status_color = 'status_stopped'
                     cr_line = f'    {cr_status_icon} [CR] {cr_info["file"]}'
-                    self.status_walker.append(urwid.Text((cr_status_color, cr_line)))
+                    self._status_rows.append((cr_status_color, cr_line))
             # Simple summary
-            self.status_walker.append(urwid.Text(""))
-            self.status_walker.append(urwid.Text(('header', f'📊 SUMMARY: CRDs {deployed_crd_count}/{total_crds} | CRs {deployed_cr_count}/{total_crs}')))
+            self._status_rows.append("")
+            self._status_rows.append(('header', f'📊 SUMMARY: CRDs {deployed_crd_count}/{total_crds} | CRs {deployed_cr_count}/{total_crs}'))
             
         except Exception as e:
-            self.status_walker.append(urwid.Text(('log_error', f'❌ Error building tree view: {e}')))
+            self._status_rows.append(('log_error', f'❌ Error building tree view: {e}'))
     
     def _get_crd_name_from_file(self, file_path):
         """Helper to extract CRD name from YAML file"""
         try:
-            with open(file_path, 'r') as f:
-                content = yaml.safe_load(f)
+            content = load_manifest(file_path, os.stat(file_path).st_mtime_ns)
             if content and content.get('kind') == 'CustomResourceDefinition':
                 return content.get('metadata', {}).get('name', 'unknown')
         except Exception:
@@ -495,101 +956,73 @@ class KubernetesCRDTUI:
             all_vm_scenarios[f"RedHat-{vm_name}"] = data
         
         if all_vm_scenarios:
-            self.status_walker.append(urwid.Text(('service_vm', '📊 VM SCENARIO ANALYSIS:')))
+            self._status_rows.append(('service_vm', '📊 VM SCENARIO ANALYSIS:'))
             for vm_name, scenario_data in all_vm_scenarios.items():
                 scenario = scenario_data['scenario']
                 
                 # Color coding based on scenario
-                if 'Running' in scenario and 'Managed' in scenario:
-                    color = 'status_running'
-                    icon = '✅'
-                elif 'Running' in scenario and 'Orphaned' in scenario:
-                    color = 'status_unknown'
-                    icon = '⚠️'
-                elif 'No Instance' in scenario:
-                    color = 'status_stopped'
-                    icon = '❌'
-                else:
-                    color = 'status_unknown'
-                    icon = '❓'
+                color, icon = _scenario_style(scenario)
                 
                 status_line = f"{icon} {vm_name}: {scenario}"
-                self.status_walker.append(urwid.Text((color, status_line)))
+                self._status_rows.append((color, status_line))
                 
                 # Add details
                 if scenario_data.get('local_cr'):
-                    self.status_walker.append(urwid.Text(('cr_local', f"   📁 Local CR: {scenario_data['local_cr']} (action: {scenario_data.get('local_cr_action', 'unknown')})")))
+                    self._status_rows.append(('cr_local', f"   📁 Local CR: {scenario_data['local_cr']} (action: {scenario_data.get('local_cr_action', 'unknown')})"))
                 if scenario_data.get('deployed_cr'):
-                    self.status_walker.append(urwid.Text(('cr_deployed', f"   ☸️ Deployed CR: {scenario_data['deployed_cr']} (action: {scenario_data.get('deployed_cr_action', 'unknown')})")))
+                    self._status_rows.append(('cr_deployed', f"   ☸️ Deployed CR: {scenario_data['deployed_cr']} (action: {scenario_data.get('deployed_cr_action', 'unknown')})"))
                 if scenario_data.get('vm_running'):
-                    self.status_walker.append(urwid.Text(('status_running', f"   🖥️ VM Status: {scenario_data.get('vm_status', 'unknown')}")))
+                    self._status_rows.append(('status_running', f"   🖥️ VM Status: {scenario_data.get('vm_status', 'unknown')}"))
                 
-                self.status_walker.append(urwid.Text(""))
+                self._status_rows.append("")
         else:
-            self.status_walker.append(urwid.Text(('status_unknown', '❓ No VMs found')))
+            self._status_rows.append(('status_unknown', f"{_ICONS['unknown']} No VMs found"))
         
         # Summary statistics for all VM types and services
         summary_data = status_report.get('summary', {})
         windowsvm_summary = summary_data.get('windowsvm', {})
         redhatvm_summary = summary_data.get('redhatvm', {})
         
-        import os
         crd_files = []
         crd_names_in_folder = set()
         crd_count = 0
         try:
             folder = str(MANIFEST_DIR)
-            files = os.listdir(folder)
-            crd_files = [f for f in files if f.endswith('.yaml') and 'crd' in f.lower()]
+            yaml_mtimes = scan_yaml_mtimes(folder)
+            crd_files = [f for f in yaml_mtimes if 'crd' in f.lower()]
             crd_count = len(crd_files)
-            # Extract CRD names from YAMLs
-            import yaml
+            # Extract CRD names from YAMLs (cached until the file changes)
             for fname in crd_files:
                 try:
-                    with open(os.path.join(folder, fname), 'r') as f:
-                        y = yaml.safe_load(f)
-                        if y and y.get('kind', '').lower() == 'customresourcedefinition':
-                            meta = y.get('metadata', {})
-                            name = meta.get('name')
-                            if name:
-                                crd_names_in_folder.add(name)
+                    y = load_manifest(os.path.join(folder, fname), yaml_mtimes[fname])
+                    if y and y.get('kind', '').lower() == 'customresourcedefinition':
+                        meta = y.get('metadata', {})
+                        name = meta.get('name')
+                        if name:
+                            crd_names_in_folder.add(name)
                 except Exception:
                     pass
         except Exception:
             crd_count = 0
-        deployed_crd_names = set()
-        deployed_crd_count = 0
-        try:
-            import subprocess
-            result = subprocess.run(['kubectl', 'get', 'crd', '-o', 'name'], capture_output=True, text=True)
-            if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    line = line.strip()
-                    if line:
-                        # Format: customresourcedefinition.apiextensions.k8s.io/<crd_name>
-                        parts = line.split('/')
-                        if len(parts) == 2:
-                            deployed_crd_names.add(parts[1])
-                deployed_crd_count = len(deployed_crd_names)
-        except Exception:
-            deployed_crd_count = 0
+        deployed_crd_names = self._deployed_names('CustomResourceDefinition')
+        deployed_crd_count = len(deployed_crd_names)
         # Count matches
         matching_crds = crd_names_in_folder & deployed_crd_names
         match_count = len(matching_crds)
-        self.status_walker.append(urwid.Text(('header', '📈 VIRTUAL MACHINES SUMMARY:')))
-        self.status_walker.append(urwid.Text(f"CRDs in folder: {crd_count} | Deployed CRDs: {deployed_crd_count} | Matching: {match_count}"))
+        self._status_rows.append(('header', '📈 VIRTUAL MACHINES SUMMARY:'))
+        self._status_rows.append(f"CRDs in folder: {crd_count} | Deployed CRDs: {deployed_crd_count} | Matching: {match_count}")
         
         # Windows VMs
         if windowsvm_summary:
-            self.status_walker.append(urwid.Text(f"Windows VMs - Local CRs: {windowsvm_summary.get('local_count', 0)} | Deployed: {windowsvm_summary.get('deployed_count', 0)} | Running: {windowsvm_summary.get('running_count', 0)}"))
+            self._status_rows.append(f"Windows VMs - Local CRs: {windowsvm_summary.get('local_count', 0)} | Deployed: {windowsvm_summary.get('deployed_count', 0)} | Running: {windowsvm_summary.get('running_count', 0)}")
         
         # RedHat VMs
         if redhatvm_summary:
-            self.status_walker.append(urwid.Text(f"RedHat VMs - Local CRs: {redhatvm_summary.get('local_count', 0)} | Deployed: {redhatvm_summary.get('deployed_count', 0)} | Running: {redhatvm_summary.get('running_count', 0)}"))
+            self._status_rows.append(f"RedHat VMs - Local CRs: {redhatvm_summary.get('local_count', 0)} | Deployed: {redhatvm_summary.get('deployed_count', 0)} | Running: {redhatvm_summary.get('running_count', 0)}")
         
         # If no VM data available, show basic info
         if not windowsvm_summary and not redhatvm_summary:
-            self.status_walker.append(urwid.Text(f"Local CRs: 0 | Deployed CRs: 0 | Running VMs: 0"))
+            self._status_rows.append(f"Local CRs: 0 | Deployed CRs: 0 | Running VMs: 0")
     
     def update_mssql_status_display(self, status_report):
         """Update MSSQL services status display"""
@@ -597,14 +1030,14 @@ class KubernetesCRDTUI:
         
         # Local CRs
         if mssql_data.get('local_crs'):
-            self.status_walker.append(urwid.Text(('service_mssql', '📁 LOCAL MSSQL CRs:')))
+            self._status_rows.append(('service_mssql', '📁 LOCAL MSSQL CRs:'))
             for name, cr_data in mssql_data['local_crs'].items():
                 target_vm = cr_data.get('target_vm', 'unknown')
                 version = cr_data.get('version', 'unknown')
                 enabled = cr_data.get('enabled', True)
-                status_icon = '✅' if enabled else '⏸️'
-                self.status_walker.append(urwid.Text(('cr_local', f"  {status_icon} {name}: target={target_vm}, version={version}")))
-            self.status_walker.append(urwid.Text(""))
+                status_icon = _ICONS['ok' if enabled else 'paused']
+                self._status_rows.append(('cr_local', f"  {status_icon} {name}: target={target_vm}, version={version}"))
+            self._status_rows.append("")
         
         # Deployed CRs
             for name, cr_data in mssql_data['deployed_crs'].items():
@@ -612,27 +1045,19 @@ class KubernetesCRDTUI:
                 version = cr_data.get('version', 'unknown')
                 status = cr_data.get('status', {}).get('phase', 'Unknown')
                 
-                if status == 'Ready':
-                    color = 'status_running'
-                    icon = '🟢'
-                elif status == 'Failed':
-                    color = 'status_stopped'
-                    icon = '🔴'
-                else:
-                    color = 'status_unknown'
-                    icon = '🟡'
+                color, icon = _PHASE_STYLE.get(status, _PHASE_STYLE_DEFAULT)
                 
-                self.status_walker.append(urwid.Text((color, f"  {icon} {name}: target={target_vm}, version={version}, status={status}")))
-            self.status_walker.append(urwid.Text(""))
+                self._status_rows.append((color, f"  {icon} {name}: target={target_vm}, version={version}, status={status}"))
+            self._status_rows.append("")
         
         if not mssql_data.get('local_crs') and not mssql_data.get('deployed_crs'):
-            self.status_walker.append(urwid.Text(('status_unknown', '❓ No MSSQL services found')))
+            self._status_rows.append(('status_unknown', f"{_ICONS['unknown']} No MSSQL services found"))
         
         # Summary
         mssql_summary = status_report.get('summary', {}).get('mssqlserver', {})
-        self.status_walker.append(urwid.Text(('header', '📈 MSSQL SUMMARY:')))
-        self.status_walker.append(urwid.Text(f"Local CRs: {mssql_summary.get('local_count', 0)}"))
-        self.status_walker.append(urwid.Text(f"Deployed CRs: {mssql_summary.get('deployed_count', 0)}"))
+        self._status_rows.append(('header', '📈 MSSQL SUMMARY:'))
+        self._status_rows.append(f"Local CRs: {mssql_summary.get('local_count', 0)}")
+        self._status_rows.append(f"Deployed CRs: {mssql_summary.get('deployed_count', 0)}")
     
     def update_otel_status_display(self, status_report):
         """Update OpenTelemetry status display"""
@@ -640,80 +1065,92 @@ class KubernetesCRDTUI:
         
         # Local CRs
         if otel_data.get('local_crs'):
-            self.status_walker.append(urwid.Text(('service_otel', '📁 LOCAL OTEL CRs:')))
+            self._status_rows.append(('service_otel', '📁 LOCAL OTEL CRs:'))
             for name, cr_data in otel_data['local_crs'].items():
                 target_vm = cr_data.get('target_vm', 'unknown')
                 metrics_type = cr_data.get('metrics_type', 'unknown')
                 enabled = cr_data.get('enabled', True)
-                status_icon = '✅' if enabled else '⏸️'
-                self.status_walker.append(urwid.Text(('cr_local', f"  {status_icon} {name}: target={target_vm}, metrics={metrics_type}")))
-            self.status_walker.append(urwid.Text(""))
+                status_icon = _ICONS['ok' if enabled else 'paused']
+                self._status_rows.append(('cr_local', f"  {status_icon} {name}: target={target_vm}, metrics={metrics_type}"))
+            self._status_rows.append("")
         
         # Deployed CRs
         if otel_data.get('deployed_crs'):
-            self.status_walker.append(urwid.Text(('service_otel', '☸️ DEPLOYED OTEL CRs:')))
+            self._status_rows.append(('service_otel', '☸️ DEPLOYED OTEL CRs:'))
             for name, cr_data in otel_data['deployed_crs'].items():
                 target_vm = cr_data.get('target_vm', 'unknown')
                 metrics_type = cr_data.get('metrics_type', 'unknown')
                 status = cr_data.get('status', {}).get('phase', 'Unknown')
                 
-                if status == 'Ready':
-                    color = 'status_running'
-                    icon = '🟢'
-                elif status == 'Failed':
-                    color = 'status_stopped'
-                    icon = '🔴'
-                else:
-                    color = 'status_unknown'
-                    icon = '🟡'
+                color, icon = _PHASE_STYLE.get(status, _PHASE_STYLE_DEFAULT)
                 
-                self.status_walker.append(urwid.Text((color, f"  {icon} {name}: target={target_vm}, metrics={metrics_type}, status={status}")))
-            self.status_walker.append(urwid.Text(""))
+                self._status_rows.append((color, f"  {icon} {name}: target={target_vm}, metrics={metrics_type}, status={status}"))
+            self._status_rows.append("")
         
         if not otel_data.get('local_crs') and not otel_data.get('deployed_crs'):
-            self.status_walker.append(urwid.Text(('status_unknown', '❓ No OpenTelemetry services found')))
+            self._status_rows.append(('status_unknown', f"{_ICONS['unknown']} No OpenTelemetry services found"))
         
         # Summary
         otel_summary = status_report.get('summary', {}).get('otelcollector', {})
-        self.status_walker.append(urwid.Text(('header', '📈 OTEL SUMMARY:')))
-        self.status_walker.append(urwid.Text(f"Local CRs: {otel_summary.get('local_count', 0)}"))
-        self.status_walker.append(urwid.Text(f"Deployed CRs: {otel_summary.get('deployed_count', 0)}"))
+        self._status_rows.append(('header', '📈 OTEL SUMMARY:'))
+        self._status_rows.append(f"Local CRs: {otel_summary.get('local_count', 0)}")
+        self._status_rows.append(f"Deployed CRs: {otel_summary.get('deployed_count', 0)}")
     
     def add_log_line(self, text):
         """Add a log line to the System Logs window, splitting multi-line entries for smooth display."""
+        was_empty = not self._pending_log
         if isinstance(text, str):
-            for line in text.splitlines():
-                if line.strip() == '':
-                    continue
-                self._add_log_line_single(line)
+            self._pending_log.extend(line for line in text.splitlines() if line.strip())
         else:
-            self._add_log_line_single(str(text))
+            self._pending_log.append(str(text))
+        self._schedule_log_flush(was_empty)
+    
+    def add_log_lines(self, lines):
+        """Add several log lines with one call; blank lines are skipped as in add_log_line"""
+        was_empty = not self._pending_log
+        self._pending_log.extend(line for line in lines if line.strip())
+        self._schedule_log_flush(was_empty)
+    
+    def _schedule_log_flush(self, was_empty):
+        """Arm the _flush_logs alarm for lines buffered since the buffer was last empty"""
+        # Lines are buffered and appended to the walker in one go, so a burst of
+        # log calls (one apply, a playbook transcript) costs a single update
+        if not self.loop:
+            self._flush_logs()
+        elif was_empty and self._pending_log:
+            self.loop.set_alarm_in(0.05, self._flush_logs)
+    
+    def _flush_logs(self, loop=None, user_data=None):
+        """Move buffered log lines into the System Logs window"""
+        lines, self._pending_log = self._pending_log, []
+        if not lines:
+            return
+        self.log_walker.extend(urwid.Text((self._log_attr(line), line)) for line in lines)
+        # Keep only recent logs; trimming waits for _LOG_TRIM_SLACK extra lines so
+        # the front-of-list shift happens once per batch of lines, not per flush
+        excess = len(self.log_walker) - self.max_log_lines
+        if excess > self._LOG_TRIM_SLACK:
+            del self.log_walker[:excess]
         # Always scroll to the latest log line
-        if hasattr(self, 'log_listbox') and self.log_walker:
-            try:
-                self.log_listbox.focus_position = len(self.log_walker) - 1
-            except Exception:
-                pass
-
-    def _add_log_line_single(self, line):
-        # Determine log level color
-        if 'ERROR' in line.upper() or '❌' in line:
-            attr = 'log_error'
-        elif 'WARNING' in line.upper() or 'WARN' in line.upper() or '⚠️' in line:
-            attr = 'log_warning'
+        try:
+            self.log_listbox.focus_position = len(self.log_walker) - 1
+        except Exception:
+            pass
+    
+    @staticmethod
+    def _log_attr(line):
+        # Determine log level color; an error marker anywhere wins over a warning
+        attr = 'log_info'
+        for hint in _LOG_LEVEL_HINTS:
+            if hint in line:
+                break
         else:
-            attr = 'log_info'
-        log_widget = urwid.Text((attr, line))
-        self.log_walker.append(log_widget)
-        # Keep only recent logs
-        if len(self.log_walker) > self.max_log_lines:
-            self.log_walker.pop(0)
-        # Auto-scroll if enabled
-        if self.auto_scroll and self.log_walker:
-            try:
-                self.log_listbox.focus_position = len(self.log_walker) - 1
-            except:
-                pass
+            return attr
+        for match in _LOG_LEVEL_RE.finditer(line):
+            if match.group(1):
+                return 'log_error'
+            attr = 'log_warning'
+        return attr
     
     # Menu action methods with central popup windows
     def apply_cr_menu(self, button):
@@ -722,17 +1159,24 @@ class KubernetesCRDTUI:
         
         def handle_cr_apply_selection(file_name, file_path):
             self.add_log_line(f"🚀 Applying CR: {file_name} using kubectl...")
-            result = subprocess.run(['kubectl', 'apply', '-f', file_path], capture_output=True, text=True)
-            if result.returncode == 0:
-                self.add_log_line(f"✅ CR applied: {file_name}")
-                if result.stdout:
-                    self.add_log_line(f"🔎 kubectl output: {result.stdout.strip()}")
-                # Refresh the status display after successful CR application
-                self.update_status_display()
-            else:
-                self.add_log_line(f"❌ Failed to apply CR {file_name}!")
-                self.add_log_line(f"🔎 kubectl stderr: {result.stderr.strip()}")
-                self.add_log_line(f"🔎 kubectl stdout: {result.stdout.strip()}")
+            
+            def on_exit(returncode, output):
+                if returncode == 0:
+                    self.add_log_line(f"✅ CR applied: {file_name}")
+                    # Refresh the status display after successful CR application
+                    self.update_status_display()
+                else:
+                    self.add_log_line(f"❌ Failed to apply CR {file_name}!")
+            
+            # kubectl output is streamed into the log as it arrives; the batch
+            # entry passes a list, applied by a single kubectl process. Same
+            # server-side apply and field manager as apply_cr_object, so the
+            # two paths share field ownership instead of mixing apply modes
+            paths = file_path if isinstance(file_path, list) else [file_path]
+            self.run_command_streaming(
+                ['kubectl', 'apply', '--server-side', f'--field-manager={FIELD_MANAGER}', *_file_args(paths)],
+                on_exit, prefix="🔎 kubectl: "
+            )
 
         def cr_filter(filename):
             return 'crd' not in filename.lower()
@@ -742,7 +1186,8 @@ class KubernetesCRDTUI:
             "CR", 
             cr_filter, 
             handle_cr_apply_selection, 
-            "CR: "
+            "CR: ",
+            allow_batch=True
         )
     
     def delete_cr_menu(self, button):
@@ -750,42 +1195,18 @@ class KubernetesCRDTUI:
         self.add_log_line(f"🗑️ delete_cr_menu called - starting delete CR menu...")
         
         def handle_cr_delete_selection(file_name, file_path):
-            self.add_log_line(f"🔥 DELETE CALLBACK TRIGGERED: {file_name}")
+            if _TUI_DEBUG_ENTER:
+                self.add_log_line(f"🔥 DELETE CALLBACK TRIGGERED: {file_name}")
+            if isinstance(file_path, list):
+                self.delete_cr_files(file_path)
+                return
             self.add_log_line(f"🗑️ Deleting CR: {file_name}...")
-            
-            # Use timeout for kubectl delete to prevent hanging
-            try:
-                result = subprocess.run(['kubectl', 'delete', '-f', file_path], 
-                                      capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    self.add_log_line(f"✅ CR deleted successfully: {file_name}")
-                    self.add_log_line(f"👀 Monitoring operator response...")
-                    
-                    # PICKUP ACTION 1: Update status display immediately
-                    self.update_status_display()
-                    
-                    # PICKUP ACTION 2: Check for operator activity
-                    self.monitor_operator_deletion_activity(file_name, file_path)
-                    
-                    # PICKUP ACTION 3: Check for associated cleanup actions
-                    self.trigger_post_delete_cleanup(file_name, file_path)
-                else:
-                    err = result.stderr
-                    if 'NotFound' in err and 'error when deleting' in err:
-                        self.add_log_line(f"⚠️ CR not found in cluster (already deleted): {file_name}")
-                        # Still update status display and trigger cleanup
-                        self.update_status_display()
-                        self.trigger_post_delete_cleanup(file_name, file_path)
-                    elif 'CRD' in err and 'not found' in err:
-                        self.add_log_line(f"⚠️ CRD not found for {file_name}, but that's expected if CRDs aren't deployed")
-                    else:
-                        self.add_log_line(f"❌ Failed to delete CR {file_name}: {err}")
-            except subprocess.TimeoutExpired:
-                self.add_log_line(f"⏰ kubectl delete timed out for {file_name}")
-                self.add_log_line(f"🔧 This may be due to stuck finalizers or unresponsive operators")
-                self.add_log_line(f"💡 Try: kubectl patch {file_name.replace('.yaml', '')} --type='merge' -p='{{\"metadata\":{{\"finalizers\":[]}}}}'")
-                # Still try to run cleanup
-                self.trigger_post_delete_cleanup(file_name, file_path)
+            # The API call runs on the worker pool so the UI keeps drawing;
+            # _on_cr_deleted reports the outcome back on the UI thread
+            future = self._apply_pool.submit(self._delete_cr_worker, file_path)
+            future.add_done_callback(
+                lambda f: self._call_in_ui(self._on_cr_deleted, file_name, file_path, f.result())
+            )
 
         def cr_filter(filename):
             is_cr = 'crd' not in filename.lower()
@@ -798,16 +1219,100 @@ class KubernetesCRDTUI:
             "CR", 
             cr_filter, 
             handle_cr_delete_selection, 
-            "CR: "
+            "CR: ",
+            allow_batch=True
         )
 
+    def _delete_cr_worker(self, file_path):
+        """Delete the CR of a manifest off the UI thread; returns (outcome, error)"""
+        try:
+            cr_obj = load_manifest(file_path, os.stat(file_path).st_mtime_ns)
+            self.delete_cr_object(cr_obj)
+        except NotFoundError:
+            return 'not_found', None
+        except ResourceNotFoundError:
+            return 'no_crd', None
+        except Exception as e:
+            return 'failed', e
+        return 'deleted', None
+
+    def _on_cr_deleted(self, file_name, file_path, outcome):
+        """Report a _delete_cr_worker result and run the post-delete follow-ups"""
+        status, error = outcome
+        if status == 'deleted':
+            self._invalidate_status_cache()
+            self.add_log_line(f"✅ CR deleted successfully: {file_name}")
+            self.add_log_line(f"👀 Monitoring operator response...")
+                
+            # PICKUP ACTION 1: Update status display immediately
+            self.update_status_display()
+                
+            # PICKUP ACTION 2: Check for operator activity
+            self.monitor_operator_deletion_activity(file_name, file_path)
+                
+            # PICKUP ACTION 3: Check for associated cleanup actions
+            self.trigger_post_delete_cleanup(file_name, file_path)
+        elif status == 'not_found':
+            self.add_log_line(f"⚠️ CR not found in cluster (already deleted): {file_name}")
+            # Still update status display and trigger cleanup
+            self.update_status_display()
+            self.trigger_post_delete_cleanup(file_name, file_path)
+        elif status == 'no_crd':
+            self.add_log_line(f"⚠️ CRD not found for {file_name}, but that's expected if CRDs aren't deployed")
+        else:
+            self.add_log_line(f"❌ Failed to delete CR {file_name}: {error}")
+
+    def delete_cr_files(self, paths):
+        """Delete several CR manifests with one kubectl call and run each one's cleanup"""
+        names = [os.path.basename(path) for path in paths]
+        self.add_log_line(f"🗑️ Deleting {len(paths)} CRs: {', '.join(names)}...")
+        # One invocation pays kubectl's startup/discovery once for the whole
+        # batch; CRs that are already gone are not an error
+        self._run_kubectl_async(['delete', '--ignore-not-found=true', *_file_args(paths)],
+                                lambda result: self._on_cr_files_deleted(names, paths, result),
+                                timeout=10 + 2 * len(paths), capture_stdout=False)
+    
+    def _on_cr_files_deleted(self, names, paths, result):
+        """Report a delete_cr_files kubectl result per file, on the UI thread"""
+        self._invalidate_status_cache()
+        if result.returncode == KUBECTL_TIMED_OUT:
+            self.add_log_line(f"🔧 This may be due to stuck finalizers or unresponsive operators")
+            self.add_log_line(f"❓ Outcome unknown for {len(paths)} CRs; skipping post-delete cleanup")
+            self.update_status_display()
+            return
+        # kubectl names the manifest in each per-object error line, so those
+        # can be attributed per file even though the call was shared
+        error_lines = result.stderr.splitlines() if result.returncode != 0 else []
+        unattributed = [line for line in error_lines if not any(path in line for path in paths)]
+        if unattributed:
+            # A call-wide failure (auth, connection, ...) names no file, so
+            # none of them can be assumed deleted
+            for line in unattributed:
+                self.add_log_line(f"❌ {line}")
+            self.add_log_line(f"❓ Outcome unknown for {len(paths)} CRs; skipping post-delete cleanup")
+            self.update_status_display()
+            return
+        deleted = 0
+        for name, path in zip(names, paths):
+            errors = [line for line in error_lines if path in line]
+            if errors:
+                self.add_log_line(f"❌ Failed to delete CR {name}: {errors[0]}")
+                continue
+            deleted += 1
+            self.trigger_post_delete_cleanup(name, path)
+        self.add_log_line(f"📊 Deleted {deleted}/{len(paths)} CRs")
+        self.update_status_display()
+
     def monitor_operator_deletion_activity(self, cr_file, cr_path):
         """Monitor and display operator activity after CR deletion"""
-        import subprocess
-        import time
-        
         self.add_log_line(f"🎯 === OPERATOR DELETION MONITORING ===")
         self.add_log_line(f"📋 Checking for operator response to {cr_file} deletion...")
+        # The kubectl checks run on the worker pool; their report is logged in one piece
+        self._report_async(self._operator_deletion_report, cr_file)
+
+    def _operator_deletion_report(self, cr_file):
+        """monitor_operator_deletion_activity checks, off the UI thread; returns the log lines"""
+        lines = []
         
         # Determine the service type for targeted monitoring
         service_type = None
@@ -821,71 +1326,89 @@ class KubernetesCRDTUI:
             service_type = 'otel'
         
         if service_type:
-            self.add_log_line(f"🔍 Monitoring {service_type} operator activity...")
+            lines.append(f"🔍 Monitoring {service_type} operator activity...")
             
             # Check for operator pods that should handle this deletion
             try:
-                result = subprocess.run([
-                    'kubectl', 'get', 'pods', '-A', 
+                result = self._report_kubectl([
+                    'get', 'pods', '-A', 
                     '--field-selector=status.phase=Running',
                     '-o', 'name'
-                ], capture_output=True, text=True, timeout=5)
+                ], 5, lines)
                 
                 if result.returncode == 0:
                     running_pods = result.stdout.strip().split('\n')
                     operator_pods = [pod for pod in running_pods if service_type in pod.lower() or 'kopf' in pod.lower()]
                     
                     if operator_pods:
-                        self.add_log_line(f"🤖 Found {len(operator_pods)} operator pod(s) running")
+                        lines.append(f"🤖 Found {len(operator_pods)} operator pod(s) running")
                         for pod in operator_pods[:3]:  # Show first 3
-                            self.add_log_line(f"  📦 {pod}")
+                            lines.append(f"  📦 {pod}")
                     else:
-                        self.add_log_line(f"⚠️ No {service_type} operator pods found running")
-                        self.add_log_line(f"💡 Deletion cleanup may need to be done manually")
+                        lines.append(f"⚠️ No {service_type} operator pods found running")
+                        lines.append(f"💡 Deletion cleanup may need to be done manually")
                         
-            except subprocess.TimeoutExpired:
-                self.add_log_line(f"⏰ Operator pod check timed out")
             except Exception as e:
-                self.add_log_line(f"❌ Error checking operator pods: {e}")
+                lines.append(f"❌ Error checking operator pods: {e}")
         
         # Check for recent events related to the deletion
-        self.add_log_line(f"📰 Checking for recent deletion events...")
+        lines.append(f"📰 Checking for recent deletion events...")
         try:
-            result = subprocess.run([
-                'kubectl', 'get', 'events', '--sort-by=.lastTimestamp', 
+            result = self._report_kubectl([
+                'get', 'events', '--sort-by=.lastTimestamp', 
                 '--field-selector=reason=Killing,reason=Deleted,reason=SuccessfulDelete',
                 '-o', 'custom-columns=TIME:.lastTimestamp,REASON:.reason,MESSAGE:.message',
                 '--no-headers'
-            ], capture_output=True, text=True, timeout=5)
+            ], 5, lines)
             
             if result.returncode == 0 and result.stdout.strip():
                 events = result.stdout.strip().split('\n')[-3:]  # Last 3 events
-                self.add_log_line(f"📋 Recent deletion events:")
+                lines.append(f"📋 Recent deletion events:")
                 for event in events:
                     if event.strip():
-                        self.add_log_line(f"  🔔 {event}")
+                        lines.append(f"  🔔 {event}")
             else:
-                self.add_log_line(f"📭 No recent deletion events found")
+                lines.append(f"📭 No recent deletion events found")
                 
-        except subprocess.TimeoutExpired:
-            self.add_log_line(f"⏰ Event check timed out")
         except Exception as e:
-            self.add_log_line(f"❌ Error checking events: {e}")
+            lines.append(f"❌ Error checking events: {e}")
         
         # Show next expected actions
-        self.add_log_line(f"🎯 Expected next actions:")
+        lines.append(f"🎯 Expected next actions:")
         if service_type == 'redhatvm':
-            self.add_log_line(f"  🖥️ VM termination and cleanup")
-            self.add_log_line(f"  💾 Storage volume cleanup")
-            self.add_log_line(f"  🔐 Secret cleanup")
+            lines.append(f"  🖥️ VM termination and cleanup")
+            lines.append(f"  💾 Storage volume cleanup")
+            lines.append(f"  🔐 Secret cleanup")
         elif service_type == 'windowsvm':
-            self.add_log_line(f"  🪟 Windows VM shutdown")
-            self.add_log_line(f"  💾 Disk cleanup")
+            lines.append(f"  🪟 Windows VM shutdown")
+            lines.append(f"  💾 Disk cleanup")
         elif service_type == 'mssql':
-            self.add_log_line(f"  🗄️ Database instance termination")
-            self.add_log_line(f"  💾 Persistent volume cleanup")
+            lines.append(f"  🗄️ Database instance termination")
+            lines.append(f"  💾 Persistent volume cleanup")
         
-        self.add_log_line(f"⏳ Operator should pick up deletion within 30 seconds...")
+        lines.append(f"⏳ Operator should pick up deletion within 30 seconds...")
+        return lines
+
+    def _report_kubectl(self, args, timeout, lines):
+        """_kubectl_result for report workers: a timeout is noted in lines instead of the log"""
+        result = self._kubectl_result(args, timeout)
+        if result.returncode == KUBECTL_TIMED_OUT:
+            lines.append(f"⏰ kubectl {args[0]} timed out after {timeout}s")
+        return result
+
+    def _report_async(self, worker, *args):
+        """Run worker(*args) on the worker pool and log the lines it returns on the UI thread"""
+        future = self._apply_pool.submit(worker, *args)
+        future.add_done_callback(lambda f: self._call_in_ui(self._report_finished, f))
+
+    def _report_finished(self, future):
+        """_report_async completion, on the UI thread"""
+        try:
+            lines = future.result()
+        except Exception as e:
+            self.add_log_line(f"❌ Status check failed: {e}")
+            return
+        self.add_log_lines(lines)
 
     def trigger_post_delete_cleanup(self, cr_file, cr_path):
         """Pickup mechanism to handle post-deletion cleanup actions"""
@@ -918,54 +1441,54 @@ class KubernetesCRDTUI:
 
     def cleanup_vm_resources(self, cr_file):
         """Cleanup VM-specific resources after CR deletion"""
-        import subprocess
         self.add_log_line(f"🖥️ Cleaning up VM resources for {cr_file}...")
         
-        # Check for running VMs that might be orphaned with timeout
-        try:
-            self.add_log_line("🔍 Checking for running VMs (with 5s timeout)...")
-            result = subprocess.run(['kubectl', 'get', 'vmi', '-o', 'json'], 
-                                  capture_output=True, text=True, timeout=5)
-            if result.returncode == 0:
-                import json
-                vmis = json.loads(result.stdout)
-                vm_count = len(vmis.get('items', []))
-                self.add_log_line(f"📊 Found {vm_count} running VMs in cluster")
-            else:
-                self.add_log_line("⚠️ Could not check for running VMs (KubeVirt may not be installed)")
-        except subprocess.TimeoutExpired:
-            self.add_log_line(f"⏰ VM check timed out - skipping VM cleanup check")
-        except Exception as e:
-            self.add_log_line(f"⚠️ VM cleanup check failed: {e}")
+        # Check for running VMs that might be orphaned; the lookup runs on the
+        # worker pool so it overlaps the status refresh and operator checks
+        # that follow instead of adding its timeout to theirs
+        self.add_log_line("🔍 Checking for running VMs (with 5s timeout)...")
+        self._run_kubectl_async(['get', 'vmi', '--no-headers', '-o', 'name'],
+                                partial(self._on_vmi_checked, cr_file), timeout=5)
+    
+    def _on_vmi_checked(self, cr_file, result):
+        """cleanup_vm_resources completion, on the UI thread"""
+        if result.returncode == 0:
+            # One resource name per line, so counting needs no JSON parse
+            vm_count = len(result.stdout.splitlines())
+            self.add_log_line(f"📊 Found {vm_count} running VMs in cluster")
+        else:
+            self.add_log_line("⚠️ Could not check for running VMs (KubeVirt may not be installed)")
         
         self.add_log_line(f"✅ VM cleanup completed for {cr_file}")
 
     def force_remove_finalizers(self, cr_name, cr_type="redhatvm"):
         """Force remove finalizers from stuck CRs"""
-        import subprocess
         self.add_log_line(f"🔧 Attempting to force remove finalizers from {cr_name}...")
         
         try:
             # Remove finalizers by patching the resource
             patch_cmd = [
-                'kubectl', 'patch', cr_type, cr_name, 
+                'patch', cr_type, cr_name, 
                 '--type=merge', 
                 '-p={"metadata":{"finalizers":[]}}'
             ]
-            result = subprocess.run(patch_cmd, capture_output=True, text=True, timeout=10)
+            result = self._run_kubectl(patch_cmd, timeout=10, capture_stdout=False)
             if result.returncode == 0:
                 self.add_log_line(f"✅ Successfully removed finalizers from {cr_name}")
             else:
                 self.add_log_line(f"❌ Failed to remove finalizers: {result.stderr}")
-        except subprocess.TimeoutExpired:
-            self.add_log_line(f"⏰ Finalizer removal timed out for {cr_name}")
         except Exception as e:
             self.add_log_line(f"❌ Error removing finalizers: {e}")
 
     def check_operator_final_status(self, cr_file):
         """Final check of operator status after deletion"""
-        import subprocess
         self.add_log_line(f"🎭 === OPERATOR FINAL STATUS CHECK ===")
+        # Like monitor_operator_deletion_activity, the kubectl checks run off the UI thread
+        self._report_async(self._operator_final_status_report, cr_file)
+
+    def _operator_final_status_report(self, cr_file):
+        """check_operator_final_status checks, off the UI thread; returns the log lines"""
+        lines = []
         
         # Determine service type
         service_type = None
@@ -978,55 +1501,52 @@ class KubernetesCRDTUI:
         
         if service_type:
             # Check if any related resources still exist
-            self.add_log_line(f"🔍 Checking for remaining {service_type} resources...")
+            lines.append(f"🔍 Checking for remaining {service_type} resources...")
             
             try:
                 # Check for CRs of this type
                 resource_name = f"{service_type}s" if service_type != 'mssql' else 'mssqlservers'
-                result = subprocess.run([
-                    'kubectl', 'get', resource_name, '-o', 'name'
-                ], capture_output=True, text=True, timeout=5)
+                result = self._report_kubectl([
+                    'get', resource_name, '-o', 'name'
+                ], 5, lines)
                 
                 if result.returncode == 0 and result.stdout.strip():
                     remaining = result.stdout.strip().split('\n')
-                    self.add_log_line(f"📋 Found {len(remaining)} remaining {service_type} resource(s)")
+                    lines.append(f"📋 Found {len(remaining)} remaining {service_type} resource(s)")
                     for resource in remaining[:3]:  # Show first 3
-                        self.add_log_line(f"  🔸 {resource}")
+                        lines.append(f"  🔸 {resource}")
                 else:
-                    self.add_log_line(f"✅ No remaining {service_type} resources found")
+                    lines.append(f"✅ No remaining {service_type} resources found")
                     
-            except subprocess.TimeoutExpired:
-                self.add_log_line(f"⏰ Resource check timed out")
             except Exception as e:
-                self.add_log_line(f"⚠️ Could not check remaining resources: {e}")
+                lines.append(f"⚠️ Could not check remaining resources: {e}")
         
         # Check for any deletion-related logs in operator pods
-        self.add_log_line(f"📋 Checking operator logs for deletion confirmation...")
+        lines.append(f"📋 Checking operator logs for deletion confirmation...")
         try:
-            result = subprocess.run([
-                'kubectl', 'logs', '-l', 'app.kubernetes.io/name=kopf',
+            result = self._report_kubectl([
+                'logs', '-l', 'app.kubernetes.io/name=kopf',
                 '--tail=5', '--since=30s'
-            ], capture_output=True, text=True, timeout=5)
+            ], 5, lines)
             
             if result.returncode == 0 and result.stdout.strip():
                 logs = result.stdout.strip().split('\n')
                 deletion_logs = [log for log in logs if 'delet' in log.lower() or 'remov' in log.lower()]
                 if deletion_logs:
-                    self.add_log_line(f"📰 Recent operator deletion activity:")
+                    lines.append(f"📰 Recent operator deletion activity:")
                     for log in deletion_logs[-2:]:  # Last 2 deletion logs
-                        self.add_log_line(f"  📄 {log}")
+                        lines.append(f"  📄 {log}")
                 else:
-                    self.add_log_line(f"📭 No recent deletion activity in operator logs")
+                    lines.append(f"📭 No recent deletion activity in operator logs")
             else:
-                self.add_log_line(f"⚠️ Could not retrieve operator logs")
+                lines.append(f"⚠️ Could not retrieve operator logs")
                 
-        except subprocess.TimeoutExpired:
-            self.add_log_line(f"⏰ Operator log check timed out")
         except Exception as e:
-            self.add_log_line(f"⚠️ Error checking operator logs: {e}")
+            lines.append(f"⚠️ Error checking operator logs: {e}")
         
-        self.add_log_line(f"🏁 Operator monitoring completed for {cr_file}")
-        self.add_log_line(f"═══════════════════════════════════════════════════")
+        lines.append(f"🏁 Operator monitoring completed for {cr_file}")
+        lines.append(f"═══════════════════════════════════════════════════")
+        return lines
 
     def cleanup_mssql_resources(self, cr_file):
         """Cleanup MSSQL-specific resources after CR deletion"""
@@ -1042,89 +1562,9 @@ class KubernetesCRDTUI:
         self.add_log_line("📈 Checking for collector pods...")
         self.add_log_line("⚙️ Checking for configuration...")
     
-    def handle_dynamic_delete_selection(self, service_key):
-        folder = str(MANIFEST_DIR)
-        if not os.path.exists(folder):
-            self.add_log_line(f"❌ manifest-controller folder not found: {folder}")
-            return
-
-        files = os.listdir(folder)
-        cr_files = [f for f in files if f.endswith('.yaml') and 'crd' not in f.lower()]
-
-        if not cr_files:
-            self.add_log_line("❌ No CR files found in manifest-controller folder")
-            return
-
-        def handle_cr_delete_selection(cr_name, cr_path):
-            import subprocess
-            self.add_log_line(f"🗑️ Deleting CR: {cr_name}...")
-
-            result = subprocess.run(['kubectl', 'delete', '-f', cr_path], capture_output=True, text=True)
-            if result.returncode == 0:
-                self.add_log_line(f"✅ CR deleted successfully: {cr_name}")
-            else:
-                err = result.stderr
-                if 'NotFound' in err and 'error when deleting' in err:
-                    self.add_log_line(f"⚠️ CR not found in cluster (already deleted): {cr_name}")
-                elif 'CRD' in err and 'not found' in err:
-                    self.add_log_line(f"⚠️ CRD not found for {cr_name}, but that's expected if CRDs aren't deployed")
-                else:
-                    self.add_log_line(f"❌ Failed to delete CR {cr_name}: {err}")
-
-        # Custom button class for ESC handling - same pattern as CRDButton
-        class CRButton(urwid.Button):
-            def __init__(self, label, cr_name, cr_path, callback, tui_instance):
-                super().__init__(label)
-                self.cr_name = cr_name
-                self.cr_path = cr_path
-                self.callback = callback
-                self.tui = tui_instance
-
-            def keypress(self, size, key):
-                if key in ('enter', ' '):
-                    self.tui.close_popup()
-                    self.callback(self.cr_name, self.cr_path)
-                    return
-                if key == 'esc' or key == 'escape':
-                    self.tui.close_popup()
-                    self.tui.menu_state = None
-                    self.tui.popup_listbox = None
-                    self.tui.reset_menu_state()
-                    return
-                return super().keypress(size, key)
-
-        menu_items = []
-        for cr_file in cr_files:
-            cr_path = os.path.join(folder, cr_file)
-            btn = CRButton(f"CR: {cr_file}", cr_file, cr_path, handle_cr_delete_selection, self)
-            menu_items.append(urwid.AttrMap(btn, 'button', 'button_focus'))
-
-        walker = urwid.SimpleFocusListWalker(menu_items)
-        listbox = urwid.ListBox(walker)
-        popup_content = urwid.Pile([
-            urwid.Text(('header', 'Delete CRs - Select to Delete'), align='center'),
-            urwid.Divider(),
-            urwid.BoxAdapter(listbox, height=len(menu_items) + 2),
-            urwid.Divider(),
-            urwid.Text("Use ↑↓ arrows and Enter to delete, ESC to cancel", align='center')
-        ])
-        dialog = urwid.LineBox(popup_content, title="Delete CRs")
-        overlay = urwid.Overlay(
-            dialog,
-            self.main_frame,
-            align='center',
-            width=60,
-            valign='middle',
-            height=len(menu_items) + 8
-        )
-        self.original_widget = self.loop.widget
-        self.loop.widget = overlay
-        self.menu_state = 'cr_delete_popup'
-        self.popup_listbox = listbox
-    
     def handle_dynamic_delete_selection(self, service_key):
         """Handle dynamically discovered service selection for delete (COPY OF APPLY VERSION)"""
-        if not hasattr(self, 'dynamic_service_categories') or not hasattr(self, 'dynamic_service_options'):
+        if self.dynamic_service_categories is None or self.dynamic_service_options is None:
             self.add_log_line("❌ No dynamic service data available")
             return
         
@@ -1175,7 +1615,6 @@ class KubernetesCRDTUI:
     
     def execute_dynamic_cr_delete(self, cr_name, cr_info):
         """Execute CR deletion for dynamically discovered CR"""
-        import os
         self.add_log_line(f"�️ Deleting {cr_name} from {cr_info['file']}...")
         
         try:
@@ -1184,20 +1623,21 @@ class KubernetesCRDTUI:
                 self.add_log_line(f"❌ CR file not found: {cr_file_path}")
                 return
             
-            # Delete the CR from cluster
-            import subprocess
-            result = subprocess.run(['kubectl', 'delete', '-f', cr_file_path], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                self.add_log_line(f"✅ Custom Resource deleted successfully: {cr_info['file']}")
-            else:
-                err = result.stderr
-                if 'NotFound' in err and 'error when deleting' in err:
-                    self.add_log_line(f"⚠️ CR not found in cluster (already deleted or never applied): {cr_name}")
-                elif 'CRD' in err and 'not found' in err:
-                    self.add_log_line(f"⚠️ CRD not found for {cr_name}, but that's expected if CRDs aren't deployed")
+            def report(result):
+                if result.returncode == 0:
+                    self._invalidate_status_cache()
+                    self.add_log_line(f"✅ Custom Resource deleted successfully: {cr_info['file']}")
                 else:
-                    self.add_log_line(f"❌ Failed to delete CR {cr_name}: {err}")
+                    err = result.stderr
+                    if 'NotFound' in err and 'error when deleting' in err:
+                        self.add_log_line(f"⚠️ CR not found in cluster (already deleted or never applied): {cr_name}")
+                    elif 'CRD' in err and 'not found' in err:
+                        self.add_log_line(f"⚠️ CRD not found for {cr_name}, but that's expected if CRDs aren't deployed")
+                    else:
+                        self.add_log_line(f"❌ Failed to delete CR {cr_name}: {err}")
+            
+            # Delete the CR from cluster on the worker pool; report runs on the UI thread
+            self._run_kubectl_async(['delete', '-f', cr_file_path], report, capture_stdout=False)
                     
         except Exception as e:
             self.add_log_line(f"❌ Deletion failed for {cr_name}: {str(e)}")
@@ -1209,174 +1649,133 @@ class KubernetesCRDTUI:
         if not options:
             return
             
-        # Create universal button class that handles all cases
-        class UniversalButton(urwid.Button):
-            def __init__(self, label, option_data, callback, tui_instance):
-                super().__init__(label)
-                self.option_data = option_data  # Can be any data structure
-                self.callback = callback
-                self.tui = tui_instance
-                
-            def keypress(self, size, key):
-                if key in ('enter', ' '):
-                    self.tui.add_log_line(f"🔥 UniversalButton ENTER: {type(self.option_data)} = {self.option_data}")
-                    self.tui.close_popup()
-                    # Call callback with the stored option data
-                    if isinstance(self.option_data, tuple):
-                        # Unpack tuple data (for CR/CRD cases)
-                        self.tui.add_log_line(f"🔥 Calling callback with tuple: {self.option_data}")
-                        self.callback(*self.option_data)
-                    else:
-                        # Single value (for service cases)
-                        self.tui.add_log_line(f"🔥 Calling callback with single value: {self.option_data}")
-                        self.callback(self.option_data)
-                    return None
-                    
-                if key in ('esc', 'escape'):
-                    self.tui.close_popup()
-                    self.tui.menu_state = None
-                    self.tui.popup_listbox = None
-                    self.tui.reset_menu_state()
-                    return None
-                    
-                return super().keypress(size, key)
-        
-        # Create menu items
-        menu_items = []
-        for option in options:
-            if isinstance(option, tuple) and len(option) >= 3:
-                # CR/CRD format: (name, data, status) or (key, title, icon, description)
-                if len(option) == 4:
-                    # Service format: (key, title, icon, description)
-                    key, title, icon, description = option
-                    button_text = f"{icon} {title}\n   {description}"
-                    option_data = key
-                else:
-                    # CR/CRD format: (name, data, status)
-                    name, data, status = option
-                    # Determine icon based on status
-                    if "Ready" in status:
-                        icon = "✅"
-                    elif "Already" in status or "Deployed" in status:
-                        icon = "🔄"
-                    elif "Unknown" in status:
-                        icon = "🔴"
-                    elif "Disabled" in status:
-                        icon = "⏸️"
-                    else:
-                        icon = "📝"
-                    button_text = f"{icon} {name}\n   {status}"
-                    option_data = (name, data, status)
-            else:
-                # Simple string option
-                button_text = str(option)
-                option_data = option
-            
-            button = UniversalButton(button_text, option_data, callback, self)
-            button_widget = urwid.AttrMap(button, 'button', 'button_focus')
-            menu_items.append(button_widget)
-        
-        # Create listbox
-        menu_walker = urwid.SimpleListWalker(menu_items)
-        menu_listbox = urwid.ListBox(menu_walker)
-        if len(menu_walker) > 0:
-            menu_listbox.focus_position = 0
-        
-        # Derive a one-line subtitle for the popup body without repeating the frame title
-        subtitle_text = title
-        if ' - ' in title:
-            subtitle_text = title.split(' - ', 1)[1].strip()
-        elif ':' in title:
-            subtitle_text = title.split(':', 1)[1].strip()
-        subtitle_text = subtitle_text if subtitle_text and subtitle_text != title else 'Select an option'
-
-        # Create popup content
-        popup_content = urwid.Pile([
-            urwid.Text(('popup_title', f"🔽 {subtitle_text}"), align='center'),
-            urwid.Divider('─'),
-            urwid.BoxAdapter(menu_listbox, height=min(len(menu_items), 8)),
-            urwid.Divider('─'),
-            urwid.Text("↑↓: Navigate, Enter: Select, ESC: Cancel", align='center')
-        ])
-        
-        popup_box = urwid.AttrMap(urwid.LineBox(popup_content, title=title), 'popup')
-        
-        # Center the popup
-        overlay = urwid.Overlay(
-            popup_box,
-            self.main_frame,
-            align='center', width=60,
-            valign='middle', height=min(len(menu_items) + 8, 16)
-        )
+        # Rows are built as the listbox scrolls them into view
+        menu_walker = _LazyListWalker(options, lambda option: self._unified_option_widget(option, callback))
+        
+        # Like the service popup, the frame only depends on the title and the
+        # visible row count, so a matching one is reopened with the new rows
+        list_height = min(len(options), 8)
+        shell_key = ('unified', title, list_height)
+        shell = self._popup_shells.pop(shell_key, None)
+        if shell is not None:
+            overlay, menu_listbox = shell
+            menu_listbox.body = menu_walker
+        else:
+            menu_listbox = urwid.ListBox(menu_walker)
+            
+            # Derive a one-line subtitle for the popup body without repeating the frame title
+            subtitle_text = title
+            if ' - ' in title:
+                subtitle_text = title.split(' - ', 1)[1].strip()
+            elif ':' in title:
+                subtitle_text = title.split(':', 1)[1].strip()
+            subtitle_text = subtitle_text if subtitle_text and subtitle_text != title else 'Select an option'
+
+            # Create popup content
+            popup_content = urwid.Pile([
+                urwid.Text(('popup_title', f"🔽 {subtitle_text}"), align='center'),
+                urwid.Divider('─'),
+                urwid.BoxAdapter(menu_listbox, height=list_height),
+                urwid.Divider('─'),
+                urwid.Text("↑↓: Navigate, Enter: Select, ESC: Cancel", align='center')
+            ])
+            
+            popup_box = urwid.AttrMap(urwid.LineBox(popup_content, title=title), 'popup')
+            
+            # Center the popup
+            overlay = urwid.Overlay(
+                popup_box,
+                self.main_frame,
+                align='center', width=60,
+                valign='middle', height=list_height + 8
+            )
+        self._popup_shells[shell_key] = (overlay, menu_listbox)
+        if len(self._popup_shells) > self._POPUP_SHELL_LIMIT:
+            del self._popup_shells[next(iter(self._popup_shells))]
         
         self.popup = overlay
         self.popup_callback = callback
         self.popup_listbox = menu_listbox
         
         # Store original widget
-        if not hasattr(self, 'original_widget') or not self.original_widget:
+        if self.original_widget is None:
             self.original_widget = self.loop.widget
         
         self.menu_state = 'unified_popup'
         self.loop.widget = overlay
     
+    def _unified_option_widget(self, option, callback):
+        """Build the button row of show_unified_selection_popup for one option"""
+        if isinstance(option, tuple) and len(option) >= 3:
+            # CR/CRD format: (name, data, status) or (key, title, icon, description)
+            if len(option) == 4:
+                # Service format: (key, title, icon, description)
+                key, title, icon, description = option
+                button_text = f"{icon} {title}\n   {description}"
+                option_data = key
+            else:
+                # CR/CRD format: (name, data, status)
+                name, data, status = option
+                button_text = f"{_option_status_icon(status)} {name}\n   {status}"
+                option_data = (name, data, status)
+        else:
+            # Simple string option
+            button_text = str(option)
+            option_data = option
+        
+        button = UniversalButton(button_text, option_data, callback, self)
+        return urwid.AttrMap(button, 'button', 'button_focus')
+    
     def show_service_selection_popup(self, action_title, service_options, callback):
         """Show a central popup window for service selection with arrow key navigation"""
         try:
-            # Custom button class for ESC handling
-            class ServiceButton(urwid.Button):
-                def __init__(self, label, option_key, callback, tui_instance):
-                    super().__init__(label)
-                    self.option_key = option_key
-                    self.callback = callback
-                    self.tui = tui_instance
-                def keypress(self, size, key):
-                    if key in ('enter', ' '):
-                        self.tui.close_popup()
-                        self.callback(self.option_key)
-                        return
-                    if key == 'esc' or key == 'escape':
-                        self.tui.close_popup()
-                        self.tui.menu_state = None
-                        self.tui.popup_listbox = None
-                        self.tui.reset_menu_state()
-                        return
-                    return super().keypress(size, key)
-
-            # Create selectable menu items using ServiceButton
-            menu_items = []
-            for key, title, icon, description in service_options:
-                button_text = f"{icon} {title}\n   {description}"
-                button = ServiceButton(button_text, key, callback, self)
-                button.key = key
-                styled_button = urwid.AttrMap(button, 'menu', 'menu_focus')
-                menu_items.append(styled_button)
-            walker = urwid.SimpleFocusListWalker(menu_items)
-            listbox = urwid.ListBox(walker)
-            
-            # Create popup content with title and instructions
-            popup_content = urwid.Pile([
-                urwid.Text(('header', f'🎯 {action_title} - SELECT SERVICE'), align='center'),
-                urwid.Divider(),
-                urwid.Text("Available Services:", align='center'),
-                urwid.Divider(),
-                urwid.BoxAdapter(listbox, height=len(service_options) * 3 + 2),
-                urwid.Divider(),
-                urwid.Text("Use ↑↓ arrows and Enter to select, ESC to cancel", align='center')
-            ])
-            
-            # Create dialog box
-            dialog = urwid.LineBox(popup_content, title=f"📋 {action_title}")
-            
-            # Create overlay - centered popup
-            self.selection_overlay = urwid.Overlay(
-                dialog,
-                self.main_frame,
-                align='center',
-                width=60,
-                valign='middle', 
-                height=len(service_options) * 3 + 10
-            )
+            # Selectable ServiceButton rows, built as the listbox reaches them
+            def service_row(option):
+                key, title, icon, description = option
+                button = ServiceButton(f"{icon} {title}\n   {description}", key, callback, self)
+                return urwid.AttrMap(button, 'menu', 'menu_focus')
+            walker = _LazyListWalker(service_options, service_row)
+            
+            # The dialog frame only depends on the title and row count, so it
+            # is kept and reopened with fresh rows instead of rebuilt
+            shell_key = (action_title, len(service_options))
+            shell = self._popup_shells.pop(shell_key, None)
+            if shell is not None:
+                overlay, listbox = shell
+                listbox.body = walker
+            else:
+                listbox = urwid.ListBox(walker)
+                overlay_height, list_height = (_SERVICE_POPUP_HEIGHTS.get(len(service_options))
+                                               or _service_popup_heights(len(service_options)))
+                
+                # Create popup content with title and instructions
+                popup_content = urwid.Pile([
+                    urwid.Text(('header', f'🎯 {action_title} - SELECT SERVICE'), align='center'),
+                    urwid.Divider(),
+                    urwid.Text("Available Services:", align='center'),
+                    urwid.Divider(),
+                    urwid.BoxAdapter(listbox, height=list_height),
+                    urwid.Divider(),
+                    urwid.Text("Use ↑↓ arrows and Enter to select, ESC to cancel", align='center')
+                ])
+                
+                # Create dialog box
+                dialog = urwid.LineBox(popup_content, title=f"📋 {action_title}")
+                
+                # Create overlay - centered popup
+                overlay = urwid.Overlay(
+                    dialog,
+                    self.main_frame,
+                    align='center',
+                    width=60,
+                    valign='middle', 
+                    height=overlay_height
+                )
+            # Most recently used last; drop the oldest beyond the limit
+            self._popup_shells[shell_key] = (overlay, listbox)
+            if len(self._popup_shells) > self._POPUP_SHELL_LIMIT:
+                del self._popup_shells[next(iter(self._popup_shells))]
+            self.selection_overlay = overlay
             
             # Store original widget and callback
             self.original_widget = self.loop.widget
@@ -1396,7 +1795,7 @@ class KubernetesCRDTUI:
     
     def close_popup(self):
         """Close the current popup and return to main interface"""
-        if hasattr(self, 'original_widget') and self.original_widget and hasattr(self, 'loop'):
+        if self.original_widget is not None and self.loop:
             self.add_log_line("🚪 Closing popup and returning to main interface")
             self.loop.widget = self.original_widget
             self.original_widget = None
@@ -1410,7 +1809,7 @@ class KubernetesCRDTUI:
     
     def handle_dynamic_install_selection(self, service_key):
         """Handle dynamically discovered service selection for install"""
-        if not hasattr(self, 'dynamic_service_categories') or not hasattr(self, 'dynamic_service_options'):
+        if self.dynamic_service_categories is None or self.dynamic_service_options is None:
             self.add_log_line("❌ No dynamic service data available")
             return
         
@@ -1461,7 +1860,6 @@ class KubernetesCRDTUI:
     
     def execute_dynamic_cr_install(self, cr_name, cr_info):
         """Execute CR installation for dynamically discovered CR"""
-        import os
         self.add_log_line(f"🚀 Installing {cr_name} from {cr_info['file']}...")
         
         try:
@@ -1470,17 +1868,17 @@ class KubernetesCRDTUI:
                 self.add_log_line(f"❌ CR file not found: {cr_file_path}")
                 return
             
-            # Apply the CR file directly
-            import subprocess
-            result = subprocess.run(['kubectl', 'apply', '-f', cr_file_path], capture_output=True, text=True)
+            def report(error):
+                if error is None:
+                    self._invalidate_status_cache()
+                    self.add_log_line(f"✅ Custom Resource applied successfully: {cr_info['file']}")
+                    self.add_log_line(f"⏳ Waiting for operator to process CR and run playbook...")
+                    self.add_log_line(f"💡 Kind: {cr_info['kind']} | Name: {cr_name}")
+                else:
+                    self.add_log_line(f"❌ Failed to apply CR {cr_name}: {error}")
             
-            if result.returncode == 0:
-                self.add_log_line(f"✅ Custom Resource applied successfully: {cr_info['file']}")
-                self.add_log_line(f"⏳ Waiting for operator to process CR and run playbook...")
-                self.add_log_line(f"💡 Kind: {cr_info['kind']} | Name: {cr_name}")
-            else:
-                self.add_log_line(f"❌ Failed to apply CR {cr_name}: {result.stderr}")
-                
+            # Apply the CR file in-process on the worker pool
+            self._apply_manifest_async(cr_file_path, report)
         except Exception as e:
             self.add_log_line(f"❌ Installation failed for {cr_name}: {str(e)}")
         
@@ -1488,151 +1886,106 @@ class KubernetesCRDTUI:
     
     def handle_uninstall_selection(self, service_key):
         """Handle uninstall service selection"""
-        service_map = {
-            '1': ('vms', 'Virtual Machines'),
-            '2': ('mssql', 'MSSQL Services'), 
-            '3': ('otel', 'OpenTelemetry Services')
-        }
-        
-        if service_key in service_map:
-            service_type, service_name = service_map[service_key]
+        if service_key in _UNINSTALL_SERVICE_CHOICES:
+            service_type, service_name = _UNINSTALL_SERVICE_CHOICES[service_key]
             self.add_log_line(f"🗑️ Selected: Uninstall {service_name}")
             # Go directly to CR selection for uninstall
             self.show_cr_selection_for_uninstall(service_type, service_name)
     
+    def _show_cr_selection(self, title, service_type, service_name, source_key, row_label,
+                           callback, status_filter=None, allow_batch=False, empty_hints=()):
+        """Offer the local_crs/deployed_crs (source_key) of a service in a selection popup
+        
+        row_label(cr_data, phase) gives each row's status column and
+        status_filter(phase), if set, drops rows; phase is None for local CRs.
+        With allow_batch, a leading entry carries every listed (name, cr_data)
+        pair and callback receives that list as cr_data.
+        """
+        if not self._status_fresh():
+            # Keep the UI responsive while the cluster is queried; the popup
+            # opens when the report arrives
+            self._fetch_status_then(lambda: self._show_cr_selection(
+                title, service_type, service_name, source_key, row_label, callback,
+                status_filter=status_filter, allow_batch=allow_batch, empty_hints=empty_hints))
+            return
+        where = 'local' if source_key == 'local_crs' else 'deployed'
+        try:
+            status_report = self._cached_status()
+            service_key = _SERVICE_KEY_MAP.get(service_type)
+            if not service_key or service_key not in status_report:
+                self.add_log_line(f"❌ Service type {service_type} not supported or no data available")
+                return
+            if source_key == 'deployed_crs':
+                entries = self._deployed_phases(service_type)
+            else:
+                entries = [(name, cr_data, None)
+                           for name, cr_data in status_report[service_key].get(source_key, {}).items()]
+            rows = [(name, cr_data, row_label(cr_data, phase)) for name, cr_data, phase in entries
+                    if status_filter is None or status_filter(phase)]
+            if not rows:
+                self.add_log_line(f"❌ No {where} {service_name} CRs found")
+                for hint in empty_hints:
+                    self.add_log_line(hint)
+                return
+            if allow_batch and len(rows) > 1:
+                # Apply-all entry: every listed CR in one batch pass
+                all_entries = [(name, cr_data) for name, cr_data, _status in rows]
+                rows.insert(0, (f"All {where} CRs", all_entries, f"Batch apply {len(all_entries)} CRs"))
+            self.show_unified_selection_popup(f"{title} {service_name} CR", rows, callback)
+        except Exception as e:
+            self.add_log_line(f"❌ Error loading {where} CRs: {e}")
+    
     def show_cr_selection_for_install(self, service_type, service_name):
         """Show available CRs for installation using popup menu"""
         self.add_log_line(f"📋 Loading {service_name} CRs for installation...")
         
-        try:
-            status_report = self.service_manager.get_comprehensive_status()
-            service_map = {
-                'vms': 'windowsvms',
-                'mssql': 'mssqlservers',
-                'otel': 'otelcollectors'
-            }
-            
-            service_key = service_map.get(service_type)
-            if service_key and service_key in status_report:
-                service_data = status_report[service_key]
-                local_crs = service_data.get('local_crs', {})
-                deployed_crs = service_data.get('deployed_crs', {})
-                
-                if local_crs:
-                    crs_to_show = []
-                    for name, cr_data in local_crs.items():
-                        status_text = "Ready to Install"
-                        crs_to_show.append((name, cr_data, status_text))
-                    def handle_cr_install_selection(cr_name, cr_data):
-                        self.add_log_line(f"🎯 handle_cr_install_selection called with CR: {cr_name}")
-                        self.execute_cr_install(service_type, service_name, cr_name, cr_data)
-                    self.show_unified_selection_popup(
-                        f"Install {service_name} CR",
-                        crs_to_show,
-                        handle_cr_install_selection
-                    )
-                else:
-                    self.add_log_line(f"❌ No local {service_name} CRs found")
-                    self.add_log_line("💡 Create CR files first or check manifest-controller directory")
-            else:
-                self.add_log_line(f"❌ Service type {service_type} not supported or no data available")
-                
-        except Exception as e:
-            self.add_log_line(f"❌ Error loading CRs: {e}")
+        def handle_cr_install_selection(cr_name, cr_data, _status=None):
+            self.add_log_line(f"🎯 handle_cr_install_selection called with CR: {cr_name}")
+            self.execute_cr_install(service_type, service_name, cr_name, cr_data)
+        
+        self._show_cr_selection(
+            "Install", service_type, service_name, 'local_crs',
+            lambda cr_data, _phase: "Ready to Install",
+            handle_cr_install_selection,
+            empty_hints=("💡 Create CR files first or check manifest-controller directory",)
+        )
     
     def show_cr_selection_for_uninstall(self, service_type, service_name):
         """Show deployed CRs for uninstallation using popup menu"""
         self.add_log_line(f"📋 Loading deployed {service_name} CRs for uninstallation...")
         
-        try:
-            status_report = self.service_manager.get_comprehensive_status()
-            service_map = {
-                'vms': 'windowsvms',
-                'mssql': 'mssqlservers',
-                'otel': 'otelcollectors'
-            }
-            
-            service_key = service_map.get(service_type)
-            if service_key and service_key in status_report:
-                service_data = status_report[service_key]
-                deployed_crs = service_data.get('deployed_crs', {})
-                
-                if deployed_crs:
-                    uninstallable_crs = []
-                    for name, cr_data in deployed_crs.items():
-                        status = cr_data.get('status', {}).get('phase', 'Unknown')
-                        if status == 'Ready' or status == 'Failed' or status == 'Unknown':
-                            status_text = f"Status: {status}"
-                            uninstallable_crs.append((name, cr_data, status_text))
-                    if uninstallable_crs:
-                        def handle_cr_uninstall_selection(cr_name, cr_data):
-                            self.execute_cr_uninstall(service_type, service_name, cr_name, cr_data)
-                        self.show_unified_selection_popup(
-                            f"Uninstall {service_name} CR", 
-                            uninstallable_crs, 
-                            handle_cr_uninstall_selection
-                        )
-                    else:
-                        self.add_log_line(f"❌ No deployed {service_name} CRs found")
-                else:
-                    self.add_log_line(f"❌ No deployed {service_name} CRs found")
-            else:
-                self.add_log_line(f"❌ Service type {service_type} not supported or no data available")
-                
-        except Exception as e:
-            self.add_log_line(f"❌ Error loading deployed CRs: {e}")
+        def handle_cr_uninstall_selection(cr_name, cr_data, _status=None):
+            self.execute_cr_uninstall(service_type, service_name, cr_name, cr_data)
+        
+        self._show_cr_selection(
+            "Uninstall", service_type, service_name, 'deployed_crs',
+            lambda cr_data, phase: f"Status: {phase}",
+            handle_cr_uninstall_selection,
+            status_filter=_UNINSTALLABLE_PHASES.__contains__
+        )
     
     def show_cr_selection_for_apply(self, service_type, service_name):
         """Show local CRs for application using popup menu"""
         self.add_log_line(f"📋 Loading {service_name} CRs for application...")
         
-        try:
-            status_report = self.service_manager.get_comprehensive_status()
-            service_map = {
-                'vms': 'windowsvms',
-                'mssql': 'mssqlservers',
-                'otel': 'otelcollectors'
-            }
-            
-            service_key = service_map.get(service_type)
-            if service_key and service_key in status_report:
-                service_data = status_report[service_key]
-                local_crs = service_data.get('local_crs', {})
-                
-                if local_crs:
-                    applicable_crs = []
-                    for name, cr_data in local_crs.items():
-                        # For apply, show all local CRs
-                        action = cr_data.get('action', 'unknown')
-                        status_text = f"Action: {action}"
-                        applicable_crs.append((name, cr_data, status_text))
-                    
-                    if applicable_crs:
-                        # Use popup for CR selection
-                        def handle_cr_apply_selection(cr_name, cr_data):
-                            """Handle CR selection for apply"""
-                            self.execute_cr_apply(service_type, service_name, cr_name, cr_data)
-                        
-                        self.show_unified_selection_popup(
-                            f"Apply {service_name} CR", 
-                            applicable_crs, 
-                            handle_cr_apply_selection
-                        )
-                    else:
-                        self.add_log_line(f"❌ No local {service_name} CRs found")
-                        self.add_log_line("💡 Create CR files first in manifest-controller directory")
-                else:
-                    self.add_log_line(f"❌ No local {service_name} CRs found")
-                    self.add_log_line("💡 Create CR files first in manifest-controller directory")
+        def handle_cr_apply_selection(cr_name, cr_data, _status=None):
+            """Handle CR selection for apply"""
+            if isinstance(cr_data, list):
+                self.execute_cr_apply_batch(service_type, service_name, cr_data)
             else:
-                self.add_log_line(f"❌ Service type {service_type} not supported or no data available")
-                
-        except Exception as e:
-            self.add_log_line(f"❌ Error loading local CRs: {e}")
+                self.execute_cr_apply(service_type, service_name, cr_name, cr_data)
+        
+        self._show_cr_selection(
+            "Apply", service_type, service_name, 'local_crs',
+            lambda cr_data, _phase: f"Action: {cr_data.get('action', 'unknown')}",
+            handle_cr_apply_selection,
+            allow_batch=True,
+            empty_hints=("💡 Create CR files first in manifest-controller directory",)
+        )
 
     def handle_dynamic_apply_selection(self, service_key):
         """Handle dynamically discovered service selection for apply"""
-        if not hasattr(self, 'dynamic_service_categories') or not hasattr(self, 'dynamic_service_options'):
+        if self.dynamic_service_categories is None or self.dynamic_service_options is None:
             self.add_log_line("❌ No dynamic service data available")
             return
         
@@ -1683,7 +2036,6 @@ class KubernetesCRDTUI:
     
     def execute_dynamic_cr_apply(self, cr_name, cr_info):
         """Execute CR application for dynamically discovered CR"""
-        import os
         self.add_log_line(f"📝 Applying {cr_name} from {cr_info['file']}...")
         
         try:
@@ -1692,16 +2044,16 @@ class KubernetesCRDTUI:
                 self.add_log_line(f"❌ CR file not found: {cr_file_path}")
                 return
             
-            # Apply the CR file directly
-            import subprocess
-            result = subprocess.run(['kubectl', 'apply', '-f', cr_file_path], capture_output=True, text=True)
+            def report(error):
+                if error is None:
+                    self._invalidate_status_cache()
+                    self.add_log_line(f"✅ Custom Resource applied successfully: {cr_info['file']}")
+                    self.add_log_line(f"⏳ Kind: {cr_info['kind']} | Name: {cr_name}")
+                else:
+                    self.add_log_line(f"❌ Failed to apply CR {cr_name}: {error}")
             
-            if result.returncode == 0:
-                self.add_log_line(f"✅ Custom Resource applied successfully: {cr_info['file']}")
-                self.add_log_line(f"⏳ Kind: {cr_info['kind']} | Name: {cr_name}")
-            else:
-                self.add_log_line(f"❌ Failed to apply CR {cr_name}: {result.stderr}")
-                
+            # Apply the CR file in-process on the worker pool
+            self._apply_manifest_async(cr_file_path, report)
         except Exception as e:
             self.add_log_line(f"❌ Application failed for {cr_name}: {str(e)}")
         
@@ -1709,26 +2061,14 @@ class KubernetesCRDTUI:
     
     def handle_delete_selection(self, service_key):
         """Handle delete CR service selection"""
-        service_map = {
-            '1': ('vms', 'Windows VM CRs'),
-            '2': ('mssql', 'MSSQL CRs'),
-            '3': ('otel', 'OpenTelemetry CRs')
-        }
-        
-        if service_key in service_map:
-            service_type, service_name = service_map[service_key]
+        if service_key in _DELETE_SERVICE_CHOICES:
+            service_type, service_name = _DELETE_SERVICE_CHOICES[service_key]
             self.add_log_line(f"🗑️ Selected: Delete {service_name}")
             self.show_delete_method_selection(service_type, service_name)
     
     def show_install_method_selection(self, service_type, service_name):
         """Show method selection for install"""
-        self.add_log_line("")
-        self.add_log_line(f"🔧 Choose Install Method for {service_name}:")
-        self.add_log_line("1️⃣ kubectl apply - Direct Kubernetes deployment") 
-        self.add_log_line("2️⃣ Ansible Playbook - Automated provisioning")
-        self.add_log_line("3️⃣ Manual CR Generation - Create files only")
-        self.add_log_line("")
-        self.add_log_line("Press 1-3 to select method...")
+        self.add_log_lines([line.format(service=service_name) for line in _INSTALL_METHOD_BANNER])
         
         self.menu_state = 'install_method_selection'
         self.selected_service_type = service_type
@@ -1736,13 +2076,7 @@ class KubernetesCRDTUI:
     
     def show_uninstall_method_selection(self, service_type, service_name):
         """Show method selection for uninstall"""
-        self.add_log_line("")
-        self.add_log_line(f"🔧 Choose Uninstall Method for {service_name}:")
-        self.add_log_line("1️⃣ kubectl delete - Remove from Kubernetes")
-        self.add_log_line("2️⃣ Ansible Cleanup - Full resource cleanup") 
-        self.add_log_line("3️⃣ CR Update to 'uninstall' - Modify existing CR")
-        self.add_log_line("")
-        self.add_log_line("Press 1-3 to select method...")
+        self.add_log_lines([line.format(service=service_name) for line in _UNINSTALL_METHOD_BANNER])
         
         self.menu_state = 'uninstall_method_selection'
         self.selected_service_type = service_type
@@ -1750,13 +2084,7 @@ class KubernetesCRDTUI:
     
     def show_delete_method_selection(self, service_type, service_name):
         """Show method selection for delete CRs"""
-        self.add_log_line("")
-        self.add_log_line(f"🔧 Choose Delete Method for {service_name}:")
-        self.add_log_line("1️⃣ kubectl delete - Remove from cluster")
-        self.add_log_line("2️⃣ Graceful shutdown - Stop services first")
-        self.add_log_line("3️⃣ Force delete - Immediate removal")
-        self.add_log_line("")
-        self.add_log_line("Press 1-3 to select method...")
+        self.add_log_lines([line.format(service=service_name) for line in _DELETE_METHOD_BANNER])
         
         self.menu_state = 'delete_method_selection'
         self.selected_service_type = service_type
@@ -1764,52 +2092,25 @@ class KubernetesCRDTUI:
     
     def show_service_selection_for_install(self):
         """Show service type selection for installation"""
-        self.add_log_line("")
-        self.add_log_line(f"Step 2: Select Service Type (Method: {self.selected_method})")
-        self.add_log_line("")
-        self.add_log_line("Available Services:")
-        self.add_log_line("1️⃣ Windows VMs - Virtual Machine deployment")
-        self.add_log_line("2️⃣ MSSQL Servers - SQL Server instances")
-        self.add_log_line("3️⃣ OpenTelemetry - Monitoring collectors")
-        self.add_log_line("")
-        self.add_log_line("Press 1-3 to select service type...")
+        self.add_log_lines([line.format(method=self.selected_method) for line in _INSTALL_SERVICE_BANNER])
         self.menu_state = 'service_selection'
     
     def show_service_selection_for_uninstall(self):
         """Show service type selection for uninstallation"""
-        self.add_log_line("")
-        self.add_log_line(f"Step 2: Select Service Type (Method: {self.selected_method})")
-        self.add_log_line("")
-        self.add_log_line("Available Services:")
-        self.add_log_line("1️⃣ Windows VMs - Running virtual machines")
-        self.add_log_line("2️⃣ MSSQL Servers - Active SQL instances")
-        self.add_log_line("3️⃣ OpenTelemetry - Running collectors")
-        self.add_log_line("")
-        self.add_log_line("Press 1-3 to select service type...")
+        self.add_log_lines([line.format(method=self.selected_method) for line in _UNINSTALL_SERVICE_BANNER])
         self.menu_state = 'service_selection'
     
     def handle_service_selection(self, key):
         """Handle service type selection"""
-        service_map = {
-            '1': ('vms', 'Windows VMs'),
-            '2': ('mssql', 'MSSQL Servers'),
-            '3': ('otel', 'OpenTelemetry Collectors')
-        }
-        
-        if key not in service_map:
+        if key not in _SERVICE_CHOICES:
             return
             
-        service_type, service_name = service_map[key]
+        service_type, service_name = _SERVICE_CHOICES[key]
         self.add_log_line(f"✅ Selected: {service_name}")
         
         # Switch to the appropriate tab first
         self.active_service_tab = service_type
-        if service_type == 'vms':
-            self.show_vms_tab(None)
-        elif service_type == 'mssql':
-            self.show_mssql_tab(None)
-        elif service_type == 'otel':
-            self.show_otel_tab(None)
+        self._tab_dispatch[service_type](None)
         
         # Now execute the action based on method and service
         self.execute_selected_action(service_type, service_name)
@@ -1827,10 +2128,9 @@ class KubernetesCRDTUI:
         self.add_log_line(f"🔧 Method: {method}")
         self.add_log_line("")
         
-        if action == 'install':
-            self.execute_install_action(service_type, method)
-        elif action == 'uninstall':
-            self.execute_uninstall_action(service_type, method)
+        executor = self._action_dispatch.get(action)
+        if executor is not None:
+            executor(service_type, method)
         
         # Reset state
         self.pending_action = None
@@ -1839,7 +2139,7 @@ class KubernetesCRDTUI:
     def execute_install_action(self, service_type, method):
         """Execute installation with specified method"""
         try:
-            status_report = self.service_manager.get_comprehensive_status()
+            status_report = self._cached_status()
             
             if method == 'kubectl':
                 self.add_log_line("📋 Available local CRs for kubectl apply:")
@@ -1863,7 +2163,7 @@ class KubernetesCRDTUI:
     def execute_uninstall_action(self, service_type, method):
         """Execute uninstallation with specified method"""
         try:
-            status_report = self.service_manager.get_comprehensive_status()
+            status_report = self._cached_status()
             
             if method == 'kubectl':
                 self.add_log_line("📋 Deployed CRs available for kubectl delete:")
@@ -1886,13 +2186,7 @@ class KubernetesCRDTUI:
     
     def show_available_crs_for_install(self, service_type, status_report):
         """Show available CRs for the selected service type"""
-        service_map = {
-            'vms': 'windowsvms',
-            'mssql': 'mssqlservers', 
-            'otel': 'otelcollectors'
-        }
-        
-        service_key = service_map.get(service_type)
+        service_key = _SERVICE_KEY_MAP.get(service_type)
         if not service_key:
             return
             
@@ -1902,20 +2196,14 @@ class KubernetesCRDTUI:
         if local_crs:
             for name, cr_data in local_crs.items():
                 enabled = cr_data.get('enabled', True)
-                status_icon = '✅' if enabled else '⏸️'
+                status_icon = _ICONS['ok' if enabled else 'paused']
                 self.add_log_line(f"  {status_icon} {name}")
         else:
             self.add_log_line(f"  ❌ No local {service_type} CRs found")
     
     def show_deployed_crs_for_delete(self, service_type, status_report):
         """Show deployed CRs for the selected service type"""
-        service_map = {
-            'vms': 'windowsvms',
-            'mssql': 'mssqlservers',
-            'otel': 'otelcollectors'
-        }
-        
-        service_key = service_map.get(service_type)
+        service_key = _SERVICE_KEY_MAP.get(service_type)
         if not service_key:
             return
             
@@ -1958,33 +2246,29 @@ class KubernetesCRDTUI:
         self.add_log_line("")
         
         try:
-            status_report = self.service_manager.get_comprehensive_status()
-            
-            service_map = {
-                'vms': 'windowsvms',
-                'mssql': 'mssqlservers',
-                'otel': 'otelcollectors'
-            }
+            status_report = self._cached_status()
             
-            service_key = service_map.get(self.active_service_tab)
+            service_key = _SERVICE_KEY_MAP.get(self.active_service_tab)
             if service_key:
                 service_data = status_report.get(service_key, {})
                 local_crs = service_data.get('local_crs', {})
                 deployed_crs = service_data.get('deployed_crs', {})
                 
+                enabled_count = 0
                 if local_crs:
                     self.add_log_line("📁 Local CRs available for apply:")
                     for name, cr_data in local_crs.items():
                         enabled = cr_data.get('enabled', True)
+                        if enabled:
+                            enabled_count += 1
                         is_deployed = name in deployed_crs
-                        status_icon = '✅' if enabled else '⏸️'
+                        status_icon = _ICONS['ok' if enabled else 'paused']
                         deploy_status = ' (Already Deployed)' if is_deployed else ' (Ready to Deploy)'
                         self.add_log_line(f"  {status_icon} {name}{deploy_status}")
                 else:
                     self.add_log_line(f"❌ No local {self.active_service_tab} CRs found")
                     
                 if self.selected_method == 'batch' and local_crs:
-                    enabled_count = sum(1 for cr in local_crs.values() if cr.get('enabled', True))
                     self.add_log_line("")
                     self.add_log_line(f"🚀 Batch mode will apply {enabled_count} enabled CRs")
                 elif self.selected_method == 'dry_run':
@@ -2007,43 +2291,28 @@ class KubernetesCRDTUI:
         self.add_log_line("")
         
         try:
-            status_report = self.service_manager.get_comprehensive_status()
-            
-            service_map = {
-                'vms': 'windowsvms',
-                'mssql': 'mssqlservers',
-                'otel': 'otelcollectors'
-            }
-            
-            service_key = service_map.get(self.active_service_tab)
+            service_key = _SERVICE_KEY_MAP.get(self.active_service_tab)
             if service_key:
-                service_data = status_report.get(service_key, {})
-                deployed_crs = service_data.get('deployed_crs', {})
+                deployed_crs = self._deployed_phases(self.active_service_tab)
                 
                 if deployed_crs:
                     self.add_log_line("☸️ Deployed CRs available for deletion:")
-                    for name, cr_data in deployed_crs.items():
-                        status = cr_data.get('status', {}).get('phase', 'Unknown')
-                        color_icon = '🟢' if status == 'Ready' else '🟡' if status == 'Pending' else '🔴'
-                        method_note = ''
-                        if self.selected_method == 'graceful':
-                            method_note = ' (Will stop services first)'
-                        elif self.selected_method == 'force':
-                            method_note = ' (Immediate removal)'
+                    # The note depends only on the selected method, not the CR
+                    method_note = ''
+                    if self.selected_method == 'graceful':
+                        method_note = ' (Will stop services first)'
+                    elif self.selected_method == 'force':
+                        method_note = ' (Immediate removal)'
+                    for name, cr_data, status in deployed_crs:
+                        color_icon = _PHASE_ICON.get(status, _ICONS['err'])
                         self.add_log_line(f"  {color_icon} {name} (status: {status}){method_note}")
                 else:
                     self.add_log_line(f"❌ No deployed {self.active_service_tab} CRs found")
                     
                 if self.selected_method == 'graceful':
-                    self.add_log_line("")
-                    self.add_log_line("🔄 Graceful shutdown will:")
-                    self.add_log_line("  • Stop running services cleanly")
-                    self.add_log_line("  • Wait for processes to terminate")
-                    self.add_log_line("  • Remove CRs after cleanup")
+                    self.add_log_lines(_GRACEFUL_DELETE_NOTES)
                 elif self.selected_method == 'force':
-                    self.add_log_line("")
-                    self.add_log_line("⚠️ Force delete will immediately remove CRs")
-                    self.add_log_line("   This may leave orphaned resources!")
+                    self.add_log_lines(_FORCE_DELETE_NOTES)
                     
         except Exception as e:
             self.add_log_line(f"❌ Error loading deployed CRs: {e}")
@@ -2059,13 +2328,11 @@ class KubernetesCRDTUI:
         self.add_log_line(f"🗑️ delete_crd_menu called - starting delete CRD menu...")
 
         def handle_crd_delete_selection(file_name, file_path):
-            self.add_log_line(f"🔥 DELETE CALLBACK TRIGGERED: {file_name}")
+            if _TUI_DEBUG_ENTER:
+                self.add_log_line(f"🔥 DELETE CALLBACK TRIGGERED: {file_name}")
             self.add_log_line(f"🗑️ Deleting CRD: {file_name}...")
 
-            # Use timeout for kubectl delete to prevent hanging
-            try:
-                result = subprocess.run(['kubectl', 'delete', '-f', file_path],
-                                        capture_output=True, text=True, timeout=10)
+            def report(result):
                 if result.returncode == 0:
                     self.add_log_line(f"✅ CRD deleted successfully: {file_name}")
                     # Refresh the status display after successful CRD deletion
@@ -2076,8 +2343,9 @@ class KubernetesCRDTUI:
                         self.add_log_line(f"⚠️ CRD not found in cluster (already deleted): {file_name}")
                     else:
                         self.add_log_line(f"❌ Failed to delete CRD {file_name}: {err}")
-            except subprocess.TimeoutExpired:
-                self.add_log_line(f"⏰ kubectl delete timed out for {file_name}")
+
+            # Bounded and run on the worker pool, so a stuck delete cannot hang the UI
+            self._run_kubectl_async(['delete', '-f', file_path], report, timeout=10, capture_stdout=False)
 
         # Implement the logic to gather CRD files and show the menu
         self.show_universal_menu(
@@ -2090,6 +2358,7 @@ class KubernetesCRDTUI:
     
     def clear_logs(self, button):
         """Clear log display"""
+        self._pending_log.clear()
         self.log_walker.clear()
         self.add_log_line("🧹 Logs cleared")
     
@@ -2100,6 +2369,9 @@ class KubernetesCRDTUI:
     def update_focus_indicators(self):
         """Update focus indicators in panel titles"""
         current_focus = self.content_columns.focus_position
+        if current_focus == self._last_focus_title:
+            return
+        self._last_focus_title = current_focus
         if current_focus == 0:
             self.status_frame.set_title("VMs & Services Status [FOCUSED]")
             self.log_frame.set_title("System Logs")
@@ -2107,6 +2379,118 @@ class KubernetesCRDTUI:
             self.status_frame.set_title("VMs & Services Status")
             self.log_frame.set_title("System Logs [FOCUSED]")
     
+    def refresh_file_index(self):
+        """Re-snapshot the kubernetes playbook folder"""
+        playbook_files = scan_file_names(KUBERNETES_DIR)
+        # Resolved uninstall playbook per service, None when the file is missing
+        self._playbook_paths = {
+            service: str(KUBERNETES_DIR / playbook) if playbook in playbook_files else None
+            for service, playbook in self._PLAYBOOK_MAP.items()
+        }
+    
+    def refresh_status(self):
+        """Refresh the status display on demand (F2)"""
+        self.refresh_file_index()
+        self._invalidate_status_cache()
+        self._ensure_watchers()
+        self.update_status_display()
+        self.add_log_line("Status refreshed")
+    
+    def _cached_status(self, ttl=STATUS_CACHE_TTL):
+        """Return service_manager.get_comprehensive_status(), reusing a report fetched within ttl seconds"""
+        if self._status_fresh(ttl):
+            return self._status_cache[1]
+        report = self.service_manager.get_comprehensive_status()
+        self._status_cache = (time.monotonic(), report)
+        return report
+    
+    def _status_fresh(self, ttl=STATUS_CACHE_TTL):
+        """True if _cached_status would answer from the cache"""
+        cached = self._status_cache
+        return cached is not None and time.monotonic() - cached[0] < ttl
+    
+    def _fetch_status_then(self, continuation):
+        """Fetch the status report on the worker pool, cache it and then run continuation() on the UI thread"""
+        self.add_log_line("⏳ Fetching cluster status...")
+        future = self._apply_pool.submit(self.service_manager.get_comprehensive_status)
+        future.add_done_callback(lambda f: self._call_in_ui(self._status_fetched, f, continuation))
+    
+    def _status_fetched(self, future, continuation):
+        """_fetch_status_then completion, on the UI thread"""
+        try:
+            report = future.result()
+        except Exception as e:
+            self.add_log_line(f"❌ Error fetching cluster status: {e}")
+            return
+        self._status_cache = (time.monotonic(), report)
+        continuation()
+    
+    def _call_in_ui(self, func, *args):
+        """Queue func(*args) to run on the UI thread; safe to call from worker threads"""
+        self._ui_calls.put((func, args))
+        self._wake_ui()
+    
+    def _wake_ui(self):
+        """Make the main loop run _on_wake soon; safe to call from any thread"""
+        if self._ui_call_pipe_fd is not None:
+            try:
+                os.write(self._ui_call_pipe_fd, b'.')
+            except OSError:
+                pass  # loop has shut down and closed the pipe
+    
+    def _on_wake(self, data):
+        """watch_pipe callback: run queued UI calls and pick up new log_queue lines"""
+        self._drain_ui_calls()
+        # Clear before draining so a line logged during the drain wakes again
+        log_queue.clear_wake()
+        if self._drain_log_queue():
+            self._wake_ui()  # more than one batch waiting; continue on the next loop pass
+        return True
+    
+    def _drain_ui_calls(self, data=None):
+        """Run the calls queued by _call_in_ui"""
+        try:
+            while True:
+                func, args = self._ui_calls.get_nowait()
+                func(*args)
+        except queue.Empty:
+            pass
+        return True
+    
+    def _deployed_phases(self, service_type):
+        """Return [(name, cr_data, phase)] for the deployed CRs of a service tab
+        
+        Built once per status report, so popups and listings do not repeat the
+        status/phase lookups for every CR.
+        """
+        report = self._cached_status()
+        if self._phase_index[0] is not report:
+            self._phase_index = (report, {})
+        index = self._phase_index[1]
+        rows = index.get(service_type)
+        if rows is None:
+            deployed_crs = report.get(_SERVICE_KEY_MAP.get(service_type), {}).get('deployed_crs', {})
+            rows = index[service_type] = [
+                (name, cr_data, cr_data.get('status', {}).get('phase', 'Unknown'))
+                for name, cr_data in deployed_crs.items()
+            ]
+        return rows
+    
+    def _invalidate_status_cache(self):
+        """Drop the cached status report so the next menu fetches a fresh one"""
+        self._status_cache = None
+    
+    def toggle_auto_scroll(self):
+        """Toggle log auto-scroll (F8)"""
+        self.auto_scroll = not self.auto_scroll
+        status = "ON" if self.auto_scroll else "OFF"
+        self.add_log_line(f"📜 Auto-scroll: {status} (F8)")
+        if self.auto_scroll and self.log_walker:
+            try:
+                self.log_listbox.focus_position = len(self.log_walker) - 1
+            except:
+                pass
+    
     def reset_focus_and_navigation(self):
         """Reset focus and navigation state"""
         try:
@@ -2116,30 +2500,33 @@ class KubernetesCRDTUI:
         except Exception as e:
             self.add_log_line(f"❌ Reset failed: {e}")
     
+    def _dump_enter_debug(self):
+        """Log what an ENTER key press is about to act on (TUI_DEBUG_ENTER=1 only)"""
+        self.add_log_line(f"🔥 ENTER KEY DETECTED! menu_state={self.menu_state}")
+        if self.popup_listbox is not None:
+            try:
+                focus_widget = self.popup_listbox.focus
+                self.add_log_line(f"🔥 ENTER: focus_widget type: {type(focus_widget)}")
+                button = getattr(focus_widget, 'original_widget', None)
+                if button is not None:
+                    self.add_log_line(f"🔥 ENTER: button type: {type(button)}")
+                    cr_name = getattr(button, 'cr_name', None)
+                    if cr_name is not None:
+                        self.add_log_line(f"🔥 ENTER: button.cr_name = {cr_name}")
+            except Exception as e:
+                self.add_log_line(f"🔥 ENTER: Debug error: {e}")
+    
     def unhandled_input(self, key):
         """Handle keyboard input with popup support"""
-        # Removed noisy debug log
-        # SPECIAL DEBUG: Log extra info for Enter keys
-        if key == 'enter':
-            self.add_log_line(f"🔥 ENTER KEY DETECTED! menu_state={self.menu_state}")
-            if hasattr(self, 'popup_listbox') and self.popup_listbox:
-                try:
-                    focus_widget = self.popup_listbox.focus
-                    self.add_log_line(f"🔥 ENTER: focus_widget type: {type(focus_widget)}")
-                    if hasattr(focus_widget, 'original_widget'):
-                        button = focus_widget.original_widget
-                        self.add_log_line(f"🔥 ENTER: button type: {type(button)}")
-                        if hasattr(button, 'cr_name'):
-                            self.add_log_line(f"🔥 ENTER: button.cr_name = {button.cr_name}")
-                except Exception as e:
-                    self.add_log_line(f"🔥 ENTER: Debug error: {e}")
+        if _TUI_DEBUG_ENTER and key == 'enter':
+            self._dump_enter_debug()
         
         # Always handle ESC: close popup or step back from any menu
         if key == 'escape':
             if self.menu_state == 'unified_popup' and self.popup:
                 self.add_log_line("🔙 UNIFIED_POPUP: ESC pressed, closing popup and resetting menu state")
                 self.close_popup()
-                if hasattr(self, 'original_widget'):
+                if self.original_widget is not None:
                     self.loop.widget = self.original_widget
                 self.menu_state = None
                 self.popup_listbox = None
@@ -2147,7 +2534,7 @@ class KubernetesCRDTUI:
                 return
             elif self.popup:
                 self.close_popup()
-                if hasattr(self, 'original_widget'):
+                if self.original_widget is not None:
                     self.loop.widget = self.original_widget
                 return
             elif self.menu_state:
@@ -2173,133 +2560,18 @@ class KubernetesCRDTUI:
                 return key
         
         
-        # Handle method selection states
-        elif self.menu_state == 'install_method_selection':
-            if key == '1':
-                self.selected_method = 'kubectl'
-                self.add_log_line("✅ Selected: kubectl apply method")
-                self.execute_install_with_method()
-                return
-            elif key == '2':
-                self.selected_method = 'ansible'
-                self.add_log_line("✅ Selected: Ansible Playbook method")
-                self.execute_install_with_method()
-                return
-            elif key == '3':
-                self.selected_method = 'manual'
-                self.add_log_line("✅ Selected: Manual CR Generation")
-                self.execute_install_with_method()
-                return
-        elif self.menu_state == 'uninstall_method_selection':
-            if key == '1':
-                self.selected_method = 'kubectl'
-                self.add_log_line("✅ Selected: kubectl delete method")
-                self.execute_uninstall_with_method()
-                return
-            elif key == '2':
-                self.selected_method = 'ansible'
-                self.add_log_line("✅ Selected: Ansible Cleanup method")
-                self.execute_uninstall_with_method()
-                return
-            elif key == '3':
-                self.selected_method = 'cr_update'
-                self.add_log_line("✅ Selected: CR Update method")
-                self.execute_uninstall_with_method()
-                return
-        elif self.menu_state == 'delete_method_selection':
-            if key == '1':
-                self.selected_method = 'kubectl'
-                self.add_log_line("✅ Selected: kubectl delete method")
-                self.execute_delete_with_method()
-                return
-            elif key == '2':
-                self.selected_method = 'graceful'
-                self.add_log_line("✅ Selected: Graceful shutdown")
-                self.execute_delete_with_method()
-                return
-            elif key == '3':
-                self.selected_method = 'force'
-                self.add_log_line("✅ Selected: Force delete")
-                self.execute_delete_with_method()
-                return
+        # Handle method selection states: '1'-'3' pick a method from _METHOD_CHOICES
+        elif key in self._METHOD_CHOICES.get(self.menu_state, ()):
+            self.selected_method, label = self._METHOD_CHOICES[self.menu_state][key]
+            self.add_log_line(f"✅ Selected: {label}")
+            self._method_executors[self.menu_state]()
+            return
         
-        # Standard navigation and shortcuts
-        if key in ('q', 'Q'):
-            raise urwid.ExitMainLoop()
-        elif key == 'ctrl c':
-            self.add_log_line("🛑 CTRL+C pressed - Shutting down...")
-            raise urwid.ExitMainLoop()
-        # (handled above)
-        elif key == 'f2':
-            # F2 - Show current tab status
-            self.update_status_display()
-            self.add_log_line("Status refreshed")
-        elif key == 'f6':
-            # F6 - Apply CRDs menu
-            self.apply_crds_menu(None)
-        elif key == 'f7':
-            # F7 - Apply CR menu
-            self.apply_cr_menu(None)
-        elif key == 'f2':
-            # F2 - Show current tab status
-            self.update_status_display()
-            self.add_log_line("Status refreshed")
-        elif key == 'f3':
-            # F3 - VMs tab
-            self.show_vms_tab(None)
-        elif key == 'f4':
-            # F4 - MSSQL tab
-            self.show_mssql_tab(None)
-        elif key == 'f5':
-            # F5 - OTel tab
-            self.show_otel_tab(None)
-        elif key == 'f6':
-            # F6 - Apply CRDs menu
-            self.apply_crds_menu(None)
-        elif key == 'f7':
-            # F7 - Apply CR menu
-            self.apply_cr_menu(None)
-        elif key == 'f8':
-            # F8 - Toggle auto-scroll
-            self.auto_scroll = not self.auto_scroll
-            status = "ON" if self.auto_scroll else "OFF"
-            self.add_log_line(f"📜 Auto-scroll: {status} (F8)")
-            if self.auto_scroll and self.log_walker:
-                try:
-                    self.log_listbox.focus_position = len(self.log_walker) - 1
-                except:
-                    pass
-        elif key == 'f9':
-            # F9 - Reset focus
-            self.reset_focus_and_navigation()
-        elif key in ('left', 'right'):
-            # Arrow keys for panel navigation
-            try:
-                if key == 'left':
-                    self.content_columns.focus_position = 0
-                    self.update_focus_indicators()
-                    self.add_log_line("Moved to Status Panel")
-                else:
-                    self.content_columns.focus_position = 1
-                    self.update_focus_indicators()
-                    self.add_log_line("📜 Moved to Log Panel (→)")
-            except Exception as e:
-                self.add_log_line(f"❌ Navigation error: {e}")
-        elif key == 'tab':
-            # Tab navigation
-            try:
-                current_focus = self.content_columns.focus_position
-                new_focus = 1 - current_focus
-                self.content_columns.focus_position = new_focus
-                self.update_focus_indicators()
-                
-                if new_focus == 0:
-                    self.add_log_line("Switched to Status Panel")
-                else:
-                    self.add_log_line("📜 Switched to Log Panel (Tab)")
-            except Exception as e:
-                self.add_log_line(f"❌ Tab navigation error: {e}")
-        elif key in ('up', 'down', 'page up', 'page down'):
+        # Standard navigation and shortcuts, dispatched through the table built in __init__
+        action = self._key_actions.get(key)
+        if action is not None:
+            action()
+        elif key in self._SCROLL_KEYS:
             # Handle scrolling - disable auto-scroll when manually scrolling
             try:
                 if self.content_columns.focus_position == 1:  # Logs panel focused
@@ -2311,6 +2583,27 @@ class KubernetesCRDTUI:
         else:
             return key
     
+    def _quit(self):
+        """Leave the main loop (q/Q)"""
+        raise urwid.ExitMainLoop()
+    
+    def _interrupt(self):
+        """Leave the main loop on CTRL+C"""
+        self.add_log_line("🛑 CTRL+C pressed - Shutting down...")
+        raise urwid.ExitMainLoop()
+    
+    def _focus_panel(self, position):
+        """Focus the status (0) or log (1) panel; left/right/Tab"""
+        try:
+            self.content_columns.focus_position = position
+            self.update_focus_indicators()
+            if position == 0:
+                self.add_log_line("Moved to Status Panel")
+            else:
+                self.add_log_line("📜 Moved to Log Panel")
+        except Exception as e:
+            self.add_log_line(f"❌ Navigation error: {e}")
+    
     def reset_menu_state(self):
         """Reset all menu state variables"""
         self.pending_action = None
@@ -2330,7 +2623,7 @@ class KubernetesCRDTUI:
         self.add_log_line("")
         
         try:
-            status_report = self.service_manager.get_comprehensive_status()
+            status_report = self._cached_status()
             
             if self.selected_method == 'kubectl':
                 self.show_available_crs_for_install_final(self.selected_service_type, status_report)
@@ -2352,7 +2645,7 @@ class KubernetesCRDTUI:
         self.add_log_line("")
         
         try:
-            status_report = self.service_manager.get_comprehensive_status()
+            status_report = self._cached_status()
             
             if self.selected_method == 'kubectl':
                 self.show_deployed_crs_for_uninstall(self.selected_service_type, status_report)
@@ -2368,37 +2661,25 @@ class KubernetesCRDTUI:
     
     def execute_delete_with_method(self):
         """Show all CR YAMLs in manifest-controller for deletion"""
-        import os
         self.add_log_line("")
         self.add_log_line(f"🎯 DELETING {self.selected_service_name}")
         self.add_log_line(f"🔧 Method: {self.selected_method}")
         self.add_log_line("")
         try:
-            folder = str(MANIFEST_DIR)
-            files = os.listdir(folder)
-            cr_files = [f for f in files if f.endswith('.yaml') and 'crd' not in f.lower()]
-            if cr_files:
-                cr_options = []
-                for fname in cr_files:
-                    cr_path = os.path.join(folder, fname)
-                    cr_options.append((fname, cr_path, 'Local CR YAML'))
-                def handle_cr_delete_selection(cr_name, cr_path, _status=None):
-                    self.add_log_line(f"🗑️ Deleting CR: {cr_name} using {self.selected_method}")
-                    import subprocess
-                    result = subprocess.run(['kubectl', 'delete', '-f', cr_path], capture_output=True, text=True)
-                    if result.returncode == 0:
-                        self.add_log_line(f"✅ Deleted CR: {cr_name}")
-                    else:
-                        self.add_log_line(f"❌ Failed to delete CR {cr_name}: {result.stderr}")
-                # Wrap callback for show_unified_selection_popup
-                def popup_callback(cr_name, cr_path, status=None):
-                    handle_cr_delete_selection(cr_name, cr_path, status)
-                # Adapt to show_unified_selection_popup signature
-                cr_options_for_popup = [(name, path, status) for (name, path, status) in cr_options]
+            # Same mtime-keyed listing the manifest menus use: no folder walk
+            # when nothing was added or removed since the last menu
+            cr_options = [(name, path, 'Local CR YAML') for name, path in cached_file_entries(str(MANIFEST_DIR))
+                          if name.endswith('.yaml') and 'crd' not in name.lower()]
+            if cr_options:
+                if len(cr_options) > 1:
+                    # Single kubectl invocation for every local CR
+                    all_paths = [path for (_name, path, _status) in cr_options]
+                    cr_options.insert(0, ('All local CRs', all_paths, f'Batch delete {len(all_paths)} CR YAMLs'))
+                # reset_menu_state runs before a row is picked, so the method is bound now
                 self.show_unified_selection_popup(
                     f"Delete Local CR YAML",
-                    cr_options_for_popup,
-                    popup_callback
+                    cr_options,
+                    partial(self._delete_local_cr, self.selected_method)
                 )
             else:
                 self.add_log_line(f"❌ No local CR YAMLs found in manifest-controller")
@@ -2407,25 +2688,321 @@ class KubernetesCRDTUI:
         finally:
             self.reset_menu_state()
     
+    def _delete_local_cr(self, method, cr_name, cr_path, _status=None):
+        """execute_delete_with_method popup callback: delete one CR YAML, or a list of them in one call"""
+        # kubectl runs on the worker pool; results come back on the UI thread
+        if isinstance(cr_path, list):
+            self.delete_cr_files(cr_path)
+            return
+        self.add_log_line(f"🗑️ Deleting CR: {cr_name} using {method}")
+        
+        def report(result):
+            self._invalidate_status_cache()
+            if result.returncode == 0:
+                self.add_log_line(f"✅ Deleted CR: {cr_name}")
+            else:
+                self.add_log_line(f"❌ Failed to delete CR {cr_name}: {result.stderr}")
+        
+        self._run_kubectl_async(['delete', '-f', cr_path], report, capture_stdout=False)
+    
+    def run_command_streaming(self, cmd, on_exit=None, prefix="", timeout=KUBECTL_TIMEOUT):
+        """Run a command without blocking the urwid loop, logging output lines as they arrive"""
+        # The output pipe is watched by the event loop, so ESC/F-keys stay live
+        # while the child runs; on_exit(returncode, output) fires on the UI thread
+        env = self._current_kubectl_env() if cmd[0] == 'kubectl' else None
+        proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT, env=env)
+        fd = proc.stdout.fileno()
+        pending = bytearray()
+        output = []
+        
+        def kill_on_timeout(loop, user_data):
+            if proc.poll() is None:
+                proc.kill()
+                self.add_log_line(f"⏰ {cmd[0]} timed out after {timeout}s")
+        
+        timeout_alarm = self.loop.set_alarm_in(timeout, kill_on_timeout)
+        
+        def on_readable():
+            chunk = os.read(fd, 4096)
+            pending.extend(chunk)
+            *lines, rest = pending.split(b'\n')
+            if not chunk and rest:
+                # EOF: flush the unterminated last line
+                lines.append(rest)
+                rest = b''
+            pending[:] = rest
+            for raw in lines:
+                line = raw.decode('utf-8', errors='replace').rstrip()
+                if line:
+                    output.append(line)
+                    self.add_log_line(f"{prefix}{line}")
+            if not chunk:
+                self.loop.remove_watch_file(watch_handle)
+                self.loop.remove_alarm(timeout_alarm)
+                proc.stdout.close()
+                returncode = proc.wait()
+                if on_exit:
+                    on_exit(returncode, '\n'.join(output))
+        
+        watch_handle = self.loop.watch_file(fd, on_readable)
+        return proc
+    
+    def start_status_watchers(self):
+        """Watch CRDs and the kinds of the local CRs so the status tree follows the cluster"""
+        # Watch threads only replace entries in self._deployed and signal through
+        # the pipe; the redraw itself happens on the UI thread in the callback
+        self._status_pipe_fd = self.loop.watch_pipe(self._on_deployed_changed)
+        self._ensure_watchers()
+    
+    def _ensure_watchers(self):
+        """Start a watch thread for every resource kind that is not watched yet
+        
+        A custom kind is only watched once the CRD watch has seen its CRD;
+        until then every lookup would miss and force a full API rediscovery.
+        """
+        if self._status_pipe_fd is None:
+            return
+        crd_kinds = self._crd_kinds_seen = self._crd_kinds
+        kinds = {('apiextensions.k8s.io/v1', 'CustomResourceDefinition')}
+        try:
+            yaml_mtimes = scan_yaml_mtimes(str(MANIFEST_DIR))
+        except FileNotFoundError:
+            yaml_mtimes = {}
+        for file_name, mtime_ns in yaml_mtimes.items():
+            if 'crd' in file_name.lower():
+                continue
+            try:
+                cr = load_manifest(str(MANIFEST_DIR / file_name), mtime_ns)
+                api_version, kind = cr['apiVersion'], cr['kind']
+            except Exception:
+                continue
+            group = api_version.rpartition('/')[0]
+            if not group or (group, kind) in crd_kinds:
+                kinds.add((api_version, kind))
+        for api_version, kind in kinds - self._watched_kinds:
+            self._watched_kinds.add((api_version, kind))
+            threading.Thread(target=self._watch_kind, args=(api_version, kind),
+                             name=f'watch-{kind}', daemon=True).start()
+    
+    def _watch_kind(self, api_version, kind):
+        """List then watch one resource kind, keeping self._deployed[kind] current"""
+        # The CRD watch also records which (group, kind) each CRD serves
+        served = {} if kind == 'CustomResourceDefinition' else None
+        retry_delay = self.update_interval
+        while not self._stop_event.is_set():
+            try:
+                dyn_client = get_dynamic_client()
+                resource = get_dynamic_resource(api_version, kind)
+                listing = resource.get()
+                retry_delay = self.update_interval
+                names = {item.metadata.name for item in listing.items}
+                if served is not None:
+                    served = {item.metadata.name: _crd_served_kind(item) for item in listing.items}
+                    self._crd_kinds = frozenset(served.values())
+                self._set_deployed(kind, names)
+                for event in dyn_client.watch(resource, resource_version=listing.metadata.resourceVersion,
+                                              timeout=WATCH_TIMEOUT):
+                    if self._stop_event.is_set():
+                        return
+                    obj = event['object']
+                    if event['type'] == 'DELETED':
+                        names.discard(obj.metadata.name)
+                        if served is not None:
+                            served.pop(obj.metadata.name, None)
+                    elif event['type'] in ('ADDED', 'MODIFIED'):
+                        names.add(obj.metadata.name)
+                        if served is not None:
+                            served[obj.metadata.name] = _crd_served_kind(obj)
+                    else:
+                        break  # ERROR (e.g. resourceVersion too old): relist
+                    if served is not None:
+                        self._crd_kinds = frozenset(served.values())
+                    self._set_deployed(kind, names)
+            except Exception:
+                # Kind gone or API unreachable: back off so a persistent miss
+                # doesn't rediscover the whole API every few seconds
+                self._stop_event.wait(retry_delay)
+                retry_delay = min(retry_delay * 2, WATCH_BACKOFF_MAX)
+    
+    def _set_deployed(self, kind, names):
+        """Publish the deployed names of a kind and wake the UI thread if they changed"""
+        names = frozenset(names)
+        if self._deployed.get(kind) == names:
+            return
+        self._deployed[kind] = names
+        if self._status_wake_pending:
+            return  # the pending wake will redraw with this change too
+        self._status_wake_pending = True
+        try:
+            os.write(self._status_pipe_fd, b'.')
+        except OSError:
+            pass  # loop has shut down and closed the pipe
+    
+    def _deployed_names(self, kind):
+        """Names of the deployed objects of a kind, as last seen by its watch"""
+        return self._deployed.get(kind, frozenset())
+    
+    def _on_deployed_changed(self, data):
+        """watch_pipe callback: a watched kind changed, redraw the status tree"""
+        # Clear before redrawing so a change published during the redraw wakes again
+        self._status_wake_pending = False
+        if self._crd_kinds != self._crd_kinds_seen:
+            self._ensure_watchers()  # CRDs changed: kinds may now be watchable
+        self._invalidate_status_cache()
+        self.update_status_display()
+        return True
+    
+    def start_kubectl_proxy(self):
+        """Start one kubectl proxy for the session and point kubectl calls at it
+        
+        Runs on a background thread (see run()): waiting for the proxy can
+        take seconds, and kubectl calls go direct until it is ready.
+        """
+        # Each kubectl invocation otherwise re-reads the kubeconfig, redoes the TLS
+        # handshake and API discovery; the proxy keeps one authenticated connection warm
+        with self._proxy_lock:
+            if self._stop_event.is_set():
+                return
+            try:
+                port = _env_positive_int('TUI_KUBECTL_PROXY_PORT', 8001)
+                proc = subprocess.Popen(['kubectl', 'proxy', f'--port={port}'], stdin=subprocess.DEVNULL,
+                                        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            except FileNotFoundError:
+                return
+            # Published right away so stop_kubectl_proxy can always reap it
+            self._proxy_process = proc
+        
+        ready, _, _ = select.select([proc.stdout], [], [], 5)
+        line = proc.stdout.readline() if ready else ''
+        if 'Starting to serve on' not in line:
+            with self._proxy_lock:
+                if self._proxy_process is proc:
+                    self._proxy_process = None
+            proc.kill()
+            proc.wait()
+            if not self._stop_event.is_set():
+                log_queue.put("⚠️ kubectl proxy unavailable, using direct API connections")
+            return
+        proxy_url = f"http://{line.rsplit(' ', 1)[-1].strip()}"
+        
+        # Keep the namespace of the current context so unqualified commands behave the same
+        context = {'cluster': 'proxy'}
+        ns = self._kubectl_result(['config', 'view', '--minify', '-o', 'jsonpath={..namespace}'], KUBECTL_TIMEOUT)
+        if ns.returncode == 0 and ns.stdout.strip():
+            context['namespace'] = ns.stdout.strip()
+        
+        kubeconfig = {
+            'apiVersion': 'v1',
+            'kind': 'Config',
+            'clusters': [{'name': 'proxy', 'cluster': {'server': proxy_url}}],
+            'contexts': [{'name': 'proxy', 'context': context}],
+            'current-context': 'proxy',
+        }
+        fd, kubeconfig_path = tempfile.mkstemp(prefix='tui-proxy-', suffix='.kubeconfig')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(kubeconfig, f)
+        with self._proxy_lock:
+            if self._proxy_process is not proc:
+                # Stopped (or found dead) while it was starting
+                os.unlink(kubeconfig_path)
+                return
+            self._proxy_url = proxy_url
+            self._proxy_kubeconfig = kubeconfig_path
+            self._kubectl_env = {**os.environ, 'KUBECONFIG': kubeconfig_path}
+        log_queue.put(f"🔌 kubectl calls routed through proxy at {proxy_url}")
+    
+    def _current_kubectl_env(self):
+        """Environment for kubectl calls: the proxy's while it is alive, else None (the real kubeconfig)"""
+        env, proc = self._kubectl_env, self._proxy_process
+        if env is None or proc is None or proc.poll() is None:
+            return env
+        # The proxy died mid-session: drop it rather than point kubectl at a dead port
+        with self._proxy_lock:
+            if self._proxy_process is proc:
+                self._reset_proxy_state()
+                log_queue.put("⚠️ kubectl proxy exited, using direct API connections")
+        return None
+    
+    def _reset_proxy_state(self):
+        """Forget the proxy and remove its kubeconfig; caller holds _proxy_lock"""
+        self._kubectl_env = None
+        self._proxy_process = None
+        self._proxy_url = None
+        if self._proxy_kubeconfig:
+            try:
+                os.unlink(self._proxy_kubeconfig)
+            except FileNotFoundError:
+                pass
+            self._proxy_kubeconfig = None
+    
+    def stop_kubectl_proxy(self):
+        """Terminate the session kubectl proxy and remove its kubeconfig"""
+        with self._proxy_lock:
+            proc = self._proxy_process
+            self._reset_proxy_state()
+        if proc is not None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+    
+    def _run_kubectl(self, args, timeout=KUBECTL_TIMEOUT, capture_stdout=True):
+        """Run kubectl with a bounded timeout; a hang comes back as a failed result
+        
+        With capture_stdout=False stdout goes to /dev/null (result.stdout is
+        None) for callers that only look at the return code and stderr.
+        """
+        result = self._kubectl_result(args, timeout, capture_stdout)
+        if result.returncode == KUBECTL_TIMED_OUT:
+            self.add_log_line(f"⏰ kubectl {args[0]} timed out after {timeout}s")
+        return result
+    
+    def _kubectl_result(self, args, timeout, capture_stdout=True):
+        """subprocess side of _run_kubectl; does not touch the UI, so workers can call it"""
+        cmd = ['kubectl', *args]
+        try:
+            return subprocess.run(cmd, env=self._current_kubectl_env(), text=True, timeout=timeout, check=False,
+                                  stdin=subprocess.DEVNULL,
+                                  stdout=subprocess.PIPE if capture_stdout else subprocess.DEVNULL,
+                                  stderr=subprocess.PIPE)
+        except subprocess.TimeoutExpired:
+            return subprocess.CompletedProcess(cmd, KUBECTL_TIMED_OUT, '', f"timed out after {timeout}s")
+    
+    def _run_kubectl_async(self, args, on_done, timeout=KUBECTL_TIMEOUT, capture_stdout=True):
+        """Run kubectl on the worker pool and call on_done(result) on the UI thread"""
+        future = self._apply_pool.submit(self._kubectl_result, args, timeout, capture_stdout)
+        future.add_done_callback(
+            lambda f: self._call_in_ui(self._kubectl_finished, args, timeout, f, on_done)
+        )
+    
+    def _kubectl_finished(self, args, timeout, future, on_done):
+        """_run_kubectl_async completion, on the UI thread"""
+        try:
+            result = future.result()
+        except Exception as e:
+            self.add_log_line(f"❌ kubectl {args[0]} failed: {e}")
+            return
+        if result.returncode == KUBECTL_TIMED_OUT:
+            self.add_log_line(f"⏰ kubectl {args[0]} timed out after {timeout}s")
+        on_done(result)
+    
     def show_available_crs_for_install_final(self, service_type, status_report):
         """Show final CR list for install"""
-        service_map = {
-            'vms': 'windowsvms',
-            'mssql': 'mssqlservers',
-            'otel': 'otelcollectors'
-        }
-        
-        service_key = service_map.get(service_type)
+        service_key = _SERVICE_KEY_MAP.get(service_type)
         if service_key:
             service_data = status_report.get(service_key, {})
             local_crs = service_data.get('local_crs', {})
             
             if local_crs:
                 self.add_log_line("📁 Available CRs for installation:")
-                for name, cr_data in local_crs.items():
-                    enabled = cr_data.get('enabled', True)
-                    status_icon = '✅' if enabled else '⏸️'
-                    self.add_log_line(f"  {status_icon} {name}")
+                # Both row prefixes are built once per listing; rows go out as one batch
+                enabled_prefix, paused_prefix = f"  {_ICONS['ok']} ", f"  {_ICONS['paused']} "
+                self.add_log_lines([
+                    (enabled_prefix if cr_data.get('enabled', True) else paused_prefix) + name
+                    for name, cr_data in local_crs.items()
+                ])
                 self.add_log_line("")
                 self.add_log_line("💡 Ready to install - use service manager integration")
             else:
@@ -2433,13 +3010,7 @@ class KubernetesCRDTUI:
     
     def show_available_crs_for_apply_final(self, service_type, status_report):
         """Show final CR list for apply"""
-        service_map = {
-            'vms': 'windowsvms',
-            'mssql': 'mssqlservers',
-            'otel': 'otelcollectors'
-        }
-        
-        service_key = service_map.get(service_type)
+        service_key = _SERVICE_KEY_MAP.get(service_type)
         if service_key:
             service_data = status_report.get(service_key, {})
             local_crs = service_data.get('local_crs', {})
@@ -2447,15 +3018,20 @@ class KubernetesCRDTUI:
             
             if local_crs:
                 self.add_log_line("📁 CRs available for apply:")
+                enabled_prefix, paused_prefix = f"  {_ICONS['ok']} ", f"  {_ICONS['paused']} "
+                enabled_count = 0
+                rows = []
                 for name, cr_data in local_crs.items():
-                    enabled = cr_data.get('enabled', True)
-                    is_deployed = name in deployed_crs
-                    status_icon = '✅' if enabled else '⏸️'
-                    deploy_status = ' (Already Deployed)' if is_deployed else ' (Ready to Deploy)'
-                    self.add_log_line(f"  {status_icon} {name}{deploy_status}")
+                    if cr_data.get('enabled', True):
+                        enabled_count += 1
+                        prefix = enabled_prefix
+                    else:
+                        prefix = paused_prefix
+                    deploy_status = ' (Already Deployed)' if name in deployed_crs else ' (Ready to Deploy)'
+                    rows.append(prefix + name + deploy_status)
+                self.add_log_lines(rows)
                 
                 if self.selected_method == 'batch':
-                    enabled_count = sum(1 for cr in local_crs.values() if cr.get('enabled', True))
                     self.add_log_line(f"🚀 Batch mode will apply {enabled_count} enabled CRs")
                 elif self.selected_method == 'dry_run':
                     self.add_log_line("🔍 Dry-run will validate CRs without applying")
@@ -2464,23 +3040,18 @@ class KubernetesCRDTUI:
     
     def show_deployed_crs_for_delete_final(self, service_type, status_report):
         """Show final deployed CR list for delete"""
-        service_map = {
-            'vms': 'windowsvms',
-            'mssql': 'mssqlservers',
-            'otel': 'otelcollectors'
-        }
-        
-        service_key = service_map.get(service_type)
+        service_key = _SERVICE_KEY_MAP.get(service_type)
         if service_key:
             service_data = status_report.get(service_key, {})
             deployed_crs = service_data.get('deployed_crs', {})
             
             if deployed_crs:
                 self.add_log_line("☸️ Deployed CRs available for deletion:")
+                rows = []
                 for name, cr_data in deployed_crs.items():
                     status = cr_data.get('status', {}).get('phase', 'Unknown')
-                    color_icon = '🟢' if status == 'Ready' else '🟡' if status == 'Pending' else '🔴'
-                    self.add_log_line(f"  {color_icon} {name} (status: {status})")
+                    rows.append(f"  {_PHASE_ICON.get(status, _ICONS['err'])} {name} (status: {status})")
+                self.add_log_lines(rows)
                 
                 if self.selected_method == 'graceful':
                     self.add_log_line("🔄 Graceful shutdown will stop services cleanly first")
@@ -2491,11 +3062,7 @@ class KubernetesCRDTUI:
     
     def show_ansible_install_options(self, service_type, status_report):
         """Show Ansible install options"""
-        self.add_log_line("🔧 Ansible Playbook Installation:")
-        self.add_log_line("  • Full automated provisioning")
-        self.add_log_line("  • Dependency management")
-        self.add_log_line("  • Network configuration")
-        self.add_log_line("  • Storage resources")
+        self.add_log_lines(_ANSIBLE_INSTALL_NOTES)
     
     def show_deployed_crs_for_uninstall(self, service_type, status_report):
         """Show deployed CRs for uninstall"""
@@ -2503,43 +3070,39 @@ class KubernetesCRDTUI:
     
     def show_ansible_cleanup_options(self, service_type, status_report):
         """Show Ansible cleanup options"""
-        self.add_log_line("🔧 Ansible Cleanup Process:")
-        self.add_log_line("  • Full resource cleanup")
-        self.add_log_line("  • Dependency removal")
-        self.add_log_line("  • Network cleanup")
-        self.add_log_line("💡 Comprehensive cleanup via Ansible")
+        self.add_log_lines(_ANSIBLE_CLEANUP_NOTES)
     
     def show_cr_update_options(self, service_type, status_report):
         """Show CR update options"""
-        self.add_log_line("  • Modify local CRs to set action='uninstall'")
-        self.add_log_line("  • Apply updated CRs to trigger uninstall")
-        self.add_log_line("💡 Safer method that preserves configuration")
-    
-    def update_logs(self):
-        """Update logs from the queue only (no file tailing)"""
-        updated = False
-        try:
-            # Process multiple log entries from log_queue
-            for _ in range(5):
-                log_line = log_queue.get_nowait()
-                self.add_log_line(log_line)
-                updated = True
-        except queue.Empty:
-            pass
-        # Schedule next update
-        if hasattr(self, 'loop') and self.loop:
-            self.loop.set_alarm_in(0.3, lambda loop, user_data: self.update_logs())
-            # Auto-refresh status every 5 seconds
-            self.loop.set_alarm_in(5.0, lambda loop, user_data: self.auto_refresh_status())
+        self.add_log_lines(_CR_UPDATE_NOTES)
+    
+    def _drain_log_queue(self):
+        """Move up to _LOG_DRAIN_MAX log_queue lines into the log; True if more are waiting"""
+        # Bounded so a flood of worker output cannot stall key handling; the
+        # batch is taken in one call rather than a get_nowait per line
+        add_line = self.add_log_line
+        for line in log_queue.get_many(self._LOG_DRAIN_MAX):
+            add_line(line)
+        return log_queue.qsize() > 0
+    
+    def update_logs(self, loop=None, user_data=None):
+        """Pick up the log lines and UI calls queued before the wake pipe existed"""
+        # Later lines arrive through _on_wake, so this only re-arms while a
+        # backlog remains (the bound method is the alarm callback, no closure)
+        log_queue.clear_wake()
+        backlog = self._drain_log_queue()
+        self._drain_ui_calls()
+        if backlog and self.loop:
+            self.loop.set_alarm_in(0, self.update_logs)
     
        
-    def auto_refresh_status(self):
+    def auto_refresh_status(self, loop=None, user_data=None):
         """Automatically refresh status display"""
         try:
             self.update_status_display()
             # Schedule next auto-refresh
-            if hasattr(self, 'loop') and self.loop:
-                self.loop.set_alarm_in(5.0, lambda loop, user_data: self.auto_refresh_status())
+            if self.loop:
+                self.loop.set_alarm_in(self.update_interval, self.auto_refresh_status)
         except Exception as e:
             logger.warning(f"Auto-refresh failed: {e}")
     
@@ -2556,168 +3119,261 @@ class KubernetesCRDTUI:
         except Exception as e:
             self.add_log_line(f"⚠️ Error during startup: {e}")
     
+    def resolve_cr_file_path(self, cr_name, cr_data):
+        """Return the manifest path for a CR, or None if no file can be found"""
+        # Local CRs discovered by the service manager already carry their path
+        cr_file_path = cr_data.get('file_path')
+        if cr_file_path:
+            return cr_file_path
+        if 'file' in cr_data:
+            candidates = [cr_data['file']]
+        else:
+            candidates = [f"{cr_name}-cr.yaml", f"{cr_name}.yaml"]
+        # One stat of the folder instead of an exists() per candidate; files
+        # added since the last lookup show up because the mtime changed
+        manifest_files = cached_file_index(str(MANIFEST_DIR))
+        for file_name in candidates:
+            if file_name in manifest_files:
+                return manifest_files[file_name]
+        return None
+    
+    def apply_cr_object(self, cr_obj):
+        """Server-side apply a CR dict through the shared in-process API client
+        
+        Conflicts are not forced: a field another manager changed is reported
+        as an error instead of being silently taken over.
+        """
+        dyn_client = get_dynamic_client()
+        resource = get_dynamic_resource(cr_obj['apiVersion'], cr_obj['kind'])
+        metadata = cr_obj.get('metadata', {})
+        # Like kubectl, an unqualified namespaced object goes to the context's namespace
+        namespace = (metadata.get('namespace') or get_default_namespace()) if resource.namespaced else None
+        return dyn_client.server_side_apply(
+            resource,
+            body=cr_obj,
+            name=metadata['name'],
+            namespace=namespace,
+            field_manager=FIELD_MANAGER,
+            _request_timeout=KUBECTL_TIMEOUT
+        )
+    
+    def delete_cr_object(self, cr_obj):
+        """Delete the object a CR dict describes through the shared in-process API client"""
+        dyn_client = get_dynamic_client()
+        resource = get_dynamic_resource(cr_obj['apiVersion'], cr_obj['kind'])
+        metadata = cr_obj.get('metadata', {})
+        namespace = (metadata.get('namespace') or get_default_namespace()) if resource.namespaced else None
+        return dyn_client.delete(resource, name=metadata['name'], namespace=namespace,
+                                 _request_timeout=KUBECTL_TIMEOUT)
+    
+    def merge_patch_cr(self, api_version, kind, name, namespace, patch):
+        """JSON merge-patch a CR through the shared in-process API client (namespace None: the context's)"""
+        dyn_client = get_dynamic_client()
+        resource = get_dynamic_resource(api_version, kind)
+        return dyn_client.patch(
+            resource,
+            body=patch,
+            name=name,
+            namespace=(namespace or get_default_namespace()) if resource.namespaced else None,
+            content_type='application/merge-patch+json',
+            _request_timeout=KUBECTL_TIMEOUT
+        )
+    
     def execute_cr_install(self, service_type, service_name, cr_name, cr_data):
         """Execute CR installation directly"""
+        self._invalidate_status_cache()
         self.add_log_line(f"🚀 Installing {cr_name}...")
         try:
             # Apply the CR to Kubernetes
             self.add_log_line(f"📝 Applying Custom Resource...")
-            import os
-            cr_file_path = None
-            if 'file' in cr_data:
-                filename = cr_data['file']
-                cr_file_path = str(MANIFEST_DIR / filename)
-            else:
-                possible_paths = [
-                    str(MANIFEST_DIR / f"{cr_name}-cr.yaml"),
-                    str(MANIFEST_DIR / f"{cr_name}.yaml")
-                ]
-                for path in possible_paths:
-                    if os.path.exists(path):
-                        cr_file_path = path
-                        break
-            if not cr_file_path or not os.path.exists(cr_file_path):
+            cr_file_path = self.resolve_cr_file_path(cr_name, cr_data)
+            if not cr_file_path:
                 self.add_log_line(f"❌ CR file not found for {cr_name}")
                 return
-            import subprocess
-            result = subprocess.run(['kubectl', 'apply', '-f', cr_file_path], capture_output=True, text=True)
-            if result.returncode == 0:
-                self.add_log_line(f"✅ Custom Resource applied successfully from file: {cr_file_path}")
-                self.add_log_line(f"⏳ Waiting for operator to process CR and run playbook...")
-                self.add_log_line(f"💡 Playbook will be started by the operator, not the TUI.")
-            else:
-                self.add_log_line(f"❌ Failed to apply CR: {result.stderr}")
+            
+            def report(error):
+                self._invalidate_status_cache()
+                if error is None:
+                    self.add_log_line(f"✅ Custom Resource applied successfully from file: {cr_file_path}")
+                    self.add_log_line(f"⏳ Waiting for operator to process CR and run playbook...")
+                    self.add_log_line(f"💡 Playbook will be started by the operator, not the TUI.")
+                else:
+                    self.add_log_line(f"❌ Failed to apply CR: {error}")
+            
+            # Server-side apply through the shared API client on the worker
+            # pool: no kubectl process or TLS handshake, and the UI keeps handling keys
+            self._apply_manifest_async(cr_file_path, report)
         except Exception as e:
             self.add_log_line(f"❌ Installation failed: {str(e)}")
         self.menu_state = 'main'
     
     def execute_cr_uninstall(self, service_type, service_name, cr_name, cr_data):
         """Execute CR uninstallation directly"""
+        self._invalidate_status_cache()
         self.add_log_line(f"🗑️ Uninstalling {cr_name}...")
         
         try:
-            # Get the full CR if available, otherwise reconstruct it
-            if 'full_cr' in cr_data:
-                full_cr = cr_data['full_cr'].copy()
-            else:
-                # Reconstruct CR from available data (for local CRs)
-                full_cr = {
-                    'apiVersion': 'infra.example.com/v1',
-                    'kind': service_name,
-                    'metadata': {
-                        'name': cr_name,
-                        'namespace': cr_data.get('namespace', 'default')
-                    },
-                    'spec': cr_data.get('spec', {})
-                }
-            
-            # Update CR with uninstall action
-            import yaml
-            
-            if 'spec' not in full_cr:
-                full_cr['spec'] = {}
-            full_cr['spec']['action'] = 'uninstall'
-            
-            # Apply updated CR to trigger uninstall
-            import tempfile
-            import os
-            import subprocess
-            
-            cr_yaml = yaml.dump(full_cr, default_flow_style=False)
-            
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                f.write(cr_yaml)
-                temp_file = f.name
-            
-            try:
-                # Apply CR with uninstall action
-                self.add_log_line(f"📝 Updating CR with uninstall action...")
-                result = subprocess.run(['kubectl', 'apply', '-f', temp_file], 
-                                      capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    self.add_log_line(f"✅ Custom Resource updated for uninstall")
-                    
-                    # Run uninstall playbook
-                    playbook_map = {
-                        'WindowsVM': 'k8s-redhat-kubernetes-uninstall-tasks.yaml',
-                        'MSSQL': 'mssql-uninstall-tasks.yaml',
-                        'OTel': 'otel-uninstall-tasks.yaml'
-                    }
-                    
-                    playbook = playbook_map.get(service_name)
-                    if playbook:
-                        playbook_path = str(KUBERNETES_DIR / playbook)
-                        if os.path.exists(playbook_path):
-                            self.add_log_line(f"🎭 Running uninstall playbook...")
-                            result = subprocess.run(['ansible-playbook', playbook_path], 
-                                                  capture_output=True, text=True)
-                            
-                            if result.returncode == 0:
-                                self.add_log_line(f"✅ Uninstall completed successfully!")
-                            else:
-                                self.add_log_line(f"⚠️ Playbook completed with warnings: {result.stderr}")
-                        else:
-                            self.add_log_line(f"❌ Failed to update CR: {result.stderr}")
-                    
-            finally:
-                # Clean up temp file
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
-                    
+            # Only spec.action changes, so send a JSON merge patch rather than
+            # rebuilding and re-applying the whole CR. Deployed CRs carry their
+            # GVK/namespace in full_cr; local CRs fall back to the defaults.
+            deployed_cr = cr_data.get('full_cr', {})
+            api_version = deployed_cr.get('apiVersion', 'infra.example.com/v1')
+            kind = deployed_cr.get('kind', service_name)
+            namespace = deployed_cr.get('metadata', {}).get('namespace', cr_data.get('namespace'))
+            
+            # Patch CR with uninstall action; the API call runs on the worker
+            # pool and _on_cr_uninstall_patched continues on the UI thread
+            self.add_log_line(f"📝 Updating CR with uninstall action...")
+            future = self._apply_pool.submit(
+                self.merge_patch_cr, api_version, kind, cr_name, namespace, {'spec': {'action': 'uninstall'}}
+            )
+            future.add_done_callback(
+                lambda f: self._call_in_ui(self._on_cr_uninstall_patched, service_name, f)
+            )
         except Exception as e:
             self.add_log_line(f"❌ Uninstallation failed: {str(e)}")
         
         self.menu_state = 'main'
     
+    def _on_cr_uninstall_patched(self, service_name, future):
+        """Report the uninstall patch and start the uninstall playbook"""
+        self._invalidate_status_cache()
+        try:
+            future.result()
+        except Exception as e:
+            self.add_log_line(f"❌ Failed to update CR: {e}")
+            return
+        self.add_log_line(f"✅ Custom Resource updated for uninstall")
+        
+        # Run uninstall playbook
+        if service_name in self._playbook_paths:
+            playbook_path = self._playbook_paths[service_name]
+            if playbook_path:
+                self.add_log_line(f"🎭 Running uninstall playbook...")
+                self._playbook_pool.submit(self._uninstall_playbook_worker, playbook_path)
+            else:
+                missing = KUBERNETES_DIR / self._PLAYBOOK_MAP[service_name]
+                self.add_log_line(f"❌ Uninstall playbook not found: {missing}")
+    
     def execute_cr_apply(self, service_type, service_name, cr_name, cr_data):
         """Execute CR application directly"""
-        self.add_log_line(f"📝 Applying {cr_name}...")
-        
+        self.execute_cr_apply_batch(service_type, service_name, [(cr_name, cr_data)])
+    
+    def execute_cr_apply_batch(self, service_type, service_name, entries):
+        """Apply one or more (cr_name, cr_data) entries in parallel on the worker pool"""
+        self._invalidate_status_cache()
+        self.add_log_line(f"📝 Applying {', '.join(cr_name for cr_name, _ in entries)}...")
+        self.add_log_line(f"📝 Applying Custom Resource to cluster...")
+        
+        results = []
+        results_lock = threading.Lock()
+        
+        def on_done(future):
+            # Runs on a worker thread: report through log_queue only
+            ok, message = future.result()
+            log_queue.put(message)
+            with results_lock:
+                results.append(ok)
+                finished = len(results) == len(entries)
+            if finished and len(entries) > 1:
+                log_queue.put(f"📊 Applied {sum(results)}/{len(entries)} CRs")
+        
+        for cr_name, cr_data in entries:
+            future = self._apply_pool.submit(self._apply_cr_worker, cr_name, cr_data)
+            future.add_done_callback(on_done)
+        self.menu_state = 'main'
+    
+    def _apply_manifest(self, cr_file_path):
+        """Server-side apply the CR in a manifest file; raises on failure"""
+        cr_obj = load_manifest(cr_file_path, os.stat(cr_file_path).st_mtime_ns)
+        self.apply_cr_object(cr_obj)
+    
+    def _apply_manifest_async(self, cr_file_path, on_done):
+        """Run _apply_manifest on the worker pool; on_done(error) runs on the UI thread, error None on success"""
+        future = self._apply_pool.submit(self._apply_manifest, cr_file_path)
+        future.add_done_callback(lambda f: self._call_in_ui(on_done, f.exception()))
+    
+    def _apply_cr_worker(self, cr_name, cr_data):
+        """Apply a single CR off the UI thread; returns (ok, log message)"""
         try:
-            # Apply the CR to Kubernetes
-            self.add_log_line(f"📝 Applying Custom Resource to cluster...")
-            try:
-                # Always use the original CR file if available
-                import os
-                cr_file_path = None
-                if 'file' in cr_data:
-                    filename = cr_data['file']
-                    cr_file_path = str(MANIFEST_DIR / filename)
-                else:
-                    possible_paths = [
-                        str(MANIFEST_DIR / f"{cr_name}-cr.yaml"),
-                        str(MANIFEST_DIR / f"{cr_name}.yaml")
-                    ]
-                    for path in possible_paths:
-                        if os.path.exists(path):
-                            cr_file_path = path
-                            break
-                if not cr_file_path or not os.path.exists(cr_file_path):
-                    self.add_log_line(f"❌ CR file not found for {cr_name}")
-                    return
-                # Apply the CR file directly
-                import subprocess
-                result = subprocess.run(['kubectl', 'apply', '-f', cr_file_path], capture_output=True, text=True)
-                if result.returncode == 0:
-                    self.add_log_line(f"✅ Custom Resource applied successfully from file: {cr_file_path}")
-                else:
-                    self.add_log_line(f"❌ Failed to apply CR: {result.stderr}")
-            except Exception as e:
-                self.add_log_line(f"❌ Application failed: {str(e)}")
-            self.menu_state = 'main'
+            # Always use the original CR file if available
+            cr_file_path = self.resolve_cr_file_path(cr_name, cr_data)
+            if not cr_file_path:
+                return False, f"❌ CR file not found for {cr_name}"
+            self._apply_manifest(cr_file_path)
+            return True, f"✅ Custom Resource applied successfully from file: {cr_file_path}"
         except Exception as e:
-            self.add_log_line(f"❌ Application failed: {str(e)}")
+            return False, f"❌ Failed to apply CR {cr_name}: {e}"
+    
+    def _uninstall_playbook_worker(self, playbook_path):
+        """Run an uninstall playbook off the UI thread, reporting through log_queue"""
+        try:
+            returncode = self._run_playbook([playbook_path])
+            if returncode == 0:
+                log_queue.put(f"✅ Uninstall completed successfully!")
+            elif returncode != KUBECTL_TIMED_OUT:
+                log_queue.put(f"⚠️ Playbook exited with code {returncode}")
+        except Exception as e:
+            log_queue.put(f"❌ Uninstall playbook failed: {e}")
+    
+    def _run_playbook(self, args, timeout=PLAYBOOK_TIMEOUT):
+        """Run ansible-playbook, streaming its output to log_queue; killed after timeout seconds"""
+        # Forward output line by line as the playbook produces it instead of
+        # buffering the whole transcript until it exits
+        with self._playbook_procs_lock:
+            # The TUI is exiting; don't start anything _stop_playbooks would miss
+            if self._stop_event.is_set():
+                return KUBECTL_TIMED_OUT
+            proc = subprocess.Popen(['ansible-playbook', *args], stdin=subprocess.DEVNULL,
+                                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                    text=True, bufsize=1)
+            self._playbook_procs.add(proc)
+        timed_out = threading.Event()
+        
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+        
+        killer = threading.Timer(timeout, kill_on_timeout)
+        killer.start()
+        try:
+            with proc.stdout:
+                for line in proc.stdout:
+                    line = line.rstrip()
+                    if line:
+                        log_queue.put(f"  {line}")
+            returncode = proc.wait()
+        finally:
+            killer.cancel()
+            with self._playbook_procs_lock:
+                self._playbook_procs.discard(proc)
+        if timed_out.is_set():
+            log_queue.put(f"⏰ ansible-playbook timed out after {timeout}s")
+            return KUBECTL_TIMED_OUT
+        return returncode
+    
+    def _stop_playbooks(self, grace=3):
+        """Terminate running playbooks (kill after grace seconds) so exit doesn't wait on them"""
+        with self._playbook_procs_lock:
+            procs = list(self._playbook_procs)
+        for proc in procs:
+            proc.terminate()
+        deadline = time.monotonic() + grace
+        for proc in procs:
+            try:
+                proc.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                proc.kill()
     
     def force_key_handler(self, key):
         """Forced key handler that logs everything and handles navigation"""
         
         # Debug: Log all keys when popup is open
-        if hasattr(self, 'popup') and self.popup is not None:
+        if _TUI_DEBUG_ENTER and self.popup is not None:
             self.add_log_line(f"🔑 FORCE_KEY_HANDLER: key='{key}' menu_state='{self.menu_state}'")
         
         # Check if we have a popup open (regardless of menu_state)
-        has_popup = hasattr(self, 'popup') and self.popup is not None
+        has_popup = self.popup is not None
         
         # Handle ESC for any popup
         if has_popup and key == 'escape':
@@ -2741,6 +3397,8 @@ class KubernetesCRDTUI:
             unhandled_input=self.force_key_handler,  # Use forced handler for robust ESC/popup handling
             handle_mouse=True
         )
+        self._ui_call_pipe_fd = self.loop.watch_pipe(self._on_wake)
+        log_queue.waker = self._wake_ui
         
         # Welcome messages
         self.add_log_line("=== Intent Based Services Management System Started ===")
@@ -2748,11 +3406,25 @@ class KubernetesCRDTUI:
         
         # Load initial status and start updates
         self.loop.set_alarm_in(0.2, lambda loop, user_data: self.initial_startup())
-        self.loop.set_alarm_in(0.5, lambda loop, user_data: self.update_logs())
+        self.loop.set_alarm_in(0.5, self.update_logs)
+        # Auto-refresh status every update_interval seconds (auto_refresh_status re-arms itself)
+        self.loop.set_alarm_in(self.update_interval, self.auto_refresh_status)
+        
+        if _TUI_KUBECTL_PROXY:
+            threading.Thread(target=self.start_kubectl_proxy, name='kubectl-proxy', daemon=True).start()
+        self.start_status_watchers()
         
         try:
             self.loop.run()
         except KeyboardInterrupt:
             pass
         finally:
+            log_queue.waker = None
+            self._stop_event.set()
+            # Workers still running are joined at interpreter exit, so a
+            # playbook left alive would hold the terminal until it finished
+            self._stop_playbooks()
+            self._apply_pool.shutdown(wait=False, cancel_futures=True)
+            self._playbook_pool.shutdown(wait=False, cancel_futures=True)
+            self.stop_kubectl_proxy()
             logger.info("Enhanced TUI interface shutting down")
@@ -3,23 +3,87 @@ Kubernetes client utilities
 """
 
 import logging
-from kubernetes import client, config
+import threading
+from kubernetes import client, config, dynamic
 from kubernetes.client.rest import ApiException
 
 logger = logging.getLogger(__name__)
 
+# Shared API clients, created on first use (after load_kube_config): one
+# ApiClient so every caller reuses the same urllib3 connection pool, and one
+# DynamicClient so API discovery is done once
+_api_client = None
+_custom_objects_api = None
+_dynamic_client = None
+_client_lock = threading.Lock()
+_config_loaded = False
+_default_namespace = 'default'  # Namespace of the loaded config's context
+
+_SERVICE_ACCOUNT_NAMESPACE = '/var/run/secrets/kubernetes.io/serviceaccount/namespace'
+
 def load_kube_config():
-    """Load Kubernetes configuration"""
-    try:
-        config.load_incluster_config()
-        logger.info("Loaded in-cluster Kubernetes config")
-    except config.ConfigException:
-        config.load_kube_config()
-        logger.info("Loaded local Kubernetes config")
+    """Load Kubernetes configuration (once; later calls are no-ops)"""
+    global _config_loaded, _default_namespace
+    # The shared ApiClient keeps the configuration it was built with, so
+    # re-reading kubeconfig and certificates would only cost disk I/O
+    with _client_lock:
+        if _config_loaded:
+            return
+        try:
+            config.load_incluster_config()
+            logger.info("Loaded in-cluster Kubernetes config")
+            try:
+                with open(_SERVICE_ACCOUNT_NAMESPACE) as f:
+                    _default_namespace = f.read().strip() or 'default'
+            except OSError:
+                pass
+        except config.ConfigException:
+            config.load_kube_config()
+            logger.info("Loaded local Kubernetes config")
+            try:
+                _, active_context = config.list_kube_config_contexts()
+                _default_namespace = active_context.get('context', {}).get('namespace') or 'default'
+            except (config.ConfigException, TypeError, AttributeError):
+                pass
+        _config_loaded = True
+
+def get_default_namespace():
+    """Namespace of the loaded config's current context ('default' if it names none)"""
+    return _default_namespace
+
+def _get_api_client():
+    """Return the shared ApiClient; caller holds _client_lock"""
+    global _api_client
+    if _api_client is None:
+        _api_client = client.ApiClient()
+    return _api_client
 
 def get_k8s_client():
-    """Get Kubernetes API client"""
-    return client.CustomObjectsApi()
+    """Get the shared Kubernetes custom objects API client (created on first use)"""
+    global _custom_objects_api
+    with _client_lock:
+        if _custom_objects_api is None:
+            _custom_objects_api = client.CustomObjectsApi(_get_api_client())
+    return _custom_objects_api
+
+def get_dynamic_client():
+    """Get the shared dynamic Kubernetes client (created on first use)"""
+    global _dynamic_client
+    # TUI worker threads may ask for the client concurrently
+    with _client_lock:
+        if _dynamic_client is None:
+            _dynamic_client = dynamic.DynamicClient(_get_api_client())
+    return _dynamic_client
+
+def get_dynamic_resource(api_version, kind):
+    """Resolve a resource through the shared dynamic client
+    
+    The client's discovery cache is not thread-safe and a miss triggers a
+    full rediscovery, so lookups from different threads are serialised.
+    """
+    dyn_client = get_dynamic_client()
+    with _client_lock:
+        return dyn_client.resources.get(api_version=api_version, kind=kind)
 
 def vm_exists(vm_name, kubevirt_namespace="kubevirt"):
     """Check if a VirtualMachine exists in KubeVirt"""
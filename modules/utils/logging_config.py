@@ -2,52 +2,121 @@
 Logging configuration module for the Intent Based Services Management System
 """
 
+import atexit
 import logging
+import logging.handlers
 import queue
+from collections import deque
+
+# Records kept for the TUI before the oldest are dropped (log storms)
+LOG_QUEUE_MAXLEN = 4096
+
+
+class LogBuffer:
+    """Bounded FIFO with the queue.Queue calls the TUI uses (put/get_nowait/qsize) plus get_many
+
+    Backed by a deque ring buffer: append/popleft are atomic under the GIL, so
+    producers take no lock, and when the TUI falls behind the oldest lines are
+    dropped instead of the buffer growing without bound. A put calls waker, if
+    set, unless a wake is already pending; the consumer calls clear_wake
+    before draining so later puts wake it again.
+    """
+    def __init__(self, maxlen):
+        self._items = deque(maxlen=maxlen)
+        # Called (from the producing thread) so a consumer can sleep instead
+        # of polling; see KubernetesCRDTUI.run
+        self.waker = None
+        self._wake_pending = False  # waker called, consumer has not drained yet
+
+    def put(self, item):
+        self._items.append(item)
+        # Checked after the append: an item added after the consumer's
+        # clear_wake sees the flag clear and wakes it again
+        if not self._wake_pending and self.waker is not None:
+            self._wake_pending = True
+            self.waker()
+
+    def clear_wake(self):
+        """Allow the next put to call waker; call before draining"""
+        self._wake_pending = False
+
+    def get_nowait(self):
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+
+    def get_many(self, limit):
+        """Remove and return up to limit items, oldest first, in one call"""
+        popleft = self._items.popleft
+        return [popleft() for _ in range(min(limit, len(self._items)))]
+
+    def qsize(self):
+        return len(self._items)
+
 
 # Global log queue for TUI
-log_queue = queue.Queue()
+log_queue = LogBuffer(LOG_QUEUE_MAXLEN)
+
+# Listener thread that runs the real handlers (see setup_logging)
+_listener = None
 
 class TUILogHandler(logging.Handler):
     """Custom log handler that sends logs to the TUI"""
     def emit(self, record):
         try:
-            msg = self.format(record)
-            # Clean up verbose prefixes for better TUI display
-            if ':' in msg:
-                # Remove logger name prefix (everything before the first colon)
-                msg = msg.split(':', 1)[1].strip()
-            log_queue.put(msg)
+            # The TUI formatter emits only the message, so no logger-name
+            # prefix has to be stripped per record
+            log_queue.put(self.format(record))
         except Exception:
             pass
 
-def setup_logging():
+def setup_logging(operator_only=None):
     """Set up the logging system for the application
     Only add console StreamHandler if running with --operator-only (operator mode).
     In TUI mode (default), only the TUI handler is active.
+    Callers only enqueue records; a QueueListener thread formats them and runs
+    the TUI/console handlers, so logging never blocks a worker or the operator.
+    operator_only defaults to checking sys.argv; calls after the first are no-ops.
     """
     import sys
+    global _listener
+    if _listener is not None:
+        return
+    if operator_only is None:
+        operator_only = '--operator-only' in sys.argv
     # Remove all existing handlers first
     for handler in logging.root.handlers[:]:
         logging.root.removeHandler(handler)
 
     # Set up our custom TUI handler
     tui_handler = TUILogHandler()
-    tui_handler.setFormatter(logging.Formatter('%(name)s: %(message)s'))
-
-    logging.root.setLevel(logging.INFO)
-    logging.root.addHandler(tui_handler)
+    tui_handler.setFormatter(logging.Formatter('%(message)s'))
+    handlers = [tui_handler]
 
     # Only add console handler if running as operator only
-    if '--operator-only' in sys.argv:
+    if operator_only:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
-        logging.root.addHandler(console_handler)
+        handlers.append(console_handler)
+
+    record_queue = queue.SimpleQueue()
+    logging.root.setLevel(logging.INFO)
+    logging.root.addHandler(logging.handlers.QueueHandler(record_queue))
+    _listener = logging.handlers.QueueListener(record_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     # Suppress overly verbose loggers
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
-    logging.getLogger('kubernetes').setLevel(logging.WARNING)
+    for name in ('urllib3', 'kubernetes'):
+        logging.getLogger(name).setLevel(logging.WARNING)
 
     # Get logger for this module
     logger = logging.getLogger(__name__)
     logger.info("Logging system initialized")
+
+
+@atexit.register
+def _stop_listener():
+    """Flush records still queued for the listener at interpreter exit"""
+    if _listener is not None:
+        _listener.stop()
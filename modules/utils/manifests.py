@@ -0,0 +1,59 @@
+"""
+Manifest folder helpers shared by the TUI and the service manager
+"""
+
+import os
+from functools import lru_cache
+
+import yaml
+
+# Prefer libyaml's C loader when PyYAML was built with it
+_YAML_SAFE_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+@lru_cache(maxsize=128)
+def load_manifest(path, mtime_ns):
+    """Parse a CR/CRD manifest; mtime_ns is part of the cache key so edits invalidate it.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_SAFE_LOADER)
+
+
+def scan_yaml_mtimes(folder):
+    """Return {file name: st_mtime_ns} for the .yaml files in folder, from one scandir pass"""
+    with os.scandir(folder) as entries:
+        return {entry.name: entry.stat().st_mtime_ns
+                for entry in entries if entry.name.endswith('.yaml') and entry.is_file()}
+
+
+@lru_cache(maxsize=4)
+def _list_file_entries(folder, mtime_ns):
+    """List (name, path) of regular files in folder; the folder's mtime_ns keys the cache, so adds/removes invalidate it"""
+    with os.scandir(folder) as entries:
+        return tuple((entry.name, entry.path) for entry in entries if entry.is_file())
+
+
+def cached_file_entries(folder):
+    """Return (name, path) of regular files in folder, re-listing only after the folder changes"""
+    return _list_file_entries(folder, os.stat(folder).st_mtime_ns)
+
+
+@lru_cache(maxsize=4)
+def _list_file_index(folder, mtime_ns):
+    """Map name -> path for the regular files in folder; cached on mtime_ns like _list_file_entries"""
+    return dict(_list_file_entries(folder, mtime_ns))
+
+
+def cached_file_index(folder):
+    """Return {name: path} of regular files in folder (empty if it is missing), re-listing only after it changes"""
+    try:
+        return _list_file_index(folder, os.stat(folder).st_mtime_ns)
+    except FileNotFoundError:
+        return {}
+
+
+def scan_file_names(folder):
+    """Return the names of regular files in folder (empty set if it is missing)"""
+    return set(cached_file_index(folder))
@@ -1,11 +1,28 @@
-import argparse
+import os
+import sys
+
+def parse_extra_vars(argv=None):
+    """Collect -e/--extra KEY=VALUE pairs from argv (default sys.argv[1:])
 
-def parse_extra_vars():
-    parser = argparse.ArgumentParser()
-    parser.add_argument('-e', '--extra', action='append', default=[], help='Extra KEY=VALUE pairs')
-    args, unknown = parser.parse_known_args()
+    A single scan instead of argparse, which is slow to import and build, and
+    whose parse_known_args would also act on -h/--help at import time.
+    Accepts '-e K=V', '-eK=V', '-e=K=V', '--extra K=V' and '--extra=K=V'.
+    """
     extra_vars = {}
-    for item in args.extra:
+    args = iter(sys.argv[1:] if argv is None else argv)
+    for arg in args:
+        if arg == '--':
+            break
+        if arg in ('-e', '--extra'):
+            item = next(args, '')
+        elif arg.startswith('--extra='):
+            item = arg[len('--extra='):]
+        elif arg.startswith('-e') and not arg.startswith('--'):
+            item = arg[2:]
+            if item.startswith('='):
+                item = item[1:]
+        else:
+            continue
         if '=' in item:
             k, v = item.split('=', 1)
             extra_vars[k] = v
@@ -13,15 +30,20 @@ def parse_extra_vars():
 
 EXTRA_VARS = parse_extra_vars()
 
-import os
+# Environment snapshot taken at import: os.environ encodes/decodes the key on
+# every lookup, and nothing in the operator changes its environment later.
+# The snapshot is frozen: variables set after import are not seen by get_var
+_ENV = dict(os.environ)
+
 def get_var(name, spec, default=None):
-    env_val = os.environ.get(name)
-    if env_val is None or env_val == "":
-        env_val = os.environ.get(name.upper())
-    if env_val is not None and env_val != "":
+    # Precedence: env (as given, then upper-cased), -e extra vars, CR spec.
+    # Env and extra vars are strings, so truthiness means set and non-empty;
+    # spec values can legitimately be 0/False and are only skipped when None/"".
+    env_val = _ENV.get(name) or _ENV.get(name.upper())
+    if env_val:
         return env_val
     extra_val = EXTRA_VARS.get(name)
-    if extra_val is not None and extra_val != "":
+    if extra_val:
         return extra_val
     spec_val = spec.get(name)
     if spec_val is not None and spec_val != "":
@@ -0,0 +1,47 @@
+"""
+Tests for the lazily built popup row walker
+"""
+
+import os
+import sys
+
+import urwid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from modules.tui_interface import _LazyListWalker
+
+
+def _popup_listbox(count):
+    walker = _LazyListWalker(list(range(count)), lambda option: urwid.Button(f"row {option}"))
+    return walker, urwid.ListBox(walker)
+
+
+def test_home_and_end_move_focus():
+    walker, listbox = _popup_listbox(20)
+    size = (40, 5)
+    listbox.render(size, focus=True)
+
+    assert listbox.keypress(size, 'end') is None
+    assert listbox.focus_position == 19
+    listbox.render(size, focus=True)
+
+    assert listbox.keypress(size, 'home') is None
+    assert listbox.focus_position == 0
+
+
+def test_positions():
+    walker, _ = _popup_listbox(3)
+    assert list(walker.positions()) == [0, 1, 2]
+    assert list(walker.positions(reverse=True)) == [2, 1, 0]
+
+
+def test_rows_far_from_focus_are_evicted():
+    window = _LazyListWalker._WINDOW
+    walker, _ = _popup_listbox(4 * window)
+    for position in range(len(walker)):
+        walker[position]
+    walker.set_focus(len(walker) - 1)
+    assert min(walker._widgets) >= len(walker) - 1 - window
+    # Evicted rows are rebuilt on demand
+    assert walker[0] is not None